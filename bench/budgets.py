@@ -0,0 +1,188 @@
+# 작업별 Modrinth 요청 수 예산 확인
+# 예) python bench/budgets.py             # 모드 100개로 모든 시나리오 확인 (예산 초과 시 종료 코드 1)
+#     python bench/budgets.py --mods 300 --json
+# 앱/CLI와 같은 작업 그래프(core.mod_jobs)를 가짜 Modrinth 서버에 대고 실행하여 요청을 종류별로 셉니다.
+# 모드마다 요청을 다시 보내는 코드(N+1)가 끼어들면 해당 시나리오가 예산 초과로 실패합니다.
+import argparse
+import contextlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.sandbox import use_temp_home, write_config
+
+# core의 데이터 폴더 경로는 모듈을 가져올 때 정해지므로 core보다 먼저 바꿔 둠
+_HOME = use_temp_home(prefix="mmm-budget-")
+
+from bench.fake_modrinth import FakeModrinth, point_core_at
+from bench.synthetic import LOADERS, MC_VERSION, catalog, make_mods_folder
+from core.mod_jobs import scan_jobs, batch_check_job, check_job, check_key, update_jobs, prewarm_jobs
+from core.mod_scanner import list_mod_files
+from core.modrinth_api import clear_version_index
+from core.scheduler import JobScheduler, wait_all, DONE
+
+GROUP = "budget"
+# 한 번에 업데이트할 모드 수
+UPDATE_COUNT = 10
+
+
+class Scenario:
+    """
+    요청 예산이 있는 작업 하나.
+    budget은 {요청 종류: 최대 횟수}이며 "total"은 전체 합계입니다. 적혀 있지 않은 종류는 0회여야 합니다.
+    """
+
+    def __init__(self, name: str, run, budget: dict):
+        self.name = name
+        self.run = run
+        self.budget = budget
+
+    def over_budget(self, counts: dict) -> list:
+        """예산을 넘은 항목 [(종류, 횟수, 예산)]"""
+        limits = dict(self.budget)
+        total_limit = limits.pop("total", None)
+        over = [(kind, n, limits.get(kind, 0)) for kind, n in sorted(counts.items()) if n > limits.get(kind, 0)]
+        total = sum(counts.values())
+        if total_limit is not None and total > total_limit:
+            over.append(("total", total, total_limit))
+        return over
+
+
+class Session:
+    """시나리오 사이에 이어지는 상태 (스케줄러, 모드 폴더, 마지막 스캔/확인 결과)"""
+
+    def __init__(self, scheduler: JobScheduler, mods_dir: Path):
+        self.scheduler = scheduler
+        self.mods_dir = mods_dir
+        self.mods = []
+        self.checked = []
+
+    def _run(self, jobs: list, last):
+        self.scheduler.submit_all([*jobs, last])
+        wait_all([last])
+        if last.state != DONE:
+            raise RuntimeError(f"작업 실패 ({last.name}): {last.error}")
+        return last.result
+
+    def scan(self):
+        jobs, done = scan_jobs(self.mods_dir, list_mod_files(self.mods_dir), GROUP)
+        self.mods = self._run(jobs, done)
+
+    def prewarm(self):
+        jobs, done, _ = prewarm_jobs(self.mods_dir, list_mod_files(self.mods_dir), GROUP)
+        self.mods = self._run(jobs, done)
+        wait_all(jobs)
+
+    def check(self, known: dict = None):
+        batch = batch_check_job(self.mods, MC_VERSION, self.mods_dir, GROUP, known=known)
+        jobs = [check_job(mod, MC_VERSION, GROUP, known=known, batch=batch) for mod in self.mods]
+        self.scheduler.submit_all([batch, *jobs])
+        wait_all(jobs)
+        self.checked = [job.result for job in jobs if job.state == DONE]
+
+    def recheck(self):
+        self.check(known={check_key(mod, MC_VERSION): mod for mod in self.checked})
+
+    def update(self, count: int):
+        targets = [mod for mod in self.checked if mod["status"] == "업데이트 가능"][:count]
+        jobs, swap = update_jobs(targets, self.mods_dir, GROUP)
+        outcome = self._run(jobs, swap)
+        if outcome["failures"]:
+            raise RuntimeError(f"업데이트 실패: {outcome['failures']}")
+
+
+def restart():
+    """앱을 다시 실행한 상태: 디스크 캐시는 남고 메모리의 버전 목록 색인은 비어 있음"""
+    clear_version_index()
+
+
+def scenarios(session: Session, n: int) -> list:
+    # 락파일은 처음 보는 해시를 한 번에 조회 (version_files 1회)
+    batches = 1
+    # 업데이트 확인은 로더 조합마다 한 번에 조회 (version_files/update)
+    loader_sets = min(n, len(LOADERS))
+    return [
+        Scenario("차가운 스캔", session.scan,
+                 # 파일마다 검색 1회 + 전체 버전 목록 1회 (이 목록이 버전 목록 색인을 채움)
+                 {"search": n, "project_versions": n, "version_files": batches, "total": 2 * n + batches}),
+        Scenario("스캔 직후 확인", session.check, {"total": 0}),
+        Scenario("다시 확인 (결과 재사용)", session.recheck, {"total": 0}),
+        Scenario("재시작 후 따뜻한 스캔", lambda: (restart(), session.scan()), {"total": 1}),
+        # 색인이 없으면 락파일 해시로 로더 조합마다 한 번에 조회 (모드 수와 무관)
+        Scenario("재시작 후 확인 (색인 없음)", session.check,
+                 {"version_files_update": loader_sets, "total": loader_sets}),
+        # GUI가 버전 선택 중에 하는 준비 작업: 프로젝트마다 전체 버전 목록 1회, 이후 확인은 요청 없음
+        Scenario("재시작 후 준비 작업", lambda: (restart(), session.prewarm()), {"project_versions": n, "total": n}),
+        Scenario("준비 작업 후 확인", session.check, {"total": 0}),
+        Scenario(f"업데이트 {UPDATE_COUNT}개", lambda: session.update(UPDATE_COUNT),
+                 # 새 파일만 받고, 바뀐 파일은 락파일이 한 번에 조회
+                 {"download": UPDATE_COUNT, "version_files": batches, "total": UPDATE_COUNT + batches}),
+        # 바뀐 파일만 다시 식별 (나머지는 캐시)
+        Scenario("업데이트 후 스캔", session.scan,
+                 {"search": UPDATE_COUNT, "project_versions": UPDATE_COUNT, "version_files": batches,
+                  "total": 2 * UPDATE_COUNT + batches}),
+    ]
+
+
+def run_budgets(n: int, latency_ms: float) -> list:
+    projects = catalog(n, download_size=4 * 1024)
+    mods_dir = _HOME / "mods"
+    make_mods_folder(mods_dir, projects, jar_size=4 * 1024, entries=4)
+
+    results = []
+    scheduler = JobScheduler()
+    try:
+        with FakeModrinth(projects, latency_ms) as server:
+            point_core_at(server)
+            session = Session(scheduler, mods_dir)
+            for scenario in scenarios(session, n):
+                server.reset_log()
+                scenario.run()
+                counts = server.counts()
+                results.append({
+                    "name": scenario.name,
+                    "requests": counts,
+                    "budget": scenario.budget,
+                    "over": scenario.over_budget(counts),
+                })
+    finally:
+        scheduler.shutdown(wait=False)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="작업별 Modrinth 요청 수 예산 확인 (가짜 Modrinth 서버 사용)")
+    parser.add_argument("--mods", type=int, default=100, help="모드 수")
+    parser.add_argument("--latency-ms", type=float, default=0, help="가짜 서버 응답 지연")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    write_config()
+    # core의 진행 로그(print)는 stderr로 (stdout에는 결과만)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_budgets(args.mods, args.latency_ms)
+    finally:
+        shutil.rmtree(_HOME, ignore_errors=True)
+
+    failed = [r for r in results if r["over"]]
+    if args.json:
+        json.dump({"mods": args.mods, "results": results}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for r in results:
+            total = sum(r["requests"].values())
+            mark = "FAIL" if r["over"] else "ok"
+            print(f"{mark:<4} {r['name']:<24} 요청 {total:>5}  {r['requests']}")
+            for kind, count, limit in r["over"]:
+                print(f"       {kind}: {count}회 > 예산 {limit}회")
+        print(f"\n{len(results) - len(failed)}/{len(results)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
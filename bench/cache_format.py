@@ -0,0 +1,114 @@
+# 캐시 파일 형식 비교: 예전 JSON(indent=4) vs core.binary_cache
+# 예) python bench/cache_format.py                    # 항목 2000개
+#     python bench/cache_format.py --entries 20000 --versions 400 --json
+# 스캔이 하는 일과 같게 "읽기 -> 일부 항목 꺼내기 -> 몇 개 추가 -> 저장"의 시간을 잽니다.
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import binary_cache
+
+REPEAT = 5
+
+
+def make_cache(entries: int, versions: int, seed: int) -> dict:
+    """mod_info 캐시와 같은 모양의 항목 (프로젝트마다 전체 MC 버전 목록을 담음)"""
+    rng = random.Random(seed)
+    game_versions = [f"1.{minor}.{patch}" for minor in range(0, 22) for patch in range(0, 6)]
+    game_versions += [f"{year}w{week:02d}a" for year in range(13, 25) for week in range(1, 53)]
+    cache = {}
+    for i in range(entries):
+        cache[f"Mod {i}-mod{i}-mod-{i}-1.0.{i}"] = {
+            "project_id": f"p{i:07d}",
+            "mod_name": f"Mod {i}",
+            "loaders": rng.sample(["fabric", "forge", "neoforge", "quilt"], 2),
+            "all_mc_versions": sorted(rng.sample(game_versions, min(versions, len(game_versions)))),
+            "_timestamp": time.time(),
+        }
+    return cache
+
+
+def _time(func) -> float:
+    """REPEAT번 중 가장 빠른 시간 (ms)"""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1000, 2)
+
+
+def _json_save(cache: dict, path: Path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=4)
+
+
+def _json_load(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _scan_like(load, save, keys: list, path: Path):
+    cache = load(path)
+    for key in keys:
+        cache.get(key)
+    cache["new-entry"] = {"project_id": None, "mod_name": "new", "loaders": [], "all_mc_versions": [],
+                          "_timestamp": 0}
+    save(cache, path)
+
+
+def run(entries: int, versions: int, touched: float, seed: int) -> dict:
+    cache = make_cache(entries, versions, seed)
+    keys = random.Random(seed).sample(list(cache), int(entries * touched))
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="mmm-cache-") as tmp:
+        formats = {
+            "json": (Path(tmp) / "cache.json", _json_load, _json_save),
+            "binary": (Path(tmp) / "cache.bin", binary_cache.load, binary_cache.dump),
+        }
+        for name, (path, load, save) in formats.items():
+            save(cache, path)
+            results[name] = {
+                "bytes": path.stat().st_size,
+                "save_ms": _time(lambda: save(cache, path)),
+                "load_ms": _time(lambda: load(path)),
+                # 읽은 뒤 한 항목 꺼내기까지 (스캔이 첫 파일을 분석할 수 있게 되는 시점)
+                "first_entry_ms": _time(lambda: load(path)[keys[0] if keys else next(iter(cache))]),
+                "scan_like_ms": _time(lambda: _scan_like(load, save, keys, path)),
+            }
+    return {"entries": entries, "versions": versions, "touched": touched, "results": results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="캐시 파일 형식(JSON vs 이진) 읽기/쓰기 시간 비교")
+    parser.add_argument("--entries", type=int, default=2000, help="캐시 항목 수")
+    parser.add_argument("--versions", type=int, default=300, help="항목마다 담을 MC 버전 수")
+    parser.add_argument("--touched", type=float, default=0.1, help="스캔에서 꺼내는 항목 비율")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = run(args.entries, args.versions, args.touched, args.seed)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return 0
+
+    print(f"항목 {report['entries']}개, 항목당 버전 {report['versions']}개, 꺼내는 비율 {report['touched']:.0%}")
+    print(f"{'형식':<8}{'크기':>12}{'저장':>10}{'읽기':>10}{'첫 항목':>10}{'스캔':>10}  (ms, {REPEAT}회 중 최소)")
+    for name, r in report["results"].items():
+        print(f"{name:<8}{r['bytes'] / 1024:>10.0f}KB{r['save_ms']:>10}{r['load_ms']:>10}"
+              f"{r['first_entry_ms']:>10}{r['scan_like_ms']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
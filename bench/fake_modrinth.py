@@ -0,0 +1,233 @@
+# 로컬 가짜 Modrinth API + CDN (벤치마크/요청 수 확인용)
+# 실제 API와 같은 경로를 지원하며 응답 지연과 초당 요청 제한(429)을 흉내 내고 모든 요청을 기록합니다.
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from bench.synthetic import download_content
+
+
+class FakeModrinth:
+    """
+    with FakeModrinth(projects, latency_ms=20) as server:
+        point_core_at(server)  # core가 server.api_url을 쓰도록
+        ...
+        server.counts()  # {"search": 100, "project_versions": 100, ...}
+    """
+
+    def __init__(self, projects: list, latency_ms: float = 0, rate_limit_rps: float = 0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.projects = {p["project_id"]: p for p in projects}
+        self.latency = latency_ms / 1000
+        self.rate_limit_rps = rate_limit_rps
+        self._by_title = {p["title"].casefold(): p for p in projects}
+        self._by_sha1 = {}
+        self._by_version_id = {}
+        self._by_filename = {}
+        for project in projects:
+            for version in project["versions"]:
+                self._by_version_id[version["id"]] = version
+                for f in version["files"]:
+                    self._by_sha1[f["hashes"]["sha1"]] = version
+                    self._by_filename[f["filename"]] = (project, version["version_number"], f["size"])
+        self._lock = threading.Lock()
+        self._log = []
+        self._tokens = rate_limit_rps
+        self._last_refill = time.monotonic()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        # 주소 없이 만든 다운로드 URL은 이 서버의 CDN 경로로
+        for version in self._by_version_id.values():
+            for f in version["files"]:
+                if f["url"].startswith("/"):
+                    f["url"] = self.base_url + f["url"]
+
+    # --- 주소 ---
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/v2"
+
+    # --- 실행 ---
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-modrinth", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- 기록 ---
+    def requests(self) -> list:
+        """[(종류, 경로)] 받은 순서대로"""
+        with self._lock:
+            return list(self._log)
+
+    def counts(self) -> dict:
+        with self._lock:
+            return dict(Counter(kind for kind, _ in self._log))
+
+    def reset_log(self):
+        with self._lock:
+            self._log.clear()
+
+    def _record(self, kind: str, path: str):
+        with self._lock:
+            self._log.append((kind, path))
+
+    def _allow(self) -> bool:
+        """전체 요청에 대한 토큰 버킷. 초과하면 429."""
+        if not self.rate_limit_rps:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit_rps, self._tokens + (now - self._last_refill) * self.rate_limit_rps)
+            self._last_refill = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    # --- 응답 ---
+    def search(self, query: str, limit: int) -> dict:
+        query = query.casefold()
+        exact = self._by_title.get(query)
+        hits = [exact] if exact else []
+        for project in self.projects.values():
+            if len(hits) >= limit:
+                break
+            if project is not exact and query in project["title"].casefold():
+                hits.append(project)
+        return {"hits": [{"project_id": p["project_id"], "slug": p["slug"], "title": p["title"]} for p in hits]}
+
+    def project_versions(self, project_id: str, params: dict) -> list | None:
+        project = self.projects.get(project_id)
+        if project is None:
+            return None
+        loaders = json.loads(params["loaders"][0]) if "loaders" in params else None
+        game_versions = json.loads(params["game_versions"][0]) if "game_versions" in params else None
+        featured = params.get("featured", [None])[0]
+        result = []
+        for version in project["versions"]:
+            if loaders and not set(loaders) & set(version["loaders"]):
+                continue
+            if game_versions and not set(game_versions) & set(version["game_versions"]):
+                continue
+            if featured is not None and version["featured"] != (featured == "true"):
+                continue
+            result.append(version)
+        return result
+
+    def latest_versions(self, hashes: list, loaders: list, game_versions: list) -> dict:
+        """POST /version_files/update: 해시마다 그 프로젝트의 조건에 맞는 최신 버전."""
+        result = {}
+        for sha1 in hashes:
+            version = self._by_sha1.get(sha1)
+            if version is None:
+                continue
+            for candidate in self.projects[version["project_id"]]["versions"]:
+                if loaders and not set(loaders) & set(candidate["loaders"]):
+                    continue
+                if game_versions and not set(game_versions) & set(candidate["game_versions"]):
+                    continue
+                result[sha1] = candidate
+                break
+        return result
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (requests 세션이 연결을 재사용)
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str = "application/json", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, obj, status: int = 200):
+                self._send(status, json.dumps(obj).encode())
+
+            def _begin(self, kind: str) -> bool:
+                fake._record(kind, self.path)
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if not fake._allow():
+                    self._send(429, b"{}", headers={"Retry-After": "1"})
+                    return False
+                return True
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                parts = url.path.strip("/").split("/")
+                if url.path == "/v2/search":
+                    if self._begin("search"):
+                        self._json(fake.search(params.get("query", [""])[0], int(params.get("limit", ["10"])[0])))
+                elif len(parts) == 4 and parts[:2] == ["v2", "project"] and parts[3] == "version":
+                    kind = "project_versions_filtered" if "game_versions" in params else "project_versions"
+                    if self._begin(kind):
+                        versions = fake.project_versions(parts[2], params)
+                        if versions is None:
+                            self._json({"error": "not_found"}, 404)
+                        else:
+                            self._json(versions)
+                elif url.path == "/v2/versions":
+                    if self._begin("versions"):
+                        ids = json.loads(params.get("ids", ["[]"])[0])
+                        self._json([fake._by_version_id[i] for i in ids if i in fake._by_version_id])
+                elif parts[0] == "cdn" and len(parts) == 2 and parts[1] in fake._by_filename:
+                    if self._begin("download"):
+                        project, version, size = fake._by_filename[parts[1]]
+                        self._send(200, download_content(project, version, size), "application/java-archive")
+                else:
+                    fake._record("unknown", self.path)
+                    self._json({"error": "not_found"}, 404)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)) or 0)
+                if url.path == "/v2/version_files":
+                    if self._begin("version_files"):
+                        hashes = json.loads(body or b"{}").get("hashes", [])
+                        self._json({h: fake._by_sha1[h] for h in hashes if h in fake._by_sha1})
+                elif url.path == "/v2/version_files/update":
+                    if self._begin("version_files_update"):
+                        data = json.loads(body or b"{}")
+                        self._json(fake.latest_versions(data.get("hashes", []), data.get("loaders", []),
+                                                        data.get("game_versions", [])))
+                else:
+                    fake._record("unknown", self.path)
+                    self._json({"error": "not_found"}, 404)
+
+        return Handler
+
+
+def point_core_at(server: FakeModrinth):
+    """core가 실제 Modrinth 대신 server로 요청하도록 API 주소를 바꿉니다."""
+    import core.mc_version
+    import core.modrinth_api
+    core.mc_version.MODRINTH = server.api_url
+    core.modrinth_api.MODRINTH_API_URL = server.api_url
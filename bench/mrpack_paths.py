@@ -0,0 +1,109 @@
+# .mrpack 가져오기가 팩 안의 경로로 인스턴스 폴더 밖에 쓰지 않는지 확인
+# 예) python bench/mrpack_paths.py
+# Windows 구분자("\")와 드라이브 문자가 든 경로, 폴더 밖을 가리키는 링크를 담은 팩을 임시 폴더에 가져와 보고
+# 하나라도 통과하거나 밖에 파일이 생기면 종료 코드 1로 끝납니다.
+import json
+import shutil
+import sys
+import zipfile
+from pathlib import Path, PureWindowsPath
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.sandbox import use_temp_home, write_config
+
+_HOME = use_temp_home()
+write_config()
+
+from core.mrpack import INDEX_NAME, _safe_target, import_mrpack
+
+# 팩의 files[].path 또는 overrides/ 아래 이름으로 올 수 있는 위험한 경로
+UNSAFE_PATHS = [
+    "mods\\..\\..\\evil.dll",
+    "mods/..\\..\\evil.dll",
+    "..\\evil.dll",
+    "C:\\Windows\\evil.dll",
+    "C:evil.dll",
+    "D:/evil.dll",
+    "mods/D:evil.jar",
+    "/etc/evil",
+    "../evil.dll",
+    "mods/../../evil.dll",
+    "",
+]
+SAFE_PATHS = ["mods/a.jar", "config/sub/b.toml", "resourcepacks/c d.zip"]
+
+
+def check_safe_target(base_dir: Path) -> list:
+    errors = []
+    for path in UNSAFE_PATHS:
+        if _safe_target(base_dir, path) is not None:
+            # Windows에서 실제로 가리키게 될 위치를 함께 보여 줌
+            windows = PureWindowsPath("C:/Users/a/.minecraft").joinpath(path)
+            errors.append(f"거부해야 함: {path!r} (Windows에서는 {windows})")
+    for path in SAFE_PATHS:
+        target = _safe_target(base_dir, path)
+        if target is None or not target.is_relative_to(base_dir):
+            errors.append(f"허용해야 함: {path!r} -> {target}")
+    return errors
+
+
+def _write_pack(pack_path: Path, entries: list, overrides: dict):
+    index = {"formatVersion": 1, "game": "minecraft", "versionId": "1", "name": "paths",
+             "dependencies": {"minecraft": "1.20.1"}, "files": entries}
+    with zipfile.ZipFile(pack_path, "w") as zf:
+        zf.writestr(INDEX_NAME, json.dumps(index))
+        for name, data in overrides.items():
+            zf.writestr(name, data)
+
+
+def check_import(work: Path) -> list:
+    """위험한 경로를 담은 팩을 가져온 뒤 인스턴스 폴더 밖에 생긴 파일이 없는지 확인"""
+    outside = work / "outside"
+    instance = work / "root" / "instance"
+    mods_dir = instance / "mods"
+    mods_dir.mkdir(parents=True)
+    outside.mkdir()
+    try:
+        (instance / "escape").symlink_to(outside, target_is_directory=True)
+    except OSError:
+        pass  # 링크를 만들 수 없는 환경 (Windows 일반 권한)
+
+    entries = [{"path": path, "hashes": {"sha1": "0" * 40}, "downloads": ["http://127.0.0.1:9/never"],
+                "fileSize": 1} for path in UNSAFE_PATHS]
+    overrides = {f"overrides/{path}": b"evil" for path in UNSAFE_PATHS if path}
+    overrides["overrides/escape/evil.dll"] = b"evil"
+    overrides["overrides/config/ok.txt"] = b"ok"
+    pack = work / "paths.mrpack"
+    _write_pack(pack, entries, overrides)
+
+    before = {p for p in work.rglob("*")}
+    result = import_mrpack(pack, mods_dir)
+    created = {p for p in work.rglob("*") if p not in before}
+
+    errors = []
+    for path in sorted(created):
+        if not path.resolve().is_relative_to(instance.resolve()):
+            errors.append(f"인스턴스 폴더 밖에 생김: {path}")
+    if len(result["failed"]) != len(UNSAFE_PATHS):
+        errors.append(f"files[] 거부 {len(result['failed'])}개 ({len(UNSAFE_PATHS)}개여야 함): {result['failed']}")
+    if result["overrides"] != 1 or not (instance / "config" / "ok.txt").exists():
+        errors.append(f"정상 overrides를 풀지 못함: {result['overrides']}개")
+    return errors
+
+
+def main() -> int:
+    work = _HOME / "mrpack-paths"
+    try:
+        errors = check_safe_target(work / "instance") + check_import(work)
+    finally:
+        shutil.rmtree(_HOME, ignore_errors=True)
+    for error in errors:
+        print(f"FAIL {error}")
+    print("경로 검사: " + ("통과" if not errors else f"{len(errors)}건 실패"))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# 스캔/식별/업데이트 확인/다운로드 벤치마크
+# 예) python bench/run.py                           # 모드 10/100/1000개, 차가운/따뜻한 캐시
+#     python bench/run.py --sizes 100 --latency-ms 50 --rate-limit 300
+#     python bench/run.py --compare bench/results/bench-20260101-120000.json
+# 가짜 모드 폴더와 로컬 가짜 Modrinth 서버(bench/fake_modrinth.py)를 쓰므로 실제 API에 요청하지 않으며,
+# 측정용 HOME을 임시 폴더로 바꾸므로 실제 설정/캐시에도 영향이 없습니다.
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.sandbox import use_temp_home, write_config
+
+# core의 데이터 폴더 경로는 모듈을 가져올 때 정해지므로 core보다 먼저 바꿔 둠
+_HOME = use_temp_home()
+
+from bench.fake_modrinth import FakeModrinth, point_core_at
+from bench.synthetic import MC_VERSION, catalog, make_mods_folder
+from core.app_path import get_app_data_dir
+from core.mc_version import MODRINTH
+from core.mod_info_cache import load_jar_metadata_cache, load_mod_info_cache
+from core.mod_scanner import identify_mod, list_mod_files, scan_mods
+from core.modrinth_api import MODRINTH_API_URL, check_mod_for_update, clear_version_index, fetch_version_index
+from core.staging import stage_download
+from core.update_mod import DOWNLOAD_WORKERS
+
+PHASES = ("identify", "scan", "check", "download")
+# 업데이트 확인 동시 실행 수 (core.scheduler의 api 자원 한도와 같게)
+CHECK_WORKERS = 6
+
+
+def _reset_app_data():
+    """캐시/락파일/스테이징과 메모리의 버전 목록 색인을 지워 차가운 상태로 만듭니다."""
+    app_dir = get_app_data_dir()
+    for name in ("cache", "lockfiles", "staging"):
+        shutil.rmtree(app_dir / name, ignore_errors=True)
+    clear_version_index()
+
+
+def _measure(server: FakeModrinth, func) -> tuple:
+    server.reset_log()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    counts = server.counts()
+    return result, {"seconds": round(seconds, 4), "requests": sum(counts.values()), "by_kind": counts}
+
+
+# --- 단계 ---
+def _identify(mods_dir: Path, warm: bool) -> list:
+    """파일마다 식별만 (캐시 저장/락파일 기록 없이). 차가울 때는 빈 캐시로 시작합니다."""
+    jar_cache = load_jar_metadata_cache() if warm else {}
+    info_cache = load_mod_info_cache() if warm else {}
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(
+            lambda f: identify_mod(f, mods_dir, jar_cache, info_cache), list_mod_files(mods_dir)))
+
+
+def _check(mods: list) -> dict:
+    def check(mod):
+        mod = dict(mod)
+        mod["status"] = check_mod_for_update(mod, MC_VERSION)
+        return mod
+
+    with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as executor:
+        checked = list(executor.map(check, mods))
+    statuses = {}
+    for mod in checked:
+        statuses[mod["status"]] = statuses.get(mod["status"], 0) + 1
+    return {"mods": checked, "statuses": statuses}
+
+
+def _download(mods: list) -> int:
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        return sum(1 for path in executor.map(stage_download, mods) if path)
+
+
+def _run_phases(server: FakeModrinth, mods_dir: Path, downloads: int, warm: bool) -> dict:
+    results = {}
+    if not warm:
+        _reset_app_data()
+    _, results["identify"] = _measure(server, lambda: _identify(mods_dir, warm))
+
+    # 식별 단계가 채운 버전 목록 색인이 스캔/확인 측정에 섞이지 않도록
+    if not warm:
+        clear_version_index()
+    mods, results["scan"] = _measure(server, lambda: scan_mods(str(mods_dir)))
+    results["scan"]["mods"] = len(mods)
+
+    if warm:
+        # 따뜻한 확인: 버전 목록 색인이 이미 있는 상태 (버전 선택 중 미리 받기와 같음, 측정 제외)
+        for mod in mods:
+            if mod.get("project_id"):
+                fetch_version_index(mod["project_id"])
+    else:
+        clear_version_index()
+    checked, results["check"] = _measure(server, lambda: _check(mods))
+    results["check"]["statuses"] = checked["statuses"]
+
+    targets = [mod for mod in checked["mods"] if mod["status"] == "업데이트 가능"][:downloads]
+    staged, results["download"] = _measure(server, lambda: _download(targets))
+    results["download"]["files"] = staged
+    return results
+
+
+def bench_size(count: int, args, work_dir: Path) -> dict:
+    projects = catalog(count, args.download_size)
+    mods_dir = work_dir / f"mods-{count}"
+    start = time.perf_counter()
+    make_mods_folder(mods_dir, projects, args.jar_size, args.entries, args.seed)
+    print(f"[{count}] 모드 폴더 생성 {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    with FakeModrinth(projects, args.latency_ms, args.rate_limit) as server:
+        point_core_at(server)
+        try:
+            cold = _run_phases(server, mods_dir, args.downloads, warm=False)
+            warm = _run_phases(server, mods_dir, args.downloads, warm=True)
+        finally:
+            _point_core_back()
+    shutil.rmtree(mods_dir, ignore_errors=True)
+    return {"mods": count, "cold": cold, "warm": warm}
+
+
+def _point_core_back():
+    import core.mc_version
+    import core.modrinth_api
+    core.mc_version.MODRINTH = MODRINTH
+    core.modrinth_api.MODRINTH_API_URL = MODRINTH_API_URL
+
+
+# --- 출력 ---
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _print_table(report: dict, baseline: dict | None):
+    old = {(r["mods"], cache): r[cache] for r in (baseline or {}).get("results", []) for cache in ("cold", "warm")}
+    print(f"{'mods':>6} {'cache':<5} {'phase':<9} {'seconds':>9} {'requests':>9}" + ("  vs baseline" if baseline else ""))
+    for result in report["results"]:
+        for cache in ("cold", "warm"):
+            for phase in PHASES:
+                row = result[cache][phase]
+                line = f"{result['mods']:>6} {cache:<5} {phase:<9} {row['seconds']:>9.3f} {row['requests']:>9}"
+                before = old.get((result["mods"], cache), {}).get(phase)
+                if before:
+                    ratio = row["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+                    line += f"  x{ratio:.2f} ({before['seconds']:.3f}s, {before['requests']} req)"
+                print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="스캔/확인/다운로드 벤치마크 (가짜 Modrinth 서버 사용)")
+    parser.add_argument("--sizes", default="10,100,1000", help="모드 수 목록 (쉼표로 구분)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="가짜 서버 응답 지연")
+    parser.add_argument("--rate-limit", type=float, default=0, help="가짜 서버 초당 요청 제한 (0이면 없음)")
+    parser.add_argument("--jar-size", type=int, default=32 * 1024, help="설치된 jar 크기 (바이트)")
+    parser.add_argument("--entries", type=int, default=20, help="jar 안의 클래스 파일 수")
+    parser.add_argument("--download-size", type=int, default=64 * 1024, help="CDN 파일 크기 (바이트)")
+    parser.add_argument("--downloads", type=int, default=20, help="내려받을 모드 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--product-limits", action="store_true", help="앱 기본 네트워크 제한을 그대로 사용")
+    parser.add_argument("--out", default=str(ROOT / "bench" / "results"), help="결과 JSON을 저장할 폴더")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    write_config(args.product_limits)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+
+    try:
+        results = [bench_size(count, args, _HOME) for count in sizes]
+    finally:
+        shutil.rmtree(_HOME, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+        },
+        "results": results,
+    }
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    _print_table(report, baseline)
+    print(f"\n결과: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# 측정 스크립트를 임시 HOME에서 실행 (실제 설정/캐시에 영향 없음)
+# core의 데이터 폴더 경로는 모듈을 가져올 때 정해지므로 core.app_path 외의 core 모듈보다 먼저 호출해야 합니다.
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# 측정에서는 앱의 요청/대역폭 제한을 끔
+UNLIMITED_NETWORK = {
+    "total_kbps": 0,
+    "check": {"kbps": 0, "rps": 0},
+    "download": {"kbps": 0, "rps": 0},
+    "prefetch": {"kbps": 0, "rps": 0},
+}
+
+
+def use_temp_home(prefix: str = "mmm-bench-") -> Path:
+    """HOME(Windows는 LOCALAPPDATA)을 새 임시 폴더로 바꿉니다. 정리는 호출한 쪽에서 합니다."""
+    home = Path(tempfile.mkdtemp(prefix=prefix))
+    os.environ["HOME"] = str(home)
+    os.environ["LOCALAPPDATA"] = str(home)
+    return home
+
+
+def write_config(product_limits: bool = False):
+    """임시 데이터 폴더에 설정 파일을 씁니다. product_limits가 False면 네트워크 제한을 끕니다."""
+    from core.app_path import get_app_data_dir
+
+    app_dir = get_app_data_dir()
+    app_dir.mkdir(parents=True, exist_ok=True)
+    config = {} if product_limits else {"network_limits": UNLIMITED_NETWORK}
+    (app_dir / "config.json").write_text(json.dumps(config), encoding="utf-8")
@@ -0,0 +1,119 @@
+# 시작 시간 측정
+# 예) python bench/startup.py            # 첫 화면이 그려질 때까지의 시간 (5회)
+#     python bench/startup.py --importtime # -X importtime 보고서 (누적 시간 상위 모듈)
+# 측정용 HOME을 임시 폴더로 바꾸므로 실제 설정/캐시에는 영향이 없습니다.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 자식 프로세스에서 실행: QApplication에 이벤트 필터를 달아 첫 Paint 이벤트 시각을 출력하고 종료
+_PROBE = r"""
+import sys, time
+sys.path.insert(0, {root!r})
+sys.argv = ["main.py"]
+from PySide6 import QtWidgets
+from PySide6.QtCore import QObject, QEvent
+
+class _FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            print("FIRST_PAINT", time.time(), flush=True)
+            import os; os._exit(0)
+        return False
+
+_App = QtWidgets.QApplication
+class _ProbeApp(_App):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._probe = _FirstPaint()
+        self.installEventFilter(self._probe)
+QtWidgets.QApplication = _ProbeApp
+
+import main
+main.main()
+"""
+
+
+def _bench_env(home: Path, mc_version: str | None) -> dict:
+    env = dict(os.environ, HOME=str(home), LOCALAPPDATA=str(home), QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    if mc_version:
+        config_dir = home / "AppData" / "Local" / "MinecraftModManager" if os.name == "nt" else home / ".config" / "MinecraftModManager"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        (config_dir / "config.json").write_text(json.dumps({"selected_mc_version": mc_version}), encoding="utf-8")
+    (home / ".minecraft" / "mods").mkdir(parents=True, exist_ok=True)
+    return env
+
+
+def first_paint_seconds(home: Path, mc_version: str | None) -> float:
+    """프로세스 시작부터 첫 Paint 이벤트까지의 벽시계 시간 (인터프리터 시작 포함)."""
+    env = _bench_env(home, mc_version)
+    start = time.time()
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(root=str(ROOT))], env=env, cwd=ROOT,
+                         capture_output=True, text=True, timeout=60).stdout
+    for line in out.splitlines():
+        if line.startswith("FIRST_PAINT"):
+            return float(line.split()[1]) - start
+    raise RuntimeError(f"첫 화면을 감지하지 못했습니다:\n{out}")
+
+
+def importtime_report(home: Path, top: int) -> list:
+    """main을 가져올 때의 -X importtime 결과에서 누적 시간이 큰 모듈 top개. [(누적 us, 모듈)]"""
+    env = _bench_env(home, None)
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], env=env, cwd=ROOT,
+                         capture_output=True, text=True, timeout=60).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mc-version", default="1.20.1", help="저장된 버전 (빈 문자열이면 버전 선택 창부터 측정)")
+    parser.add_argument("--importtime", action="store_true", help="-X importtime 보고서 출력")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        if args.importtime:
+            rows = importtime_report(home, args.top)
+            if args.json:
+                print(json.dumps([{"module": name, "cumulative_ms": us / 1000} for us, name in rows], indent=1))
+            else:
+                for us, name in rows:
+                    print(f"{us / 1000:9.1f} ms  {name}")
+            return
+
+        first_paint_seconds(home, args.mc_version or None)  # 디스크 캐시 예열
+        samples = [first_paint_seconds(home, args.mc_version or None) for _ in range(args.runs)]
+
+    result = {
+        "runs": args.runs,
+        "first_paint_ms_median": round(statistics.median(samples) * 1000, 1),
+        "first_paint_ms_min": round(min(samples) * 1000, 1),
+        "samples_ms": [round(s * 1000, 1) for s in samples],
+    }
+    if args.json:
+        print(json.dumps(result, indent=1))
+    else:
+        print(f"첫 화면까지: 중앙값 {result['first_paint_ms_median']} ms, 최소 {result['first_paint_ms_min']} ms ({args.runs}회)")
+
+
+if __name__ == "__main__":
+    main()
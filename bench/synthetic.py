@@ -0,0 +1,111 @@
+# 벤치마크용 가짜 모드 데이터
+# 같은 catalog()로 모드 폴더(jar)와 가짜 Modrinth 서버의 응답을 함께 만들므로
+# 스캔 -> 검색 -> 버전 확인 -> 다운로드가 실제와 같은 경로로 흘러갑니다.
+import hashlib
+import io
+import json
+import random
+import zipfile
+from pathlib import Path
+
+LOADERS = ("fabric", "forge", "neoforge")
+MC_VERSION = "1.20.1"
+# 프로젝트마다 만들 버전 수 (최신순). 설치된 jar는 가장 오래된 버전이라 모두 '업데이트 가능'
+VERSIONS_PER_PROJECT = 5
+# CDN이 내려주는 jar의 클래스 파일 수
+DOWNLOAD_ENTRIES = 4
+# jar 항목의 수정 시각 (같은 입력이면 같은 바이트가 나오도록 고정)
+_ZIP_TIME = (2020, 1, 1, 0, 0, 0)
+
+
+def download_content(project: dict, version: str, size: int) -> bytes:
+    """CDN이 내려줄 새 버전 jar. 프로젝트와 버전으로 내용이 정해지므로 해시를 미리 계산할 수 있습니다."""
+    rng = random.Random(f"{project['project_id']}-{version}")
+    return jar_bytes(project, version, size, DOWNLOAD_ENTRIES, rng)
+
+
+def catalog(count: int, download_size: int = 64 * 1024, cdn_url: str = "", mc_version: str = MC_VERSION) -> list:
+    """
+    count개의 가짜 프로젝트. 로더는 fabric/forge/neoforge를 번갈아 씁니다.
+    :param cdn_url: 다운로드 URL 앞부분. 비워 두면 FakeModrinth가 자기 주소로 채웁니다.
+    """
+    projects = []
+    for i in range(count):
+        slug = f"bench-mod-{i}"
+        project = {
+            "project_id": f"bp{i:05d}",
+            "slug": slug,
+            "title": f"Bench Mod {i}",
+            "modid": f"bench_mod_{i}",
+            "loader": LOADERS[i % len(LOADERS)],
+            "versions": [],
+        }
+        for k in reversed(range(VERSIONS_PER_PROJECT)):
+            number = f"1.{k}.0"
+            filename = f"{slug}-{number}.jar"
+            project["versions"].append({
+                "id": f"bv{i:05d}-{k}",
+                "project_id": f"bp{i:05d}",
+                "version_number": number,
+                "game_versions": [mc_version],
+                "loaders": [project["loader"]],
+                "featured": k == VERSIONS_PER_PROJECT - 1,
+                "files": [{
+                    "primary": True,
+                    "filename": filename,
+                    "url": f"{cdn_url}/cdn/{filename}",
+                    "size": download_size,
+                    "hashes": {"sha1": hashlib.sha1(download_content(project, number, download_size)).hexdigest()},
+                }],
+            })
+        projects.append(project)
+    return projects
+
+
+def _metadata(project: dict, version: str) -> tuple[str, bytes]:
+    if project["loader"] == "fabric":
+        data = {
+            "id": project["modid"], "name": project["title"], "version": version,
+            "depends": {"minecraft": f">={MC_VERSION}"},
+        }
+        return "fabric.mod.json", json.dumps(data).encode()
+    loader_dep = "neoforge" if project["loader"] == "neoforge" else "forge"
+    toml = (
+        'modLoader="javafml"\nloaderVersion="[47,)"\n\n[[mods]]\n'
+        f'modId="{project["modid"]}"\nversion="{version}"\ndisplayName="{project["title"]}"\n\n'
+        f'[[dependencies.{project["modid"]}]]\nmodId="{loader_dep}"\nmandatory=true\n'
+    )
+    return "META-INF/mods.toml", toml.encode()
+
+
+def jar_bytes(project: dict, version: str, jar_size: int, entries: int, rng: random.Random) -> bytes:
+    """메타데이터 1개 + 클래스 파일 entries개로 대략 jar_size 바이트인 jar 내용을 만듭니다."""
+    name, data = _metadata(project, version)
+    per_entry = max(jar_size // max(entries, 1), 1)
+    buffer = io.BytesIO()
+    # 클래스 파일은 압축이 거의 안 되는 임의의 내용이라 저장 방식으로 (실제 jar 크기에 가깝게)
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as jar:
+        jar.writestr(zipfile.ZipInfo(name, _ZIP_TIME), data)
+        for n in range(entries):
+            jar.writestr(zipfile.ZipInfo(f"bench/{project['modid']}/C{n}.class", _ZIP_TIME), rng.randbytes(per_entry))
+    return buffer.getvalue()
+
+
+def write_jar(path: Path, project: dict, version: str, jar_size: int, entries: int, rng: random.Random):
+    path.write_bytes(jar_bytes(project, version, jar_size, entries, rng))
+
+
+def make_mods_folder(mods_dir: Path, projects: list, jar_size: int = 32 * 1024, entries: int = 20, seed: int = 0):
+    """
+    projects마다 가장 오래된 버전의 jar를 mods_dir에 만듭니다. (같은 seed면 같은 내용)
+    설치된 jar는 Modrinth에서 받은 파일이므로 catalog의 그 버전 파일 해시/크기를 이 jar의 것으로 바꿉니다.
+    """
+    mods_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    for project in projects:
+        oldest = project["versions"][-1]
+        path = mods_dir / oldest["files"][0]["filename"]
+        write_jar(path, project, oldest["version_number"], jar_size, entries, rng)
+        data = path.read_bytes()
+        oldest["files"][0]["size"] = len(data)
+        oldest["files"][0]["hashes"]["sha1"] = hashlib.sha1(data).hexdigest()
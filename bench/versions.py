@@ -0,0 +1,220 @@
+# 버전 정규화/비교(core.versioning) 정확성 확인과 대량 정렬 시간 측정
+# 예) python bench/versions.py               # 문자열 2만 개
+#     python bench/versions.py --count 100000 --json
+# 모드 버전 정규화 결과, 모드/마인크래프트 버전 순서가 기대한 대로인지 확인하고 하나라도 틀리면 종료 코드 1로 끝납니다.
+# 시간은 예전 구현(매번 정규식 컴파일 + packaging 파싱, 결과를 기억하지 않음)과 비교합니다.
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from packaging.version import parse, InvalidVersion
+
+from core import versioning
+from core.versioning import normalize_version, mod_version_key, mc_version_key, SNAPSHOT_RELEASES
+
+# Modrinth에 올라온 모드들의 version_number에서 모은 형식: {문자열: 기대하는 normalize_version 결과}
+MOD_VERSIONS = {
+    "mc1.20.1-0.5.3": "0.5.3", "mc1.20.4-0.5.8": "0.5.8", "0.5.11+mc1.21": "0.5.11",
+    "mc1.21.1-0.6.0-beta.2-fabric": "0.6.0b2", "0.92.2+1.20.1": "0.92.2", "0.100.8+1.21": "0.100.8",
+    "0.116.6+1.21.1": "0.116.6", "0.140.0+1.21.11": "0.140.0", "9.1.0+1.21.4": "9.1.0",
+    "1.20.1-47.2.0": "47.2.0", "47.3.0": "47.3.0", "neoforge-21.1.77": "21.1.77", "21.1.77": "21.1.77",
+    "v2.1-1.20.1": "2.1", "5.0+mc1.20.1": "5.0", "3.0.0-beta.3+1.20.1": "3.0.0b3", "1.0.0-fabric": "1.0.0",
+    "1.0.0-forge": "1.0.0", "3.1.0-fabric": "3.1.0", "1.2.4-beta.1": "1.2.4b1", "fabric-1.2.3": "1.2.3",
+    "forge-1.0": "1.0", "quilt-0.19.2": "0.19.2", "1.20.1-0.4.1": "0.4.1", "1.20-1.5.2": "1.5.2",
+    "1.19.2-0.3.4": "0.3.4", "0.9.2-1.20.1": "0.9.2", "1.1.0-1.20.1": "1.1.0", "1.20.1-1.9.0": "1.9.0",
+    "2.0.0": "2.0.0", "v1.4": "1.4", "V3.2.1": "3.2.1", "Sodium 0.5.8": "0.5.8", "iris-1.6.4+1.20": "1.6.4",
+    "1.6.11+1.20.1": "1.6.11", "3.2.0+build.7": "3.2.0+build.7", "1.1.0a": "1.1.0a0",
+    "2.11.1-fabric": "2.11.1", "2.11.1-forge": "2.11.1", "19.0.1": "19.0.1", "12.1.5.1": "12.1.5.1",
+    "0.3.1-alpha": "0.3.1a0", "4.3.3+1.20.1-fabric": "4.3.3", "4.3.3+1.20.1-forge": "4.3.3", "1.0": "1.0",
+    "2024.1.1": "2024.1.1", "r2.1.0": "2.1.0", "build.45": "45", "23w31a-0.1": "0.1", "0.1.0+24w14a": "0.1.0",
+    "1.2.3#hotfix": "1.2.3", "unknown": "0", "release": "0", "": "0", "1.21.1-fabric-0.16.5": "0.16.5",
+    "fabric-0.16.5+1.21.1": "0.16.5", "mc1.19.2-5.1.2": "5.1.2", "1.3.0-rc.1": "1.3.0rc1",
+    "2.4.0-pre.2+1.21.1": "2.4.0rc2", "0.4.0-SNAPSHOT": "0.4.0.dev0", "6.0.0+1.21.3-neoforge": "6.0.0",
+}
+
+# 이 순서대로 엄격히 커져야 함 (모드 버전)
+MOD_CHAINS = (
+    ("0.4.0-SNAPSHOT", "0.4.0-alpha", "0.4.0-beta.2", "0.4.0-pre.1", "0.4.0-rc.2", "0.4.0", "0.4.0+build.3",
+     "0.4.1-fabric"),
+    ("3.0.0", "3.1.0-fabric", "mc1.20.1-3.1.1", "3.2.0+1.20.1", "1.20.1-3.10.0"),
+    ("1.2.4-beta.1", "1.2.4", "1.2.5-forge"),
+    ("1.9.0+1.20.1", "1.20.1-1.10.0"),
+    ("0.5.11+mc1.21", "mc1.21.1-0.6.0-beta.2-fabric", "0.6.0+1.21.1"),
+)
+# 같은 버전으로 봐야 하는 것 (모드 버전)
+MOD_EQUAL = (
+    ("1.0.0", "1.0.0-fabric", "1.0.0-forge", "fabric-1.0.0", "1.0.0+1.20.1", "mc1.20.1-1.0.0", "1.20.1-1.0.0"),
+)
+
+# 이 순서대로 엄격히 커져야 함 (마인크래프트 버전)
+MC_CHAINS = (
+    ("rd-132211", "c0.0.13a", "a1.2.6", "b1.7.3", "1.0", "1.9", "1.10", "1.12.2", "1.16.5", "1.20.1"),
+    ("1.20.4", "24w03a", "24w14a", "1.20.5-pre1", "1.20.5-pre4", "1.20.5-rc1", "1.20.5", "24w18a", "1.21"),
+    ("1.13.2", "18w43a", "1.14 Pre-Release 1", "1.14 Pre-Release 5", "1.14", "1.14.4"),
+    ("1.21.9", "25w41a", "1.21.11-pre1", "1.21.11", "26.1-snapshot-1", "26.1-snapshot-9", "26.1-pre-1",
+     "26.1-rc-1", "26.1", "26.1.1"),
+)
+# 같은 버전으로 봐야 하는 것 (마인크래프트 버전, 설치 폴더 이름 포함)
+MC_EQUAL = (
+    ("1.20.1", "1.20.1-forge-47.2.0", "fabric-loader-0.15.0-1.20.1", "quilt-loader-0.20.0-1.20.1",
+     "OptiFine_1.20.1_HD_U_I6", "1.20.1-OptiFine_HD_U_I6"),
+    ("1.21.4-pre3", "1.21.4 Pre-Release 3"),
+)
+
+
+def legacy_normalize(version_str: str) -> str:
+    """예전 core.modrinth_api._normalize_version (시간 비교용, '1.0.0-fabric' -> '0' 같은 오류가 있음)"""
+    if not version_str:
+        return "0"
+    normalized = re.sub(r'^(?:fabric|forge|neoforge|quilt)-?', '', version_str, flags=re.IGNORECASE)
+    normalized = re.sub(r'[+-](?=(?:\d{1,2}w\d{2,}|1\.\d{1,2}))', '#', normalized, 1).split('#')[0]
+    normalized = re.sub(r'^(?:mc)?\d+\.\d+(?:\.\d+)?-', '', normalized, 1)
+    match = re.search(r'(\d+(?:\.\d+)*)', normalized)
+    if not match:
+        return "0"
+    normalized = match.group(1).rstrip('.')
+    return normalized.lstrip('vV ')
+
+
+def legacy_mc_key(version_str: str):
+    """예전 get_installed_mc_versions의 정렬 키 (시간 비교용)"""
+    try:
+        return parse(version_str.split('-')[0])
+    except InvalidVersion:
+        return parse("0.0.0")
+
+
+def mc_corpus() -> list:
+    """Modrinth 게임 버전 태그 형식: 정식/프리릴리스/RC/주간 스냅샷"""
+    versions = [f"1.{minor}" for minor in range(0, 22)]
+    versions += [f"1.{minor}.{patch}" for minor in range(0, 22) for patch in range(1, 6)]
+    versions += [f"1.{minor}-pre{n}" for minor in range(14, 22) for n in range(1, 6)]
+    versions += [f"1.{minor}.1-rc{n}" for minor in range(14, 22) for n in range(1, 3)]
+    for (year, first), (end_year, last), _ in SNAPSHOT_RELEASES:
+        week = first
+        while (year, week) <= (end_year, last):
+            versions += [f"{year}w{week:02d}a", f"{year}w{week:02d}b"]
+            year, week = (year + 1, 1) if week >= 52 else (year, week + 1)
+    versions += ["26.1-snapshot-1", "26.1-snapshot-2", "26.1-pre-1", "26.1-rc-1", "26.1", "b1.7.3", "a1.2.6"]
+    return versions
+
+
+def synthetic_mod_versions(count: int, distinct: int, rng: random.Random) -> list:
+    """MOD_VERSIONS와 같은 형식으로 서로 다른 값 distinct개를 만든 뒤 count개를 뽑습니다."""
+    templates = (
+        "{a}.{b}.{c}+{mc}", "mc{mc}-{a}.{b}.{c}", "{a}.{b}.{c}-{mc}", "{mc}-{a}.{b}.{c}", "v{a}.{b}",
+        "{a}.{b}.{c}-beta.{d}+{mc}", "fabric-{a}.{b}.{c}", "{a}.{b}.{c}+build.{d}", "{a}.{b}.{c}-{loader}",
+    )
+    releases = [f"1.{minor}.{patch}" for minor in range(16, 22) for patch in range(0, 5)]
+    pool = set(MOD_VERSIONS)
+    while len(pool) < distinct:
+        pool.add(rng.choice(templates).format(
+            a=rng.randrange(0, 20), b=rng.randrange(0, 50), c=rng.randrange(0, 30), d=rng.randrange(1, 10),
+            mc=rng.choice(releases), loader=rng.choice(("fabric", "forge", "neoforge"))))
+    pool = sorted(pool)
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _best(func, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1000, 2)
+
+
+def _check_chains(chains, key) -> list:
+    errors = []
+    for chain in chains:
+        for older, newer in zip(chain, chain[1:]):
+            if not key(older) < key(newer):
+                errors.append(f"순서 틀림: {older!r} < {newer!r} 이어야 함")
+    return errors
+
+
+def _check_equal(groups, key) -> list:
+    return [f"같아야 함: {', '.join(map(repr, group))}" for group in groups if len({key(v) for v in group}) != 1]
+
+
+def check_correctness() -> list:
+    """틀린 항목 설명 목록"""
+    errors = []
+    for value, expected in MOD_VERSIONS.items():
+        if normalize_version(value) != expected:
+            errors.append(f"정규화 틀림: {value!r} -> {normalize_version(value)!r} ({expected!r} 이어야 함)")
+    errors += _check_chains(MOD_CHAINS, mod_version_key)
+    errors += _check_equal(MOD_EQUAL, mod_version_key)
+    errors += _check_chains(MC_CHAINS, mc_version_key)
+    errors += _check_equal(MC_EQUAL, mc_version_key)
+    return errors
+
+
+def _clear_caches():
+    for func in (versioning.normalize_version, versioning.mod_version_key, versioning.mc_version_key):
+        func.cache_clear()
+
+
+def run(count: int, distinct: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    mod_versions = synthetic_mod_versions(count, distinct, rng)
+    corpus = mc_corpus()
+    mc_versions = [rng.choice(corpus) for _ in range(count)]
+
+    def cold(func):
+        def measure():
+            _clear_caches()
+            func()
+        return measure
+
+    results = {
+        "mod_versions": {
+            "legacy_ms": _best(lambda: sorted(mod_versions, key=lambda v: parse(legacy_normalize(v)))),
+            "cold_ms": _best(cold(lambda: sorted(mod_versions, key=mod_version_key))),
+            "warm_ms": _best(lambda: sorted(mod_versions, key=mod_version_key)),
+            "distinct": len(set(mod_versions)),
+        },
+        "mc_versions": {
+            "legacy_ms": _best(lambda: sorted(mc_versions, key=legacy_mc_key)),
+            "cold_ms": _best(cold(lambda: sorted(mc_versions, key=mc_version_key))),
+            "warm_ms": _best(lambda: sorted(mc_versions, key=mc_version_key)),
+            "distinct": len(set(mc_versions)),
+        },
+    }
+    return {"count": count, "errors": check_correctness(), "results": results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="버전 정규화/비교 정확성 확인과 대량 정렬 시간 측정")
+    parser.add_argument("--count", type=int, default=20000, help="정렬할 버전 문자열 수")
+    parser.add_argument("--distinct", type=int, default=3000,
+                        help="서로 다른 모드 버전 문자열 수 (모드 수백 개의 버전 목록 정도)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = run(args.count, args.distinct, args.seed)
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(f"버전 문자열 {report['count']}개 정렬 (ms, 3회 중 최소)")
+        print(f"{'종류':<14}{'서로 다른 값':>12}{'예전':>10}{'처음':>10}{'기억됨':>10}")
+        for name, r in report["results"].items():
+            print(f"{name:<14}{r['distinct']:>12}{r['legacy_ms']:>10}{r['cold_ms']:>10}{r['warm_ms']:>10}")
+        for error in report["errors"]:
+            print(f"FAIL {error}")
+        print("정확성: " + ("통과" if not report["errors"] else f"{len(report['errors'])}건 실패"))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+# 명령줄 진입점 (GUI 없이 실행)
+# 예) python cli.py check --mc-version 1.20.1
+#     python cli.py update --mods-dir /srv/mc/mods sodium lithium
+# PySide6를 가져오지 않으므로 서버/스크립트에서도 사용할 수 있습니다.
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+
+from core import caches, cache_stats, tracing
+from core.config import load_selected_version
+from core.mod_scanner import resolve_mods_dir, list_mod_files, ModsFolderNotFoundError
+from core.mod_record import ModRecord
+from core.mod_jobs import scan_jobs, check_job, batch_check_job, update_jobs, optimize_jobs, prewarm_jobs
+from core.mrpack import export_mrpack
+from core.profiling import SamplingProfiler
+from core.scheduler import JobScheduler, wait_all, DONE
+from core.update_mod import recover_interrupted_update
+
+# 종료 코드
+EXIT_OK = 0
+EXIT_ERROR = 1              # 예상하지 못한 오류
+EXIT_USAGE = 2              # 잘못된 인자 (argparse와 같은 값)
+EXIT_NO_MODS_DIR = 3        # 모드 폴더 없음
+EXIT_NO_MC_VERSION = 4      # 대상 마인크래프트 버전을 정할 수 없음
+EXIT_PARTIAL = 5            # 일부 모드의 확인/업데이트 실패
+EXIT_UPDATES_AVAILABLE = 10 # check: 업데이트 가능한 모드가 있음
+EXIT_INTERRUPTED = 130      # Ctrl+C
+
+CLI_GROUP = "cli"
+
+# 결과에 포함할 모드 정보
+MOD_FIELDS = (
+    "file", "enabled", "mod_name", "mod_version", "mc_version", "project_id", "loaders",
+    "detection_source", "status", "latest_version", "latest_filename",
+)
+
+
+class CliError(Exception):
+    """종료 코드와 함께 명령을 중단할 때 발생하는 예외."""
+
+    def __init__(self, message: str, exit_code: int = EXIT_ERROR):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+def _mod_json(mod: dict) -> dict:
+    return {key: mod[key] for key in MOD_FIELDS if key in mod}
+
+
+def _target_version(args) -> str:
+    version = args.mc_version or load_selected_version()
+    if not version:
+        raise CliError("대상 마인크래프트 버전이 없습니다. --mc-version을 지정하세요.", EXIT_NO_MC_VERSION)
+    return version
+
+
+def _run(scheduler: JobScheduler, jobs: list, last):
+    """작업을 제출하고 last가 끝날 때까지 기다립니다."""
+    scheduler.submit_all([*jobs, last])
+    wait_all([last])
+    if last.state != DONE:
+        raise CliError(f"작업 실패 ({last.name}): {last.error}")
+    return last.result
+
+
+def _scan(scheduler: JobScheduler, mods_dir: Path) -> list:
+    jobs, done = scan_jobs(mods_dir, list_mod_files(mods_dir), CLI_GROUP)
+    return _run(scheduler, jobs, done)
+
+
+def _check(scheduler: JobScheduler, mods: list, target: str, mods_dir: Path) -> list:
+    batch = scheduler.submit(batch_check_job(mods, target, mods_dir, CLI_GROUP))
+    jobs = scheduler.submit_all([check_job(mod, target, CLI_GROUP, batch=batch) for mod in mods])
+    wait_all(jobs)
+    checked = []
+    for mod, job in zip(mods, jobs):
+        if job.state == DONE:
+            checked.append(job.result)
+        else:
+            checked.append(ModRecord(mod, status=f"확인 오류: {job.error}"))
+    return checked
+
+
+def _select(mods: list, names: list) -> list:
+    """이름/파일 이름/프로젝트 ID로 모드를 고릅니다. names가 비어 있으면 전부."""
+    if not names:
+        return mods
+    wanted = {name.casefold() for name in names}
+    return [
+        mod for mod in mods
+        if {str(mod.get(key, "")).casefold() for key in ("mod_name", "file", "project_id")} & wanted
+    ]
+
+
+def _status_counts(mods: list) -> dict:
+    counts = {}
+    for mod in mods:
+        status = mod.get("status", "")
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+# --- 명령 ---
+def cmd_scan(args, scheduler):
+    mods_dir = resolve_mods_dir(args.mods_dir)
+    mods = _scan(scheduler, mods_dir)
+    return {"mods_dir": str(mods_dir), "count": len(mods), "mods": [_mod_json(m) for m in mods]}, EXIT_OK
+
+
+def cmd_check(args, scheduler):
+    target = _target_version(args)
+    mods_dir = resolve_mods_dir(args.mods_dir)
+    mods = _check(scheduler, _select(_scan(scheduler, mods_dir), args.mods), target, mods_dir)
+    counts = _status_counts(mods)
+    result = {
+        "mods_dir": str(mods_dir),
+        "mc_version": target,
+        "count": len(mods),
+        "statuses": counts,
+        "mods": [_mod_json(m) for m in mods],
+    }
+    if any(status.startswith("확인 오류") for status in counts):
+        return result, EXIT_PARTIAL
+    return result, EXIT_UPDATES_AVAILABLE if counts.get("업데이트 가능") else EXIT_OK
+
+
+def _apply(args, scheduler, wanted_status: str, build_jobs):
+    """확인 후 wanted_status인 모드들을 build_jobs(mods, target, mods_dir)의 작업 그래프로 교체합니다."""
+    target = _target_version(args)
+    mods_dir = resolve_mods_dir(args.mods_dir)
+    if not args.dry_run:
+        # 모드 폴더를 바꾸는 명령만 중단된 업데이트를 마무리 (저널 잠금 안에서, 다른 프로세스가 교체 중이면 건너뜀)
+        recovered = recover_interrupted_update(mods_dir)
+        if recovered:
+            print(f"중단된 업데이트 {len(recovered)}건을 복구했습니다.")
+    mods = _check(scheduler, _select(_scan(scheduler, mods_dir), args.mods), target, mods_dir)
+    candidates = [mod for mod in mods if wanted_status in mod.get("status", "")]
+
+    result = {"mods_dir": str(mods_dir), "mc_version": target, "candidates": len(candidates)}
+    if args.dry_run or not candidates:
+        result.update(applied=[], failed=[], pending=[_mod_json(m) for m in candidates])
+        return result, EXIT_OK
+
+    jobs, swap = build_jobs(candidates, target, mods_dir)
+    outcome = _run(scheduler, jobs, swap)
+    result["applied"] = [{"old_file": old_file, **_mod_json(record)} for old_file, record in outcome["applied"]]
+    result["failed"] = [{"mod_name": name, "error": error} for name, error in outcome["failures"]]
+    return result, EXIT_PARTIAL if result["failed"] else EXIT_OK
+
+
+def cmd_update(args, scheduler):
+    return _apply(args, scheduler, "업데이트 가능",
+                  lambda mods, target, mods_dir: update_jobs(mods, mods_dir, CLI_GROUP))
+
+
+def cmd_optimize(args, scheduler):
+    return _apply(args, scheduler, "버전 높음",
+                  lambda mods, target, mods_dir: optimize_jobs(mods, target, mods_dir, CLI_GROUP))
+
+
+def cmd_export(args, scheduler):
+    target = _target_version(args)
+    mods_dir = resolve_mods_dir(args.mods_dir)
+    mods = _scan(scheduler, mods_dir)
+    out_path = Path(args.output)
+    counts = export_mrpack(mods, mods_dir, out_path, target, args.name)
+    return {"mods_dir": str(mods_dir), "output": str(out_path.resolve()), **counts}, EXIT_OK
+
+
+def cmd_cache(args, scheduler):
+    names = args.layer or list(caches.LAYERS)
+    if args.action == "stats":
+        return {"caches": caches.all_stats(names)}, EXIT_OK
+    if args.action == "reset-stats":
+        cache_stats.reset_totals(names)
+        return {"caches": caches.all_stats(names)}, EXIT_OK
+    if args.action == "compact":
+        return {"removed": caches.compact(names)}, EXIT_OK
+    if args.action == "clear":
+        if args.project:
+            scope, value = caches.SCOPE_PROJECT, args.project
+        elif args.instance:
+            scope, value = caches.SCOPE_INSTANCE, str(resolve_mods_dir(args.mods_dir))
+        else:
+            scope, value = caches.SCOPE_ALL, None
+        return {"scope": scope, "value": value, "removed": caches.invalidate(scope, value, names)}, EXIT_OK
+    # prewarm: 스캔하면서 검색 결과/jar 메타데이터 캐시를 채움 (버전 목록은 메모리라 이 실행에서만 유효)
+    mods_dir = resolve_mods_dir(args.mods_dir)
+    jobs, done, _ = prewarm_jobs(mods_dir, list_mod_files(mods_dir), CLI_GROUP)
+    mods = _run(scheduler, jobs, done)
+    wait_all(jobs)
+    return {"mods_dir": str(mods_dir), "count": len(mods), "caches": caches.all_stats(names)}, EXIT_OK
+
+
+def _json_default(value):
+    if isinstance(value, ModRecord):
+        return value.to_dict()
+    return str(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="마인크래프트 모드 관리자 (명령줄)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--mods-dir", help="모드 폴더 (기본: 마인크래프트 기본 mods 폴더)")
+    common.add_argument("--mc-version", help="대상 마인크래프트 버전 (기본: GUI에서 저장한 버전)")
+    common.add_argument("--pretty", action="store_true", help="JSON을 들여써서 출력")
+    common.add_argument("--trace", metavar="PATH", help="단계별 소요 시간을 Chrome 추적 형식(chrome://tracing)으로 저장")
+    common.add_argument("--profile", metavar="PATH", help="실행하는 동안 프로파일을 떠서 시간을 많이 쓴 함수 보고서를 저장")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scan", parents=[common], help="모드 폴더를 스캔합니다")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("check", parents=[common], help="업데이트를 확인합니다 (업데이트가 있으면 종료 코드 10)")
+    p.add_argument("mods", nargs="*", help="확인할 모드 (이름/파일 이름/프로젝트 ID, 기본: 전부)")
+    p.set_defaults(func=cmd_check)
+
+    for name, func, text in (("update", cmd_update, "업데이트 가능한 모드를 업데이트합니다"),
+                             ("optimize", cmd_optimize, "버전이 높은 모드를 대상 버전에 맞게 바꿉니다")):
+        p = sub.add_parser(name, parents=[common], help=text)
+        p.add_argument("mods", nargs="*", help="대상 모드 (이름/파일 이름/프로젝트 ID, 기본: 전부)")
+        p.add_argument("--dry-run", action="store_true", help="바꿀 모드만 출력하고 교체하지 않음")
+        p.set_defaults(func=func)
+
+    p = sub.add_parser("export", parents=[common], help="모드 목록을 .mrpack으로 내보냅니다")
+    p.add_argument("output", help="저장할 .mrpack 경로")
+    p.add_argument("--name", help="모드팩 이름 (기본: 파일 이름)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("cache", parents=[common], help="캐시 상태 보기/정리/비우기/미리 채우기")
+    p.add_argument("action", choices=["stats", "compact", "clear", "prewarm", "reset-stats"],
+                   help="stats: 상태 (적중/실패는 지금까지 실행들의 누적), compact: 만료/안 쓰는 항목 정리, "
+                        "clear: 비우기, prewarm: 스캔해서 채우기, reset-stats: 누적 적중/실패 횟수 초기화")
+    p.add_argument("--layer", action="append",
+                   choices=list(caches.LAYERS),
+                   help="대상 캐시 (여러 번 지정 가능, 기본: 전부)")
+    scope = p.add_mutually_exclusive_group()
+    scope.add_argument("--project", metavar="PROJECT_ID", help="clear: 이 프로젝트의 항목만")
+    scope.add_argument("--instance", action="store_true", help="clear: --mods-dir 모드 폴더의 항목만")
+    p.set_defaults(func=cmd_cache)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    stdout = sys.stdout
+    if args.trace:
+        tracing.enable()
+    profiler = None
+    if args.profile:
+        profiler = SamplingProfiler()
+        profiler.start()
+    scheduler = JobScheduler()
+    # core의 진행 로그(print)는 stderr로 보내고 stdout에는 JSON만 출력
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            result, code = args.func(args, scheduler)
+        except ModsFolderNotFoundError as e:
+            result, code = {"error": str(e)}, EXIT_NO_MODS_DIR
+        except CliError as e:
+            result, code = {"error": str(e)}, e.exit_code
+        except KeyboardInterrupt:
+            result, code = {"error": "중단되었습니다."}, EXIT_INTERRUPTED
+        except Exception as e:
+            result, code = {"error": f"{type(e).__name__}: {e}"}, EXIT_ERROR
+        finally:
+            # 진행 중인 요청을 끊음 (교체가 진행 중이면 저널이 다음 실행에서 마무리)
+            scheduler.shutdown(wait=False)
+            # 이번 실행의 캐시 적중/실패를 누적 (종료 시에도 저장되지만 오류 출력이 JSON과 섞이지 않도록 여기서)
+            cache_stats.save()
+
+    if args.trace:
+        try:
+            result["trace"] = str(tracing.export_chrome_trace(Path(args.trace)).resolve())
+        except OSError as e:
+            print(f"추적 저장 실패: {e}", file=sys.stderr)
+    if profiler:
+        profiler.stop()
+        try:
+            result["profile"] = str(profiler.write_report(Path(args.profile)).resolve())
+        except OSError as e:
+            print(f"프로파일 저장 실패: {e}", file=sys.stderr)
+    result["exit_code"] = code
+    json.dump(result, stdout, ensure_ascii=False, indent=2 if args.pretty else None, default=_json_default)
+    stdout.write("\n")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,17 @@
 import os
 import sys
 from pathlib import Path
-from packaging.version import parse, InvalidVersion
 
 def get_app_data_dir() -> Path:
     """
     운영체제에 맞는 애플리케이션 데이터 디렉토리 경로를 반환합니다.
-    경로가 존재하지 않으면 생성합니다.
+    폴더는 만들지 않습니다. (모듈을 가져오기만 해도 디스크를 건드리지 않도록, 파일을 쓰는 쪽에서 생성)
     """
     if os.name == 'nt': # Windows
         path = Path(os.getenv('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')) / 'MinecraftModManager'
     else: # macOS, Linux
         path = Path.home() / '.config' / 'MinecraftModManager'
-    
-    path.mkdir(parents=True, exist_ok=True)
+
     return path
 
 def get_minecraft_dir() -> Path:
@@ -42,18 +40,10 @@ def get_installed_mc_versions() -> list[str]:
             if version_json_path.exists():
                 installed_versions.append(version_dir.name)
 
-    # 버전을 역순으로 정렬 (최신 버전이 위로)
-    def sort_key(version_str):
-        try:
-            # e.g., "1.20.1-fabric-0.15.0" -> "1.20.1"
-            base_version = version_str.split('-')[0]
-            return parse(base_version)
-        except InvalidVersion:
-            # 숫자로 시작하지 않는 버전(e.g., "b1.7.3")은 낮은 우선순위로 처리
-            return parse("0.0.0")
-
-    installed_versions.sort(key=sort_key, reverse=True)
-    return installed_versions
+    # 최신 버전이 위로. "1.20.1-forge-47.2.0", "fabric-loader-0.15.0-1.20.1"은 1.20.1로,
+    # 스냅샷/프리릴리스는 해당 정식 버전 바로 앞으로, "b1.7.3" 같은 옛 버전은 아래로
+    from core.versioning import sort_mc_versions
+    return sort_mc_versions(installed_versions, reverse=True)
 
 def get_mods_dir() -> Path:
     """마인크래프트 mods 폴더 경로를 반환합니다."""
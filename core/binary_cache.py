@@ -0,0 +1,122 @@
+import marshal
+import struct
+from collections.abc import MutableMapping
+from pathlib import Path
+
+from core.fileio import atomic_write
+
+# 큰 캐시용 이진 파일 형식. 읽을 때는 머리말과 색인만 풀고, 항목은 처음 꺼낼 때 풉니다.
+# 저장할 때 한 번도 꺼내지 않은 항목은 읽어 둔 바이트를 그대로 다시 씁니다.
+#
+# [머리말] 매직 4바이트, 형식 버전 1바이트, 항목 수 u32, 색인 길이 u32 (little endian)
+# [색인]   marshal((키 튜플, 시작 위치 튜플)) - 시작 위치는 항목 수 + 1개 (마지막은 데이터 끝)
+# [데이터] 항목마다 marshal로 직렬화한 값을 이어 붙임
+# 값에는 dict/list/str/int/float/bool/None만 쓸 수 있습니다. (JSON에 담던 것과 같음)
+
+MAGIC = b"MMMC"
+FORMAT = 1
+_HEADER = struct.Struct("<4sBII")
+_MISSING = object()
+
+
+class CacheFormatError(ValueError):
+    """파일이 이 형식이 아니거나 잘려 있을 때"""
+
+
+class LazyCache(MutableMapping):
+    """
+    이진 캐시 파일을 읽은 딕셔너리. 항목은 꺼낼 때 풉니다.
+    여러 스레드가 동시에 꺼내거나 넣어도 됩니다. (같은 항목을 두 번 풀 수는 있음)
+    """
+
+    def __init__(self, data: bytes = b"", index: dict = None):
+        self._data = data
+        self._index = index or {}   # 아직 풀지 않은 항목 {키: (시작, 끝)}
+        self._values = {}           # 풀었거나 새로 넣은 항목
+        self._deleted = set()       # 지운 키 (저장할 때 파일에 있던 것을 되살리지 않음)
+
+    def __getitem__(self, key):
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            start, end = self._index[key]
+            value = self._values.setdefault(key, marshal.loads(self._data[start:end]))
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        found = self._values.pop(key, _MISSING) is not _MISSING
+        found = self._index.pop(key, None) is not None or found
+        if not found:
+            raise KeyError(key)
+        self._deleted.add(key)
+
+    def __contains__(self, key):
+        return key in self._values or key in self._index
+
+    def __iter__(self):
+        yield from list(self._values)
+        yield from [key for key in list(self._index) if key not in self._values]
+
+    def __len__(self):
+        return len(self._values.keys() | self._index.keys())
+
+    def raw(self, key) -> bytes:
+        """저장할 항목의 직렬화된 바이트. 풀지 않은 항목은 읽어 둔 바이트를 그대로 씁니다."""
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            start, end = self._index[key]
+            return self._data[start:end]
+        return marshal.dumps(value)
+
+
+def loads(data: bytes) -> LazyCache:
+    if len(data) < _HEADER.size:
+        raise CacheFormatError("머리말이 없습니다.")
+    magic, version, count, index_size = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT:
+        raise CacheFormatError("캐시 형식이 다릅니다.")
+    body = _HEADER.size + index_size
+    try:
+        keys, offsets = marshal.loads(data[_HEADER.size:body])
+    except (EOFError, ValueError, TypeError) as e:
+        raise CacheFormatError(f"색인을 읽을 수 없습니다: {e}") from None
+    if len(keys) != count or len(offsets) != count + 1 or body + offsets[-1] != len(data):
+        raise CacheFormatError("파일이 잘렸거나 색인이 맞지 않습니다.")
+    index = {key: (body + offsets[i], body + offsets[i + 1]) for i, key in enumerate(keys)}
+    return LazyCache(data, index)
+
+
+def dumps(cache, base: LazyCache = None) -> bytes:
+    """
+    cache는 LazyCache나 일반 dict
+    :param base: 지금 파일에 있는 캐시. cache에 없고 cache에서 지우지도 않은 항목은 그대로 옮겨 씁니다.
+        (이 캐시를 읽은 뒤 다른 프로세스가 추가한 항목)
+    """
+    keys = list(cache)
+    raw = cache.raw if isinstance(cache, LazyCache) else (lambda key: marshal.dumps(cache[key]))
+    chunks = [raw(key) for key in keys]
+    if base is not None:
+        deleted = cache._deleted if isinstance(cache, LazyCache) else ()
+        for key in base:
+            if key not in cache and key not in deleted:
+                keys.append(key)
+                chunks.append(base.raw(key))
+    keys = tuple(keys)
+    offsets = [0]
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+    index = marshal.dumps((keys, tuple(offsets)))
+    return b"".join([_HEADER.pack(MAGIC, FORMAT, len(keys), len(index)), index, *chunks])
+
+
+def load(path: Path) -> LazyCache:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump(cache, path: Path, base: LazyCache = None) -> int:
+    """원자적으로 저장합니다. (base는 dumps 참고) 쓴 바이트 수를 반환합니다."""
+    return atomic_write(path, dumps(cache, base))
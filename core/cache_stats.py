@@ -0,0 +1,120 @@
+import atexit
+import json
+import threading
+import time
+from collections import Counter
+
+from core.app_path import get_app_data_dir
+from core.fileio import atomic_write, file_lock
+
+# 캐시 레이어별 적중/실패/제거 횟수. 캐시를 쓰는 쪽에서 기록하고 core.caches가 디스크 상태와 함께 보여줍니다.
+# 이번 실행의 횟수는 끝날 때(save) 누적 파일에 더하므로, 예약 작업의 CLI가 여러 번 실행된 뒤에도
+# `cli.py cache stats`로 전체 적중률을 볼 수 있습니다. (app_path/fileio 외의 core 모듈은 가져오지 않음)
+
+# 실행들을 합친 누적 횟수: {레이어: {"hits", "misses", "evictions", "since": 집계 시작 시각}}
+STATS_FILE = get_app_data_dir() / "cache_stats.json"
+
+# 캐시 레이어 이름
+LAYER_MOD_INFO = "mod_info"            # Modrinth 검색 결과 (파일 -> 프로젝트)
+LAYER_JAR_METADATA = "jar_metadata"    # jar 안의 메타데이터
+LAYER_VERSION_INDEX = "version_index"  # 프로젝트별 전체 버전 목록 (메모리)
+LAYER_SNAPSHOT = "snapshot"            # 마지막으로 확인을 마친 모드 목록
+LAYER_STAGING = "staging"              # 미리 받아 둔 업데이트 파일
+
+HIT = "hits"
+MISS = "misses"
+EVICTION = "evictions"
+
+KINDS = (HIT, MISS, EVICTION)
+
+_counters = {}  # 이번 실행
+_unsaved = {}   # 이번 실행에서 아직 누적 파일에 더하지 않은 것
+_lock = threading.Lock()
+
+
+def _count(layer: str, kind: str, amount: int):
+    with _lock:
+        _counters.setdefault(layer, Counter())[kind] += amount
+        _unsaved.setdefault(layer, Counter())[kind] += amount
+
+
+def hit(layer: str):
+    _count(layer, HIT, 1)
+
+
+def miss(layer: str):
+    _count(layer, MISS, 1)
+
+
+def evicted(layer: str, amount: int = 1):
+    """만료되었거나 정리/비우기로 지운 항목 수"""
+    if amount:
+        _count(layer, EVICTION, amount)
+
+
+def counters(layer: str) -> dict:
+    """이번 실행의 {"hits", "misses", "evictions"}"""
+    with _lock:
+        counter = _counters.get(layer, Counter())
+        return {kind: counter[kind] for kind in KINDS}
+
+
+def read_saved() -> dict:
+    """누적 파일 내용 (여러 레이어의 totals()에 넘기는 용도)"""
+    try:
+        with open(STATS_FILE, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return saved if isinstance(saved, dict) else {}
+
+
+def totals(layer: str, saved: dict = None) -> dict:
+    """
+    저장된 누적 횟수 + 이번 실행에서 아직 저장하지 않은 횟수: {"hits", "misses", "evictions", "since"}
+    :param saved: 여러 레이어를 볼 때 한 번 읽어 둔 누적 파일 내용
+    """
+    entry = (saved if saved is not None else read_saved()).get(layer, {})
+    with _lock:
+        unsaved = _unsaved.get(layer, Counter())
+        result = {kind: entry.get(kind, 0) + unsaved[kind] for kind in KINDS}
+    result["since"] = entry.get("since")
+    return result
+
+
+def save():
+    """이번 실행에서 쌓인 횟수를 누적 파일에 더합니다. (다른 프로세스와 겹치지 않게 잠금, 종료 시 자동 호출)"""
+    with _lock:
+        pending = {layer: dict(counter) for layer, counter in _unsaved.items() if any(counter.values())}
+        _unsaved.clear()
+    if not pending:
+        return
+    try:
+        with file_lock(STATS_FILE):
+            saved = read_saved()
+            for layer, counter in pending.items():
+                entry = saved.setdefault(layer, {"since": time.time()})
+                for kind, amount in counter.items():
+                    entry[kind] = entry.get(kind, 0) + amount
+            atomic_write(STATS_FILE, json.dumps(saved, ensure_ascii=False))
+    except OSError as e:
+        print(f"캐시 통계 저장 실패: {e}")
+
+
+def reset_totals(layers=None):
+    """누적 횟수를 지우고 지금부터 다시 셉니다. (layers가 없으면 전부)"""
+    with _lock:
+        for layer in list(_unsaved) if layers is None else layers:
+            _unsaved.pop(layer, None)
+    with file_lock(STATS_FILE):
+        saved = {} if layers is None else {k: v for k, v in read_saved().items() if k not in layers}
+        atomic_write(STATS_FILE, json.dumps(saved, ensure_ascii=False))
+
+
+def reset():
+    """이번 실행의 횟수를 지웁니다. (누적 횟수는 그대로)"""
+    with _lock:
+        _counters.clear()
+
+
+atexit.register(save)
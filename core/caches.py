@@ -0,0 +1,292 @@
+import time
+from pathlib import Path
+
+from core import cache_stats
+from core.cache_stats import (
+    LAYER_MOD_INFO, LAYER_JAR_METADATA, LAYER_VERSION_INDEX, LAYER_SNAPSHOT, LAYER_STAGING
+)
+from core.mod_info_cache import (
+    MOD_INFO_CACHE_FILE, JAR_METADATA_CACHE_FILE, MOD_INFO_CACHE_TTL,
+    load_mod_info_cache, save_mod_info_cache, load_jar_metadata_cache, save_jar_metadata_cache
+)
+from core.modrinth_api import VERSION_INDEX_TTL, version_index_entries, forget_versions
+from core.modrinth_cache import snapshot_info, clear_snapshot
+from core.staging import STAGING_DIR
+
+# 캐시 레이어마다 같은 방식으로 상태를 보고 정리/비우기를 할 수 있게 묶은 것.
+# GUI의 진단 창과 `cli.py cache`가 사용합니다.
+
+LAYER_LABELS = {
+    LAYER_MOD_INFO: "Modrinth 검색 결과",
+    LAYER_JAR_METADATA: "jar 메타데이터",
+    LAYER_VERSION_INDEX: "버전 목록 (메모리)",
+    LAYER_SNAPSHOT: "마지막 모드 목록",
+    LAYER_STAGING: "미리 받은 파일",
+}
+
+# 비우기 범위
+SCOPE_ALL = "all"
+SCOPE_PROJECT = "project"    # 프로젝트 ID 하나
+SCOPE_INSTANCE = "instance"  # 모드 폴더 하나
+
+# 항목 나이 분포 구간 (초, 이름). 마지막 구간은 그보다 오래된 전부
+AGE_BUCKETS = ((3600, "1시간 이내"), (86400, "1일 이내"), (7 * 86400, "7일 이내"), (None, "7일 이상"))
+# 이보다 오래된 스테이징 파일은 정리 대상 (업데이트하지 않고 남은 파일)
+STAGING_MAX_AGE = 7 * 86400
+
+
+def _age_bucket(age: float) -> str:
+    for limit, label in AGE_BUCKETS:
+        if limit is None or age < limit:
+            return label
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _same_dir(a, b) -> bool:
+    try:
+        return Path(a).resolve() == Path(b).resolve()
+    except (OSError, TypeError):
+        return False
+
+
+class CacheLayer:
+    """
+    캐시 레이어 공통 인터페이스.
+    하위 클래스는 entries()와 remove(keys)만 구현하고, 통계/정리/범위별 비우기는 여기서 계산합니다.
+    entries()의 항목: {"key", "time"(저장 시각), "stale"(정리 대상), "project_id", "path"(관련 파일/폴더)}
+    """
+    name = ""
+
+    @property
+    def label(self) -> str:
+        return LAYER_LABELS.get(self.name, self.name)
+
+    def entries(self) -> list:
+        raise NotImplementedError
+
+    def remove(self, keys: set) -> int:
+        """key가 keys에 있는 항목을 지우고 지운 수를 반환합니다."""
+        raise NotImplementedError
+
+    def disk_bytes(self) -> int:
+        return 0
+
+    def stats(self, saved: dict = None) -> dict:
+        """
+        적중/실패/제거는 여러 실행(GUI, CLI)을 합친 누적 횟수 ("since"부터), "session"은 이번 실행만.
+        :param saved: cache_stats.read_saved()로 한 번 읽어 둔 누적 파일 내용
+        """
+        now = time.time()
+        entries = self.entries()
+        ages = {label: 0 for _, label in AGE_BUCKETS}
+        for entry in entries:
+            ages[_age_bucket(now - entry["time"])] += 1
+        totals = cache_stats.totals(self.name, saved)
+        lookups = totals[cache_stats.HIT] + totals[cache_stats.MISS]
+        return {
+            "layer": self.name,
+            "label": self.label,
+            "entries": len(entries),
+            "stale": sum(1 for e in entries if e["stale"]),
+            "bytes": self.disk_bytes(),
+            **totals,
+            "hit_rate": totals[cache_stats.HIT] / lookups if lookups else None,
+            "session": cache_stats.counters(self.name),
+            "ages": ages,
+        }
+
+    def _drop(self, predicate) -> int:
+        keys = {entry["key"] for entry in self.entries() if predicate(entry)}
+        removed = self.remove(keys) if keys else 0
+        cache_stats.evicted(self.name, removed)
+        return removed
+
+    def compact(self) -> int:
+        """만료되었거나 더 이상 쓰이지 않는 항목을 지웁니다."""
+        return self._drop(lambda entry: entry["stale"])
+
+    def invalidate(self, scope: str = SCOPE_ALL, value=None) -> int:
+        """
+        범위 안의 항목을 지웁니다.
+        :param value: SCOPE_PROJECT면 프로젝트 ID, SCOPE_INSTANCE면 모드 폴더 경로
+        """
+        if scope == SCOPE_ALL:
+            return self._drop(lambda entry: True)
+        if scope == SCOPE_PROJECT:
+            return self._drop(lambda entry: entry["project_id"] == value)
+        if scope == SCOPE_INSTANCE:
+            return self._drop(lambda entry: entry["path"] is not None and _same_dir(entry["path"], value))
+        raise ValueError(f"알 수 없는 범위: {scope}")
+
+
+class ModInfoLayer(CacheLayer):
+    name = LAYER_MOD_INFO
+
+    def entries(self) -> list:
+        now = time.time()
+        return [
+            {
+                "key": key,
+                "time": value.get("_timestamp", 0),
+                "stale": now - value.get("_timestamp", 0) >= MOD_INFO_CACHE_TTL,
+                "project_id": value.get("project_id"),
+                "path": None,  # 키가 파일 이름/모드 정보라 폴더와 무관
+            }
+            for key, value in load_mod_info_cache().items()
+        ]
+
+    def remove(self, keys: set) -> int:
+        cache = load_mod_info_cache()
+        removed = [key for key in keys if cache.pop(key, None) is not None]
+        if removed:
+            save_mod_info_cache(cache)
+        return len(removed)
+
+    def disk_bytes(self) -> int:
+        return _file_size(MOD_INFO_CACHE_FILE)
+
+
+class JarMetadataLayer(CacheLayer):
+    name = LAYER_JAR_METADATA
+
+    def entries(self) -> list:
+        result = []
+        for key, value in load_jar_metadata_cache().items():
+            mtime = value.get("file_mtime")
+            # 키는 "절대 경로-수정 시각"
+            path = Path(key[:-len(f"-{mtime}")]) if mtime is not None else None
+            try:
+                # 파일이 없어졌거나 바뀌었으면 다시 쓰이지 않음
+                stale = path is None or path.stat().st_mtime != mtime
+            except OSError:
+                stale = True
+            result.append({
+                "key": key,
+                "time": value.get("timestamp", 0),
+                "stale": stale,
+                "project_id": None,
+                "path": path.parent if path else None,
+            })
+        return result
+
+    def remove(self, keys: set) -> int:
+        cache = load_jar_metadata_cache()
+        removed = [key for key in keys if cache.pop(key, None) is not None]
+        if removed:
+            save_jar_metadata_cache(cache)
+        return len(removed)
+
+    def disk_bytes(self) -> int:
+        return _file_size(JAR_METADATA_CACHE_FILE)
+
+
+class VersionIndexLayer(CacheLayer):
+    name = LAYER_VERSION_INDEX
+
+    def entries(self) -> list:
+        now = time.time()
+        return [
+            {
+                "key": project_id,
+                "time": fetched_at,
+                "stale": now - fetched_at > VERSION_INDEX_TTL,
+                "project_id": project_id,
+                "path": None,
+            }
+            for project_id, fetched_at, _ in version_index_entries()
+        ]
+
+    def remove(self, keys: set) -> int:
+        return forget_versions(keys)
+
+
+class SnapshotLayer(CacheLayer):
+    name = LAYER_SNAPSHOT
+
+    def entries(self) -> list:
+        info = snapshot_info()
+        if not info:
+            return []
+        # 목록은 다음 실행에서 다시 확인하므로 오래되어도 정리하지 않음
+        return [{"key": info["mods_dir"], "time": info["saved_at"], "stale": False,
+                 "project_id": None, "path": info["mods_dir"]}]
+
+    def remove(self, keys: set) -> int:
+        return 1 if clear_snapshot() else 0
+
+    def disk_bytes(self) -> int:
+        info = snapshot_info()
+        return info["bytes"] if info else 0
+
+
+class StagingLayer(CacheLayer):
+    name = LAYER_STAGING
+
+    def _files(self) -> list:
+        if not STAGING_DIR.exists():
+            return []
+        return [path for path in STAGING_DIR.iterdir() if path.is_file()]
+
+    def entries(self) -> list:
+        now = time.time()
+        result = []
+        for path in self._files():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            result.append({
+                "key": path.name,
+                "time": mtime,
+                # 받다 만 파일이나 오래 쓰이지 않은 파일
+                "stale": path.suffix == ".part" or now - mtime > STAGING_MAX_AGE,
+                "project_id": None,
+                "path": None,
+            })
+        return result
+
+    def remove(self, keys: set) -> int:
+        removed = 0
+        for name in keys:
+            try:
+                (STAGING_DIR / name).unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def disk_bytes(self) -> int:
+        return sum(_file_size(path) for path in self._files())
+
+
+LAYERS = {layer.name: layer for layer in (
+    ModInfoLayer(), JarMetadataLayer(), VersionIndexLayer(), SnapshotLayer(), StagingLayer()
+)}
+
+
+def get_layer(name: str) -> CacheLayer:
+    try:
+        return LAYERS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 캐시: {name}") from None
+
+
+def all_stats(names: list = None) -> list:
+    saved = cache_stats.read_saved()
+    return [get_layer(name).stats(saved) for name in (names or LAYERS)]
+
+
+def compact(names: list = None) -> dict:
+    """{레이어 이름: 지운 수}"""
+    return {name: get_layer(name).compact() for name in (names or LAYERS)}
+
+
+def invalidate(scope: str = SCOPE_ALL, value=None, names: list = None) -> dict:
+    """{레이어 이름: 지운 수}"""
+    return {name: get_layer(name).invalidate(scope, value) for name in (names or LAYERS)}
@@ -0,0 +1,71 @@
+import threading
+
+
+class OperationCancelled(Exception):
+    """CancelToken으로 작업이 취소되었을 때 발생하는 예외."""
+    pass
+
+
+class CancelToken:
+    """
+    여러 스레드가 함께 보는 협력적 취소 신호.
+
+    작업 쪽은 단계 사이마다 raise_if_cancelled()를 부르고, 기다릴 때는 time.sleep 대신 wait()을 써서
+    취소되면 바로 깨어납니다. 진행 중인 HTTP 응답처럼 블로킹된 자원은 on_cancel()로 닫는 함수를 등록해두면
+    cancel() 시점에 호출되어 읽기가 즉시 끝납니다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = {}
+        self._next_id = 0
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"취소 처리 중 오류: {e}")
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled()
+
+    def wait(self, timeout: float) -> bool:
+        """timeout초 동안 기다립니다. 그 사이 취소되면 바로 True를 반환합니다."""
+        return self._event.wait(timeout)
+
+    def should_continue(self) -> bool:
+        """기존 should_continue 콜백 자리에 넘길 수 있는 함수."""
+        return not self._event.is_set()
+
+    def on_cancel(self, callback):
+        """
+        취소될 때 호출할 함수를 등록하고 해제 함수를 반환합니다.
+        이미 취소된 상태면 바로 호출합니다.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = self._next_id
+                self._next_id += 1
+                self._callbacks[handle] = callback
+                return lambda: self._callbacks.pop(handle, None)
+        callback()
+        return lambda: None
+
+
+def check(cancel: CancelToken | None):
+    """cancel이 주어졌고 취소된 상태면 OperationCancelled를 발생시킵니다."""
+    if cancel is not None:
+        cancel.raise_if_cancelled()
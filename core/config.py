@@ -2,6 +2,7 @@
 import json
 from pathlib import Path
 from core.app_path import get_app_data_dir
+from core.fileio import atomic_write, file_lock
 
 CONFIG_FILE_PATH = get_app_data_dir() / "config.json"
 
@@ -16,13 +17,25 @@ def load_config() -> dict:
         return {}
 
 def save_config(config_data: dict):
-    """설정 파일에 저장합니다."""
+    """설정 파일에 저장합니다. (다른 프로세스의 저장과 겹치지 않게 잠그고 원자적으로 교체)"""
     try:
-        with open(CONFIG_FILE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=4)
-    except IOError:
-        # TODO: Log this error
-        pass
+        with file_lock(CONFIG_FILE_PATH):
+            atomic_write(CONFIG_FILE_PATH, json.dumps(config_data, ensure_ascii=False, indent=4))
+    except OSError as e:
+        print(f"설정 저장 실패: {e}")
+
+def update_config(changes: dict):
+    """
+    설정 일부를 바꿉니다. 잠근 상태에서 파일을 다시 읽고 고쳐 쓰므로
+    다른 프로세스가 그 사이 저장한 다른 설정을 덮어쓰지 않습니다.
+    """
+    try:
+        with file_lock(CONFIG_FILE_PATH):
+            config = load_config()
+            config.update(changes)
+            atomic_write(CONFIG_FILE_PATH, json.dumps(config, ensure_ascii=False, indent=4))
+    except OSError as e:
+        print(f"설정 저장 실패: {e}")
 
 def load_selected_version() -> str | None:
     """저장된 마인크래프트 버전을 불러옵니다."""
@@ -31,6 +44,38 @@ def load_selected_version() -> str | None:
 
 def save_selected_version(version: str):
     """선택된 마인크래프트 버전을 저장합니다."""
+    update_config({"selected_mc_version": version})
+
+# 업데이트 미리 받기 기본값
+DEFAULT_PREFETCH_ENABLED = True
+
+# 네트워크 우선순위 클래스별 기본 제한 (kbps: KB/s, rps: 초당 요청 수, 0이면 제한 없음)
+DEFAULT_NETWORK_LIMITS = {
+    "total_kbps": 0,
+    "check": {"kbps": 0, "rps": 10},
+    "download": {"kbps": 0, "rps": 0},
+    "prefetch": {"kbps": 1024, "rps": 2},
+}
+
+def is_prefetch_enabled() -> bool:
+    """업데이트 미리 받기 사용 여부를 불러옵니다."""
+    return bool(load_config().get("prefetch_enabled", DEFAULT_PREFETCH_ENABLED))
+
+def load_network_limits() -> dict:
+    """
+    네트워크 제한 설정을 불러옵니다. 설정 파일의 "network_limits" 값이 기본값을 덮어씁니다.
+    이전 버전의 "prefetch_limit_kbps" 설정도 미리 받기 대역폭 제한으로 인정합니다.
+    """
     config = load_config()
-    config["selected_mc_version"] = version
-    save_config(config)
+    limits = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in DEFAULT_NETWORK_LIMITS.items()
+    }
+    if "prefetch_limit_kbps" in config:
+        limits["prefetch"]["kbps"] = int(config["prefetch_limit_kbps"])
+    for key, value in config.get("network_limits", {}).items():
+        if isinstance(value, dict) and isinstance(limits.get(key), dict):
+            limits[key].update(value)
+        else:
+            limits[key] = value
+    return limits
@@ -0,0 +1,102 @@
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# 여러 프로세스가 같은 데이터 폴더를 쓸 때를 위한 파일 쓰기 도구. (GUI 두 개, GUI + 예약 작업의 CLI 등)
+# - atomic_write: 같은 폴더의 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 온전한 파일을 봅니다.
+# - file_lock: "읽고 고쳐서 다시 쓰기"를 다른 프로세스와 겹치지 않게 합니다.
+
+# 잠금을 기다리는 최대 시간 (초)
+LOCK_TIMEOUT = 10
+LOCK_POLL_INTERVAL = 0.05
+# Windows는 다른 프로세스가 열고 있는 파일을 교체하지 못하므로 잠깐 기다렸다가 다시 시도
+REPLACE_RETRIES = 10
+REPLACE_RETRY_DELAY = 0.05
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _try_lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class LockTimeout(OSError):
+    """다른 프로세스가 잠금을 오래 놓지 않을 때"""
+
+
+@contextlib.contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT):
+    """
+    path 옆의 '<이름>.lock' 파일을 잠급니다. 다른 프로세스(와 같은 프로세스의 다른 스레드)는 풀릴 때까지 기다립니다.
+    timeout 안에 잠그지 못하면 LockTimeout.
+    """
+    lock_path = Path(path).with_name(Path(path).name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _try_lock(fd)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"잠금 대기 시간 초과: {lock_path}") from None
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def _replace(src: str, dst: Path):
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(REPLACE_RETRY_DELAY)
+
+
+def atomic_write(path: Path, data, encoding: str = "utf-8", fsync: bool = False) -> int:
+    """
+    data(bytes 또는 str)를 path에 원자적으로 씁니다. 쓴 바이트 수를 반환합니다.
+    임시 파일 이름은 매번 달라서 여러 프로세스가 동시에 써도 서로의 임시 파일을 덮지 않습니다.
+    :param fsync: 교체 전에 디스크에 내려 씀 (전원이 꺼져도 남아야 하는 파일)
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        _replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return len(data)
@@ -0,0 +1,386 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from core.app_path import get_app_data_dir
+from core.fileio import atomic_write
+from core.modrinth_api import get_versions_by_hashes, get_versions_by_ids
+from core.net import PRIORITY_DOWNLOAD
+from core.staging import STAGING_DIR, file_sha1, stage_download, take_staged
+from core.update_journal import (make_op, make_remove_op, commit_journal, apply_journal, journal_lock,
+                                 remember_staging_dirs)
+
+# 모드 폴더 상태 스냅샷(락파일) 저장 폴더. 인스턴스(모드 폴더)마다 하위 폴더를 만듭니다.
+LOCKFILE_DIR = get_app_data_dir() / "lockfiles"
+LOCKFILE_FORMAT = 1
+# 인스턴스마다 보관할 스냅샷 수
+MAX_LOCKFILES = 30
+
+MOD_SUFFIXES = (".jar", ".jar.disabled")
+
+
+class LockfileError(Exception):
+    """락파일을 읽거나 복원할 수 없을 때 발생하는 예외."""
+    pass
+
+
+# -----------------------------
+# 1. 스냅샷 만들기
+# -----------------------------
+
+def _instance_dir(mods_dir: Path) -> Path:
+    """모드 폴더 경로별 스냅샷 저장 위치."""
+    key = hashlib.sha1(str(Path(mods_dir).absolute()).encode("utf-8")).hexdigest()[:12]
+    return LOCKFILE_DIR / key
+
+
+def _list_mod_files(mods_dir: Path) -> dict:
+    """모드 폴더의 jar 파일들의 {파일 이름: os.stat_result}."""
+    result = {}
+    with os.scandir(mods_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(MOD_SUFFIXES):
+                result[entry.name] = entry.stat()
+    return result
+
+
+def _hash_with_prefilter(mods_dir: Path, stats: dict, previous: dict) -> dict:
+    """
+    크기와 수정 시간이 이전 스냅샷과 같으면 이전 해시를 그대로 쓰고, 다른 파일만 새로 해시합니다.
+    :return: {파일 이름: sha1}
+    """
+    hashes = {}
+    to_hash = []
+    for name, st in stats.items():
+        prev = previous.get(name)
+        if prev and prev.get("size") == st.st_size and prev.get("mtime") == st.st_mtime:
+            hashes[name] = prev["sha1"]
+        else:
+            to_hash.append(name)
+    if to_hash:
+        with ThreadPoolExecutor() as executor:
+            for name, sha1 in zip(to_hash, executor.map(lambda n: file_sha1(mods_dir / n), to_hash)):
+                hashes[name] = sha1
+    return hashes
+
+
+def capture_lockfile(mods_dir: Path, mods: list = None, previous: dict = None) -> dict:
+    """
+    모드 폴더의 현재 상태를 락파일로 만듭니다.
+
+    :param mods: scan_mods 결과. 있으면 Modrinth에서 찾지 못한 파일의 project_id를 보충합니다.
+    :param previous: 이전 락파일. 크기/수정 시간이 같은 파일은 해시와 버전 정보를 재사용합니다.
+    """
+    mods_dir = Path(mods_dir)
+    if previous is None:
+        previous = latest_lockfile(mods_dir)
+    prev_entries = {e["file"]: e for e in (previous or {}).get("entries", [])}
+    # Modrinth에 없던 파일도 포함해 이미 조회한 해시는 다시 묻지 않음
+    prev_by_sha1 = {e["sha1"]: e for e in prev_entries.values()}
+
+    stats = _list_mod_files(mods_dir)
+    hashes = _hash_with_prefilter(mods_dir, stats, prev_entries)
+
+    # 처음 보는 해시만 Modrinth에 한 번에 조회
+    unknown = sorted({h for h in hashes.values() if h not in prev_by_sha1})
+    versions = get_versions_by_hashes(unknown) if unknown else {}
+    scanned_project_ids = {m["file"]: m.get("project_id") for m in (mods or [])}
+
+    entries = []
+    for name in sorted(stats):
+        sha1 = hashes[name]
+        version = versions.get(sha1) or prev_by_sha1.get(sha1) or {}
+        entries.append({
+            "file": name,
+            "sha1": sha1,
+            "size": stats[name].st_size,
+            "mtime": stats[name].st_mtime,
+            "project_id": version.get("project_id") or scanned_project_ids.get(name),
+            # Modrinth 응답은 "id", 이전 락파일 항목은 "version_id"
+            "version_id": version.get("version_id") or version.get("id"),
+            "enabled": not name.endswith(".jar.disabled"),
+        })
+
+    return {
+        "format": LOCKFILE_FORMAT,
+        "mods_dir": str(mods_dir.absolute()),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "entries": entries,
+    }
+
+
+def _same_state(a: dict, b: dict) -> bool:
+    key = lambda lock: [(e["file"], e["sha1"]) for e in lock.get("entries", [])]
+    return key(a) == key(b)
+
+
+def save_lockfile(lock: dict) -> Path:
+    """락파일을 저장하고 오래된 스냅샷을 정리합니다."""
+    directory = _instance_dir(Path(lock["mods_dir"]))
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 1_000_000:06d}.lock.json"
+    atomic_write(path, json.dumps(lock, ensure_ascii=False))
+
+    for old in list_lockfiles(Path(lock["mods_dir"]))[MAX_LOCKFILES:]:
+        old.unlink()
+    return path
+
+
+def record_lockfile(mods_dir: Path, mods: list = None) -> dict | None:
+    """
+    스캔이나 업데이트 후 호출합니다. 모드 폴더 상태가 마지막 스냅샷과 다를 때만 새로 저장합니다.
+    스냅샷 실패가 스캔/업데이트를 막지 않도록 오류는 기록만 합니다.
+    """
+    try:
+        previous = latest_lockfile(mods_dir)
+        lock = capture_lockfile(mods_dir, mods, previous)
+        if previous is None or not _same_state(previous, lock):
+            save_lockfile(lock)
+        return lock
+    except Exception as e:
+        print(f"락파일 기록 실패: {e}")
+        return None
+
+
+def list_lockfiles(mods_dir: Path) -> list:
+    """저장된 스냅샷 경로 목록 (최신순)."""
+    directory = _instance_dir(Path(mods_dir))
+    if not directory.exists():
+        return []
+    return sorted(directory.glob("*.lock.json"), reverse=True)
+
+
+def load_lockfile(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lock = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        raise LockfileError(f"락파일을 읽을 수 없습니다: {path}: {e}")
+    if lock.get("format") != LOCKFILE_FORMAT:
+        raise LockfileError(f"지원하지 않는 락파일 형식입니다: {path}")
+    return lock
+
+
+def latest_lockfile(mods_dir: Path) -> dict | None:
+    for path in list_lockfiles(mods_dir):
+        try:
+            return load_lockfile(path)
+        except LockfileError:
+            continue
+    return None
+
+
+def recorded_hashes(mods_dir: Path, files: list) -> dict:
+    """
+    마지막 락파일에 기록된 해시 중 크기/수정 시간이 그대로인 파일의 {파일 이름: sha1}.
+    (파일을 다시 읽지 않으므로 업데이트 확인처럼 해시가 필요하지만 빨라야 하는 곳에서 씁니다)
+    """
+    mods_dir = Path(mods_dir)
+    entries = {e["file"]: e for e in (latest_lockfile(mods_dir) or {}).get("entries", [])}
+    hashes = {}
+    for name in files:
+        entry = entries.get(name)
+        if not entry:
+            continue
+        try:
+            st = (mods_dir / name).stat()
+        except OSError:
+            continue
+        if entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime:
+            hashes[name] = entry["sha1"]
+    return hashes
+
+
+# -----------------------------
+# 2. 비교
+# -----------------------------
+
+def _identity(entry: dict) -> str:
+    """
+    두 스냅샷에서 '같은 모드'를 맞춰보는 기준.
+    Modrinth 프로젝트면 project_id, 아니면 .disabled를 뗀 파일 이름을 사용합니다.
+    """
+    if entry.get("project_id"):
+        return f"project:{entry['project_id']}"
+    name = entry["file"]
+    if name.endswith(".disabled"):
+        name = name[:-len(".disabled")]
+    return f"file:{name}"
+
+
+def diff_lockfiles(old: dict, new: dict) -> dict:
+    """
+    두 락파일을 비교합니다.
+    :return: {"added": [항목], "removed": [항목], "changed": [(이전, 이후)], "toggled": [(이전, 이후)]}
+    """
+    old_by_id = {_identity(e): e for e in old.get("entries", [])}
+    new_by_id = {_identity(e): e for e in new.get("entries", [])}
+    diff = {"added": [], "removed": [], "changed": [], "toggled": []}
+    for key, entry in new_by_id.items():
+        before = old_by_id.get(key)
+        if before is None:
+            diff["added"].append(entry)
+        elif before["sha1"] != entry["sha1"]:
+            diff["changed"].append((before, entry))
+        elif before["enabled"] != entry["enabled"]:
+            diff["toggled"].append((before, entry))
+    for key, entry in old_by_id.items():
+        if key not in new_by_id:
+            diff["removed"].append(entry)
+    return diff
+
+
+def diff_folder(lock: dict, mods_dir: Path = None) -> dict:
+    """
+    락파일과 현재 모드 폴더를 비교합니다. 크기/수정 시간이 같은 파일은 해시하지 않으므로
+    네트워크 없이 빠르게 끝납니다. 결과 형식은 diff_lockfiles와 같습니다.
+    """
+    mods_dir = Path(mods_dir or lock["mods_dir"])
+    lock_entries = {e["file"]: e for e in lock.get("entries", [])}
+    stats = _list_mod_files(mods_dir)
+    hashes = _hash_with_prefilter(mods_dir, stats, lock_entries)
+    by_sha1 = {e["sha1"]: e for e in lock_entries.values()}
+
+    current = {"entries": []}
+    for name in sorted(stats):
+        known = by_sha1.get(hashes[name], {})
+        current["entries"].append({
+            "file": name,
+            "sha1": hashes[name],
+            "project_id": known.get("project_id"),
+            "version_id": known.get("version_id"),
+            "enabled": not name.endswith(".jar.disabled"),
+        })
+    return diff_lockfiles(lock, current)
+
+
+def is_empty_diff(diff: dict) -> bool:
+    return not any(diff.values())
+
+
+# -----------------------------
+# 3. 복원
+# -----------------------------
+
+def _link_or_copy(src: Path, dst: Path):
+    """같은 드라이브면 하드링크, 아니면 복사. 원본은 건드리지 않습니다."""
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def restore_lockfile(lock: dict, mods_dir: Path = None, should_continue=None) -> dict:
+    """
+    모드 폴더를 락파일 상태로 되돌립니다.
+
+    필요한 파일은 (1) 폴더 안 다른 이름의 같은 파일, (2) 업데이트 백업(.bak), (3) 스테이징 폴더,
+    (4) Modrinth version_id로 다운로드 순서로 찾습니다. 모든 교체는 저널 한 번으로 커밋되므로
+    중간에 종료되어도 다음 실행 때 마저 적용됩니다. 락파일에 없는 모드는 .bak으로 옮겨둡니다.
+
+    :return: {"placed": n, "removed": n, "unchanged": n, "missing": [파일 이름]}
+    """
+    mods_dir = Path(mods_dir or lock["mods_dir"])
+    result = {"placed": 0, "removed": 0, "unchanged": 0, "missing": []}
+
+    # 폴더 안에서 해시로 찾을 수 있는 파일 (현재 파일 + 백업)
+    stats = {}
+    with os.scandir(mods_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(MOD_SUFFIXES + (".bak",)):
+                stats[entry.name] = entry.stat()
+    lock_entries = {e["file"]: e for e in lock.get("entries", [])}
+    hashes = _hash_with_prefilter(mods_dir, stats, lock_entries)
+    local_by_sha1 = {}
+    for name, sha1 in hashes.items():
+        local_by_sha1.setdefault(sha1, mods_dir / name)
+
+    wanted = {e["file"] for e in lock.get("entries", [])}
+    # (원본, 작업) / (스테이징된 다운로드, 작업): .staged로 옮기는 것은 저널 잠금 안에서
+    links = []
+    takes = []
+    to_download = []
+    for entry in lock.get("entries", []):
+        name, sha1 = entry["file"], entry["sha1"]
+        if hashes.get(name) == sha1:
+            result["unchanged"] += 1
+            continue
+        op = make_op(mods_dir, name, name, sha1, None)
+        source = local_by_sha1.get(sha1)
+        staged_source = STAGING_DIR / f"{sha1}.jar"
+        if source is None and staged_source.exists():
+            source = staged_source
+        if source is not None:
+            links.append((source, op))
+        elif entry.get("version_id"):
+            to_download.append((entry, op))
+        else:
+            result["missing"].append(name)
+
+    # 로컬에 없는 파일은 version_id로 한 번에 조회해 병렬로 받음
+    if to_download:
+        versions = {v["id"]: v for v in get_versions_by_ids(sorted({e["version_id"] for e, _ in to_download}))}
+        items = []
+        for entry, op in to_download:
+            version = versions.get(entry["version_id"], {})
+            file_info = next((f for f in version.get("files", []) if f.get("hashes", {}).get("sha1") == entry["sha1"]), None)
+            if not file_info:
+                result["missing"].append(entry["file"])
+                continue
+            items.append(({"download_url": file_info["url"], "latest_sha1": entry["sha1"],
+                           "latest_filename": entry["file"]}, op))
+        def download(item):
+            try:
+                return stage_download(item, PRIORITY_DOWNLOAD, should_continue)
+            except Exception as e:
+                print(f"복원용 다운로드 실패: {item['latest_filename']}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            staged = list(executor.map(download, [item for item, _ in items]))
+        for (item, op), path in zip(items, staged):
+            if path is None:
+                result["missing"].append(Path(op["new"]).name)
+                continue
+            takes.append((item, op))
+
+    if should_continue and not should_continue():
+        raise LockfileError("복원이 중단되었습니다.")
+
+    ops = [make_remove_op(mods_dir, name) for name in stats if name.endswith(MOD_SUFFIXES) and name not in wanted]
+    if links or takes or ops:
+        with journal_lock():
+            remember_staging_dirs([mods_dir])
+            for source, op in links:
+                _link_or_copy(source, Path(op["staged"]))
+            for item, op in takes:
+                take_staged(item, Path(op["staged"]))
+            ops = [op for _, op in links + takes] + ops
+            commit_journal(ops)
+            applied = apply_journal(ops)
+        result["placed"] = sum(1 for op in applied if op.get("kind") != "remove")
+        result["removed"] = sum(1 for op in applied if op.get("kind") == "remove")
+
+    record_lockfile(mods_dir)
+    return result
+
+
+def format_diff(diff: dict) -> list:
+    """비교 결과를 사람이 읽을 수 있는 줄 목록으로 만듭니다."""
+    lines = []
+    for entry in diff["added"]:
+        lines.append(f"+ {entry['file']}")
+    for entry in diff["removed"]:
+        lines.append(f"- {entry['file']}")
+    for before, after in diff["changed"]:
+        lines.append(f"~ {before['file']} -> {after['file']}")
+    for before, after in diff["toggled"]:
+        lines.append(f"{'활성화' if after['enabled'] else '비활성화'}: {after['file']}")
+    return lines
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 import zipfile
 import json
-import requests
-import difflib
 import re
-import toml
 from pathlib import Path
 import time
+from core import net, tracing, cache_stats
+from core.modrinth_api import remember_versions
+from core.cancel import OperationCancelled
+from core.versioning import sort_mc_versions
 from core.mod_info_cache import load_mod_info_cache, save_mod_info_cache, MOD_INFO_CACHE_TTL, load_jar_metadata_cache, save_jar_metadata_cache
 
 MODRINTH = "https://api.modrinth.com/v2"
@@ -43,12 +44,15 @@ def extract_forge_info(jar):
     modid = None
     loader = "forge"
     
+    import toml  # forge 모드를 분석할 때만 필요
+
     try:
         text = jar.read("META-INF/mods.toml").decode(errors="ignore")
 
         # 1. TOML 라이브러리로 분석 시도
         try:
-            data = toml.loads(text)
+            with tracing.span("toml.parse"):
+                data = toml.loads(text)
             if "neoforge" in text.lower():
                 loader = "neoforge"
 
@@ -102,17 +106,19 @@ def extract_mod_info(jar_path, jar_metadata_cache):
     cached_data = jar_metadata_cache.get(cache_key)
     if cached_data:
         # For jar metadata, just matching mtime is sufficient for validity
+        cache_stats.hit(cache_stats.LAYER_JAR_METADATA)
         return cached_data['data']
+    cache_stats.miss(cache_stats.LAYER_JAR_METADATA)
 
     # If not in cache or cache invalid, proceed with extraction
     extracted_info = {}
     try:
-        with zipfile.ZipFile(jar_path) as jar:
+        with tracing.span("jar.parse", file=jar_path.name), zipfile.ZipFile(jar_path) as jar:
             if "fabric.mod.json" in jar.namelist():
                 extracted_info = extract_fabric_info(jar)
             elif "META-INF/mods.toml" in jar.namelist():
                 extracted_info = extract_forge_info(jar)
-    except (zipfile.BadZipFile, json.JSONDecodeError, toml.TomlDecodeError) as e:
+    except (zipfile.BadZipFile, json.JSONDecodeError) as e:
         # Log the error for debugging, but return empty dict
         print(f"Error extracting mod info from {jar_path.name}: {e}")
         extracted_info = {}
@@ -133,18 +139,21 @@ def extract_mod_info(jar_path, jar_metadata_cache):
 # 2. Modrinth 검색 공통
 # -----------------------------
 
-def modrinth_search(query):
+def modrinth_search(query, cancel=None):
     """Modrinth에서 이름/ID로 검색합니다."""
     if not query: return []
     try:
-        r = requests.get(f"{MODRINTH}/search", params={"query": query, "limit": 10}, timeout=10)
+        r = net.get(f"{MODRINTH}/search", params={"query": query, "limit": 10}, cancel=cancel, timeout=10)
         r.raise_for_status()
         return r.json().get("hits", [])
-    except requests.exceptions.RequestException:
+    except net.RequestException:
         return []
 
+@tracing.traced("search.match")
 def pick_best_match(query, hits):
     """검색 결과에서 가장 유사도가 높은 항목을 선택합니다."""
+    import difflib
+
     best = None
     score = 0.0
     for h in hits:
@@ -160,13 +169,13 @@ def pick_best_match(query, hits):
 # 3. project_id → 버전 정보
 # -----------------------------
 
-def get_versions(project_id):
+def get_versions(project_id, cancel=None):
     """프로젝트의 모든 버전 정보를 가져옵니다."""
     try:
-        r = requests.get(f"{MODRINTH}/project/{project_id}/version", timeout=10)
+        r = net.get(f"{MODRINTH}/project/{project_id}/version", cancel=cancel, timeout=10)
         r.raise_for_status()
         return r.json()
-    except requests.exceptions.RequestException:
+    except net.RequestException:
         return []
 
 def extract_loaders_mc_from_versions(versions):
@@ -176,13 +185,14 @@ def extract_loaders_mc_from_versions(versions):
     for v in versions:
         loaders.update(v.get("loaders", []))
         mc_versions.update(v.get("game_versions", []))
-    return sorted(list(loaders)), sorted(list(mc_versions))
+    return sorted(list(loaders)), sort_mc_versions(mc_versions)
 
 # -----------------------------
 # 4. 전체 파이프라인
 # -----------------------------
 
-def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache):
+@tracing.traced("analyze_mod")
+def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache, cancel=None):
     """jar 파일을 분석하여 Modrinth 프로젝트 정보와 모든 버전 목록을 반환합니다."""
     info = extract_mod_info(jar_path, jar_metadata_cache)
     name = info.get("name")
@@ -197,6 +207,7 @@ def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache):
 
     if cached_data and time.time() - cached_data.get('_timestamp', 0) < MOD_INFO_CACHE_TTL:
         # Return cached data if valid
+        cache_stats.hit(cache_stats.LAYER_MOD_INFO)
         return {
             "status": "OK", # Cached data is always considered OK for initial project info
             "project_id": cached_data["project_id"],
@@ -209,12 +220,15 @@ def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache):
         }
 
     # If no valid cached data, proceed with API calls
+    if cached_data:
+        cache_stats.evicted(cache_stats.LAYER_MOD_INFO)  # 유효 기간이 지난 항목
+    cache_stats.miss(cache_stats.LAYER_MOD_INFO)
     project = None
     if name:
-        hits = modrinth_search(name)
+        hits = modrinth_search(name, cancel)
         project = pick_best_match(name, hits)
     if not project and modid:
-        hits = modrinth_search(modid)
+        hits = modrinth_search(modid, cancel)
         project = pick_best_match(modid, hits)
 
     if not project:
@@ -239,7 +253,9 @@ def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache):
             "detection_source": "File Only",
         }
 
-    versions = get_versions(project["project_id"])
+    versions = get_versions(project["project_id"], cancel)
+    # 업데이트 확인에서 다시 요청하지 않도록 버전 목록 색인에 남김
+    remember_versions(project["project_id"], versions)
     all_loaders, all_mc_versions = extract_loaders_mc_from_versions(versions)
 
     # 파일에서 추출한 로더를 우선으로 하되, 없으면 Modrinth 정보 사용
@@ -272,11 +288,14 @@ def analyze_mod(jar_path, jar_metadata_cache, mod_info_cache):
 # 5. 기존 코드와의 호환성을 위한 어댑터
 # -----------------------------
 
-def detect_mc_version_and_name(filename: str, mods_dir: Path, jar_metadata_cache, mod_info_cache):
-    """`mod_scanner.py`에서 호출하는 함수. 결과를 기존 포맷에 맞춰 반환합니다."""
+def detect_mc_version_and_name(filename: str, mods_dir: Path, jar_metadata_cache, mod_info_cache, cancel=None):
+    """
+    `mod_scanner.py`에서 호출하는 함수. 결과를 기존 포맷에 맞춰 반환합니다.
+    cancel이 취소되면 오류 결과 대신 OperationCancelled를 그대로 올려보냅니다. (캐시에도 남기지 않음)
+    """
     jar_path = mods_dir / filename
     try:
-        result = analyze_mod(jar_path, jar_metadata_cache, mod_info_cache)
+        result = analyze_mod(jar_path, jar_metadata_cache, mod_info_cache, cancel)
 
         mod_name = result["mod_name"]
         mc_version = result["mc_version"]
@@ -300,6 +319,8 @@ def detect_mc_version_and_name(filename: str, mods_dir: Path, jar_metadata_cache
         return (mod_name, mc_version, mod_version, project_id, 
                 list(set(loaders)), detection_source, all_mc_versions)
     
+    except OperationCancelled:
+        raise
     except Exception as e:
         # 최종 예외 처리
         return Path(filename).stem, "오류", "오류", None, [], "Error", []
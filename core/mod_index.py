@@ -0,0 +1,101 @@
+# 모드 목록 검색/필터용 인덱스
+
+FACET_ALL = "all"
+FACET_UPDATE = "update"
+FACET_HIGHER = "higher"
+FACET_DISABLED = "disabled"
+FACET_PROBLEM = "problem"
+
+# 화면에 표시할 필터 이름 (표시 순서대로)
+FACET_LABELS = {
+    FACET_ALL: "전체",
+    FACET_UPDATE: "업데이트 가능",
+    FACET_HIGHER: "버전 높음",
+    FACET_DISABLED: "비활성화됨",
+    FACET_PROBLEM: "확인 필요",
+}
+
+_PROBLEM_STATUSES = {"프로젝트 ID 없음", "프로젝트 못찾음", "호환 버전 없음", "API 요청 실패", "API 응답 오류", "업데이트 확인", "확인 취소됨"}
+
+
+def mod_facets(mod: dict) -> frozenset:
+    """모드가 속한 필터 목록."""
+    facets = {FACET_ALL}
+    if not mod.get("enabled", True):
+        facets.add(FACET_DISABLED)
+        return frozenset(facets)
+    status = mod.get("status", "") or ""
+    if status == "업데이트 가능":
+        facets.add(FACET_UPDATE)
+    elif "버전 높음" in status:
+        facets.add(FACET_HIGHER)
+    elif status in _PROBLEM_STATUSES or "오류" in status or "실패" in status:
+        facets.add(FACET_PROBLEM)
+    return frozenset(facets)
+
+
+def _haystack(mod: dict) -> str:
+    """검색 대상 문자열을 미리 소문자로 합쳐둡니다. (이름, 파일, 프로젝트 ID, 로더, 상태)"""
+    parts = [
+        mod.get("mod_name") or "",
+        mod.get("file") or "",
+        mod.get("project_id") or "",
+        " ".join(mod.get("loaders") or []),
+        mod.get("status") or "",
+    ]
+    if not mod.get("enabled", True):
+        parts.append("비활성화됨")
+    return "\0".join(parts).casefold()
+
+
+class ModIndex:
+    """
+    모드 목록 위의 검색 인덱스. 행마다 검색 문자열과 필터를 미리 계산해두고,
+    검색어가 이전 검색어에 글자를 덧붙인 경우(타이핑 중)에는 이전 결과 안에서만 다시 찾습니다.
+    """
+
+    def __init__(self, mods: list = None):
+        self.rebuild(mods or [])
+
+    def rebuild(self, mods: list):
+        self._haystacks = [_haystack(m) for m in mods]
+        self._facets = [mod_facets(m) for m in mods]
+        self._last = None  # (terms, facet, rows)
+
+    def __len__(self):
+        return len(self._haystacks)
+
+    def update_row(self, row: int, mod: dict):
+        """한 행의 정보가 바뀌었을 때 호출합니다."""
+        self._haystacks[row] = _haystack(mod)
+        self._facets[row] = mod_facets(mod)
+        self._last = None
+
+    def matches(self, row: int, query: str, facet: str = FACET_ALL) -> bool:
+        if facet not in self._facets[row]:
+            return False
+        haystack = self._haystacks[row]
+        return all(term in haystack for term in query.casefold().split())
+
+    def search(self, query: str, facet: str = FACET_ALL) -> list:
+        """
+        검색어(공백으로 나눈 모든 단어 포함)와 필터에 맞는 행 번호 목록을 반환합니다.
+        """
+        terms = query.casefold().split()
+        candidates = range(len(self._haystacks))
+        if self._last:
+            last_terms, last_facet, last_rows = self._last
+            # 이전 검색어의 각 단어가 새 단어에 포함되면 결과는 이전 결과의 부분집합
+            if last_facet == facet and len(terms) >= len(last_terms) and all(
+                old in new for old, new in zip(last_terms, terms)
+            ):
+                candidates = last_rows
+
+        haystacks = self._haystacks
+        facets = self._facets
+        rows = [
+            row for row in candidates
+            if facet in facets[row] and all(term in haystacks[row] for term in terms)
+        ]
+        self._last = (terms, facet, rows)
+        return rows
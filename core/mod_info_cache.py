@@ -1,46 +1,74 @@
 import json
 import time
 from pathlib import Path
+from core import tracing, binary_cache
+from core.fileio import file_lock
 from core.app_path import get_app_data_dir
 
 # 캐시 디렉토리 경로
 CACHE_DIR = get_app_data_dir() / "cache"
 # 캐시 파일 경로 (Modrinth API 검색 결과 캐시)
-MOD_INFO_CACHE_FILE = CACHE_DIR / "mod_info_cache.json"
+MOD_INFO_CACHE_FILE = CACHE_DIR / "mod_info_cache.bin"
 # JAR 파일 메타데이터 캐시 경로
-JAR_METADATA_CACHE_FILE = CACHE_DIR / "jar_metadata_cache.json"
+JAR_METADATA_CACHE_FILE = CACHE_DIR / "jar_metadata_cache.bin"
+# 이전 버전의 JSON 캐시 (이진 캐시가 없을 때 한 번 읽고, 이진 캐시를 저장하면 지움)
+LEGACY_CACHE_FILES = {
+    MOD_INFO_CACHE_FILE: CACHE_DIR / "mod_info_cache.json",
+    JAR_METADATA_CACHE_FILE: CACHE_DIR / "jar_metadata_cache.json",
+}
 
 # 캐시 유효 기간 (초) - 예: 1시간
 MOD_INFO_CACHE_TTL = 3600  # 1 hour
 
-def load_mod_info_cache() -> dict:
-    """Modrinth API 검색 결과 캐시를 파일에서 로드합니다."""
-    if not MOD_INFO_CACHE_FILE.exists():
-        return {}
+def _load_legacy(path: Path) -> dict:
     try:
-        with open(MOD_INFO_CACHE_FILE, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+    except (OSError, json.JSONDecodeError):
         return {}
 
+def _load_cache(path: Path, name: str):
+    """캐시를 읽습니다. 항목은 꺼낼 때 풀리므로 파일이 커도 스캔을 바로 시작할 수 있습니다."""
+    legacy = LEGACY_CACHE_FILES[path]
+    if not path.exists():
+        return _load_legacy(legacy) if legacy.exists() else {}
+    with tracing.span("cache.load", cache=name) as span:
+        try:
+            cache = binary_cache.load(path)
+        except (OSError, binary_cache.CacheFormatError) as e:
+            print(f"캐시 읽기 실패 ({name}): {e}")
+            return {}
+        span.set("bytes", path.stat().st_size)
+        span.set("entries", len(cache))
+        return cache
+
+def _save_cache(path: Path, name: str, cache):
+    """
+    다른 프로세스(다른 창, CLI)와 겹치지 않게 잠그고, 그 사이 파일에 추가된 항목은 지우지 않고 합쳐서 저장합니다.
+    """
+    try:
+        with tracing.span("cache.save", cache=name, entries=len(cache)) as span, file_lock(path):
+            try:
+                base = binary_cache.load(path) if path.exists() else None
+            except binary_cache.CacheFormatError:
+                base = None
+            span.set("bytes", binary_cache.dump(cache, path, base))
+        LEGACY_CACHE_FILES[path].unlink(missing_ok=True)
+    except OSError as e:
+        print(f"캐시 저장 실패 ({name}): {e}")
+
+def load_mod_info_cache() -> dict:
+    """Modrinth API 검색 결과 캐시를 파일에서 로드합니다."""
+    return _load_cache(MOD_INFO_CACHE_FILE, "mod_info")
+
 def save_mod_info_cache(cache: dict):
     """Modrinth API 검색 결과 캐시를 파일에 저장합니다."""
-    MOD_INFO_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(MOD_INFO_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=4)
+    _save_cache(MOD_INFO_CACHE_FILE, "mod_info", cache)
 
 def load_jar_metadata_cache() -> dict:
     """JAR 파일 메타데이터 캐시를 파일에서 로드합니다."""
-    if not JAR_METADATA_CACHE_FILE.exists():
-        return {}
-    try:
-        with open(JAR_METADATA_CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
+    return _load_cache(JAR_METADATA_CACHE_FILE, "jar_metadata")
 
 def save_jar_metadata_cache(cache: dict):
     """JAR 파일 메타데이터 캐시를 파일에 저장합니다."""
-    JAR_METADATA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(JAR_METADATA_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=4)
\ No newline at end of file
+    _save_cache(JAR_METADATA_CACHE_FILE, "jar_metadata", cache)
@@ -0,0 +1,232 @@
+from pathlib import Path
+
+from core.scheduler import Job, JOB_SCAN, JOB_IDENTIFY, JOB_CHECK, JOB_DOWNLOAD, JOB_SWAP, DONE
+from core.mod_scanner import identify_mod, finish_scan, resolve_mods_dir, list_mod_files, ModsFolderNotFoundError
+from core.mod_info_cache import load_mod_info_cache, load_jar_metadata_cache
+from core.mod_record import ModRecord
+from core.lockfile import recorded_hashes
+from core.modrinth_api import (check_mod_for_update, get_compatible_version_details, fetch_version_index,
+                               get_latest_versions_by_hashes)
+from core.net import PRIORITY_DOWNLOAD
+from core.staging import stage_download
+from core.update_mod import apply_staged, updated_record
+
+# 확인하지 못하고 취소된 모드의 상태
+CANCELLED_STATUS = "확인 취소됨"
+# 확인을 기다리는 모드의 상태
+CHECKING_STATUS = "확인 중..."
+# 버전을 고르기 전에 시작하는 준비 작업의 그룹 이름
+GROUP_PREWARM = "prewarm"
+
+# 스캔/업데이트 작업을 스케줄러 작업 그래프로 만드는 함수들.
+# GUI와 CLI가 같은 그래프를 제출하고, 끝난 작업의 결과만 각자 방식으로 받습니다.
+
+
+def check_key(mod: dict, target_mc_version: str) -> str:
+    """업데이트 확인 결과를 재사용할 때 쓰는 키. 파일이나 대상 버전이 바뀌면 달라집니다."""
+    return f'{mod["file"]}|{mod["mod_version"]}|{target_mc_version}'
+
+
+def scan_jobs(mods_dir: Path, files: list, group: str = None):
+    """
+    모드 폴더 스캔 작업 그래프: 캐시 읽기(scan) -> 파일별 분석(identify) -> 마무리(scan).
+
+    마무리 작업은 취소되어도 실행되어 끝난 분석 결과를 캐시에 저장하고, 그때까지의 목록을 결과로 냅니다.
+    (전체를 스캔했을 때만 락파일 기록)
+    :return: (identify 작업 목록, 마무리 작업)
+    """
+    caches = {}
+
+    def load_caches(cancel):
+        caches["jar"] = load_jar_metadata_cache()
+        caches["info"] = load_mod_info_cache()
+
+    load = Job(JOB_SCAN, load_caches, group=group, name="캐시 읽기")
+
+    def identify(filename):
+        return lambda cancel: identify_mod(filename, mods_dir, caches["jar"], caches["info"], cancel)
+
+    identifies = [
+        Job(JOB_IDENTIFY, identify(filename), depends_on=[load], group=group, name=filename)
+        for filename in files
+    ]
+
+    def finish(cancel):
+        if load.state != DONE:
+            return []
+        mods = [job.result for job in identifies if job.state == DONE]
+        return finish_scan(mods_dir, mods, caches["jar"], caches["info"], complete=not cancel.cancelled)
+
+    done = Job(JOB_SCAN, finish, depends_on=[load, *identifies], group=group, name="스캔 마무리", always_run=True)
+    return [load, *identifies], done
+
+
+def index_job(identify: Job, group: str = None) -> Job:
+    """identify 작업이 찾은 프로젝트의 전체 버전 목록을 받아 둡니다. (대상 MC 버전과 무관)"""
+    def run(cancel):
+        mod = identify.result if identify.state == DONE else None
+        if mod and mod.get("project_id"):
+            fetch_version_index(mod["project_id"], cancel)
+
+    return Job(JOB_CHECK, run, depends_on=[identify], group=group, name=identify.name)
+
+
+def prewarm_jobs(mods_dir: Path, files: list, group: str = GROUP_PREWARM):
+    """
+    대상 MC 버전과 관계없는 준비 작업 그래프: 스캔(scan_jobs) + 프로젝트별 버전 목록 받기(index_job).
+    버전을 고르는 동안 실행해 두면, 고른 뒤의 업데이트 확인은 받아 둔 목록에서 상태만 계산합니다.
+    :return: (작업 목록, 스캔 마무리 작업, {파일 이름: 버전 목록 작업})
+    """
+    jobs, done = scan_jobs(mods_dir, files, group)
+    index = {job.name: index_job(job, group) for job in jobs if job.kind == JOB_IDENTIFY}
+    return [*jobs, *index.values()], done, index
+
+
+def start_prewarm(scheduler, mods_dir_path: str = None) -> dict | None:
+    """
+    모드 폴더의 준비 작업을 제출합니다. 폴더가 없으면 None.
+    :return: {"mods_dir", "files", "jobs", "done", "index"} (MainWindow가 첫 로딩에서 이어받음)
+    """
+    try:
+        mods_dir = resolve_mods_dir(mods_dir_path)
+        files = list_mod_files(mods_dir)
+    except (ModsFolderNotFoundError, OSError):
+        return None
+    jobs, done, index = prewarm_jobs(mods_dir, files)
+    scheduler.submit_all([*jobs, done])
+    return {"mods_dir": mods_dir, "files": files, "jobs": jobs, "done": done, "index": index}
+
+
+def batch_check_job(mods: list, target_mc_version: str, mods_dir: Path, group: str = None, known: dict = None) -> Job:
+    """
+    버전 목록 색인이 없는 모드들의 최신 호환 버전을 락파일에 기록된 해시로 한 번에 조회하는 작업.
+    결과는 {파일 이름: 최신 호환 버전}이며 check_job(batch=...)이 모드마다 요청하는 대신 사용합니다.
+    (재시작 직후나 CLI의 확인이 모드 수만큼이 아니라 로더 조합 수만큼의 요청으로 끝남)
+    """
+    def run(cancel):
+        pending = [mod for mod in mods if check_key(mod, target_mc_version) not in (known or {})]
+        hashes = recorded_hashes(mods_dir, [mod["file"] for mod in pending]) if pending else {}
+        by_hash = {hashes[mod["file"]]: mod for mod in pending if mod["file"] in hashes}
+        found = get_latest_versions_by_hashes(by_hash, target_mc_version, cancel) if by_hash else {}
+        return {by_hash[sha1]["file"]: version for sha1, version in found.items()}
+
+    return Job(JOB_CHECK, run, group=group, name="일괄 확인")
+
+
+def check_job(mod: dict, target_mc_version: str, group: str = None, depends_on=(), known: dict = None,
+              batch: Job = None) -> Job:
+    """
+    모드 하나의 업데이트 확인 작업. 결과는 상태가 채워진 새 ModRecord입니다. (원본은 바꾸지 않음)
+    :param known: 이전에 확인을 마친 결과 {check_key: mod}. 있으면 요청하지 않고 사용합니다.
+    :param batch: batch_check_job. 이 모드의 최신 버전을 찾았으면 요청하지 않고 사용합니다.
+    """
+    def run(cancel):
+        reused = (known or {}).get(check_key(mod, target_mc_version))
+        if reused:
+            return ModRecord(reused)
+        latest = batch.result.get(mod["file"]) if batch is not None and batch.state == DONE else None
+        record = ModRecord(mod)
+        try:
+            record["status"] = check_mod_for_update(record, target_mc_version, cancel, latest)
+        except Exception as e:
+            cancel.raise_if_cancelled()
+            record["status"] = f"확인 오류: {e}"
+        return record
+
+    if batch is not None:
+        depends_on = [*depends_on, batch]
+    return Job(JOB_CHECK, run, depends_on=depends_on, group=group, name=mod.get("mod_name", ""))
+
+
+def _swap_job(download_jobs: list, mods_dir: Path, group: str, make_record) -> Job:
+    """
+    받기가 끝난 모드들을 한 번의 저널 커밋으로 교체하는 작업.
+    결과: {"applied": [(이전 파일 이름, 새 모드 정보)], "failures": [(모드 이름, 오류 메시지)]}
+    """
+    def run(cancel):
+        ready = []
+        failures = []
+        for job in download_jobs:
+            target = job.result
+            if job.state == DONE and target:
+                ready.append(target)
+            elif job.state == DONE:
+                continue  # 받을 대상이 없음 (호환 버전 없음 등)
+            else:
+                failures.append((job.name, str(job.error or "다운로드가 중단되었습니다.")))
+        if cancel.cancelled or not ready:
+            return {"applied": [], "failures": failures}
+
+        applied = []
+        def on_applied(target):
+            applied.append((target["file"], make_record(target)))
+
+        for target, e in apply_staged(ready, mods_dir, on_applied):
+            failures.append((target["mod_name"], str(e)))
+        return {"applied": applied, "failures": failures}
+
+    return Job(JOB_SWAP, run, depends_on=download_jobs, group=group, name="파일 교체")
+
+
+def _download_job(get_target, group: str, depends_on=(), name: str = "") -> Job:
+    """get_target()이 돌려준 대상의 새 파일을 스테이징합니다. 결과는 대상 (받을 것이 없으면 None)."""
+    def run(cancel):
+        # 선행 작업(호환 버전 확인 등)의 실패는 그대로 전달
+        for dep in depends_on:
+            if dep.error is not None:
+                raise dep.error
+        target = get_target()
+        if not target:
+            return None
+        if stage_download(target, PRIORITY_DOWNLOAD, None, cancel) is None:
+            cancel.raise_if_cancelled()
+            raise RuntimeError("다운로드가 중단되었습니다.")
+        return target
+
+    return Job(JOB_DOWNLOAD, run, depends_on=depends_on, group=group, name=name)
+
+
+def update_jobs(mods: list, mods_dir: Path, group: str = None):
+    """
+    '업데이트 가능' 모드들의 업데이트 작업 그래프: 모드별 다운로드(download) -> 일괄 교체(swap).
+    :return: (download 작업 목록, swap 작업)
+    """
+    downloads = [_download_job(lambda mod=mod: mod, group, name=mod["mod_name"]) for mod in mods]
+    return downloads, _swap_job(downloads, mods_dir, group, updated_record)
+
+
+def optimize_jobs(mods: list, target_mc_version: str, mods_dir: Path, group: str = None):
+    """
+    '버전 높음' 모드들을 대상 MC 버전의 호환 버전으로 바꾸는 작업 그래프:
+    모드별 호환 버전 확인(check) -> 다운로드(download) -> 일괄 교체(swap).
+    :return: (check/download 작업 목록, swap 작업)
+    """
+    jobs = []
+    downloads = []
+    for mod in mods:
+        def resolve(cancel, mod=mod):
+            if not mod.get("project_id") or not mod.get("loaders") or not (mods_dir / mod["file"]).exists():
+                return None
+            details = get_compatible_version_details(mod["project_id"], mod["loaders"], target_mc_version, cancel)
+            if not details or not details["download_url"]:
+                return None
+            # update_mods가 사용하는 형식으로 변환
+            return ModRecord(
+                mod,
+                latest_version=details["version_number"],
+                latest_filename=details["filename"],
+                download_url=details["download_url"],
+                latest_sha1=details.get("sha1"),
+            )
+
+        check = Job(JOB_CHECK, resolve, group=group, name=mod["mod_name"])
+        download = _download_job(lambda check=check: check.result, group, [check], mod["mod_name"])
+        jobs += [check, download]
+        downloads.append(download)
+
+    def make_record(target):
+        record = updated_record(target)
+        record["mc_version"] = target_mc_version
+        return record
+
+    return jobs, _swap_job(downloads, mods_dir, group, make_record)
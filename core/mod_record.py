@@ -0,0 +1,164 @@
+import threading
+from collections.abc import MutableMapping
+
+from core.versioning import mc_version_key
+
+# 모드 목록의 한 줄. 스캔 -> 업데이트 확인 -> 화면/스냅샷/CLI 출력까지 같은 객체가 돌아다닙니다.
+# 딕셔너리처럼 mod["file"], mod.get("status"), dict(mod), {**mod} 로 쓸 수 있지만
+# 정해진 키는 __slots__에 두고, MC 버전/로더 목록은 공용 표에 한 번만 저장한 뒤 비트 집합으로 가리킵니다.
+# (프로젝트마다 수백 개인 MC 버전 문자열 목록을 모드마다 따로 들고 있지 않음)
+
+
+class InternTable:
+    """문자열 <-> 번호 표. 목록은 번호의 비트 집합(int)으로 저장합니다. 여러 스레드에서 써도 됩니다."""
+
+    def __init__(self, sort_key=None):
+        """:param sort_key: decode()가 돌려주는 목록의 정렬 기준 (없으면 문자열 순서)"""
+        self._sort_key = sort_key
+        self._values = []
+        self._index = {}
+        self._lock = threading.Lock()
+
+    def _id(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            with self._lock:
+                index = self._index.get(value)
+                if index is None:
+                    index = len(self._values)
+                    self._values.append(value)
+                    self._index[value] = index
+        return index
+
+    def encode(self, values) -> int:
+        bits = 0
+        for value in values or ():
+            bits |= 1 << self._id(value)
+        return bits
+
+    def decode(self, bits: int) -> list:
+        """비트 집합을 문자열 목록으로. (sort_key 순서)"""
+        values = []
+        while bits:
+            low = bits & -bits
+            values.append(self._values[low.bit_length() - 1])
+            bits ^= low
+        values.sort(key=self._sort_key)
+        return values
+
+    def __len__(self):
+        return len(self._values)
+
+
+GAME_VERSIONS = InternTable(mc_version_key)
+LOADERS = InternTable()
+
+# 슬롯에 그대로 두는 키 (순서는 to_dict()/반복 순서)
+_FIELDS = (
+    "file", "enabled", "mod_name", "mc_version", "mod_version", "project_id", "detection_source",
+    "status", "stale", "latest_version", "latest_filename", "download_url", "latest_sha1",
+)
+# 공용 표의 비트 집합으로 두는 키: {키: (슬롯, 표)}
+_TABLE_FIELDS = {
+    "loaders": ("_loaders", LOADERS),
+    "all_mc_versions": ("_game_versions", GAME_VERSIONS),
+}
+_PLAIN = frozenset(_FIELDS)
+_KEYS = (*_FIELDS[:6], "loaders", "detection_source", "all_mc_versions", *_FIELDS[7:])
+
+
+class ModRecord(MutableMapping):
+    """
+    모드 정보 한 줄. dict처럼 만들고 씁니다: ModRecord({"file": ...}), ModRecord(mod, status="최신 버전")
+    정해지지 않은 키도 넣을 수 있습니다. (따로 보관)
+    """
+    __slots__ = (*_FIELDS, "_loaders", "_game_versions", "_extra")
+
+    def __init__(self, data=None, **fields):
+        if data is not None:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    # --- Mapping ---
+    def __getitem__(self, key):
+        if key in _PLAIN:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        table_field = _TABLE_FIELDS.get(key)
+        if table_field is not None:
+            slot, table = table_field
+            try:
+                return table.decode(getattr(self, slot))
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key in _PLAIN:
+            setattr(self, key, value)
+            return
+        table_field = _TABLE_FIELDS.get(key)
+        if table_field is not None:
+            slot, table = table_field
+            setattr(self, slot, table.encode(value))
+            return
+        try:
+            self._extra[key] = value
+        except AttributeError:
+            self._extra = {key: value}
+
+    def __delitem__(self, key):
+        slot = _TABLE_FIELDS[key][0] if key in _TABLE_FIELDS else key
+        try:
+            if key in _PLAIN or key in _TABLE_FIELDS:
+                delattr(self, slot)
+            else:
+                del self._extra[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        if key in _PLAIN:
+            return hasattr(self, key)
+        if key in _TABLE_FIELDS:
+            return hasattr(self, _TABLE_FIELDS[key][0])
+        return key in getattr(self, "_extra", ())
+
+    def __iter__(self):
+        for key in _KEYS:
+            if key in self:
+                yield key
+        yield from getattr(self, "_extra", ())
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"ModRecord({self.to_dict()!r})"
+
+    # --- dict 호환 ---
+    def update(self, other=(), **fields):
+        if isinstance(other, ModRecord):
+            # 같은 표를 쓰므로 비트 집합을 그대로 복사 (목록으로 풀었다가 다시 만들지 않음)
+            for slot in ModRecord.__slots__[:-1]:
+                try:
+                    setattr(self, slot, getattr(other, slot))
+                except AttributeError:
+                    pass
+            for key, value in getattr(other, "_extra", {}).items():
+                self[key] = value
+            other = ()
+        super().update(other, **fields)
+
+    def copy(self) -> "ModRecord":
+        return ModRecord(self)
+
+    def to_dict(self) -> dict:
+        """JSON 등으로 내보낼 때 쓰는 일반 딕셔너리"""
+        return dict(self.items())
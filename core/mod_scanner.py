@@ -3,6 +3,10 @@ import sys
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.mc_version import detect_mc_version_and_name
+from core.lockfile import record_lockfile
+from core.cancel import OperationCancelled
+from core import tracing
+from core.mod_record import ModRecord
 from core.mod_info_cache import load_mod_info_cache, save_mod_info_cache, load_jar_metadata_cache, save_jar_metadata_cache
 
 class ModsFolderNotFoundError(Exception):
@@ -18,8 +22,8 @@ def get_minecraft_dir() -> Path:
     else:  # Linux and other Unix-like OS
         return Path.home() / ".minecraft"
 
-def scan_mods(mods_dir_path: str = None):
-    """지정된 경로 또는 기본 경로에서 활성화/비활성화된 모드를 모두 스캔합니다."""
+def resolve_mods_dir(mods_dir_path: str = None) -> Path:
+    """스캔할 모드 폴더 경로. 없으면 ModsFolderNotFoundError를 발생시킵니다."""
     if mods_dir_path:
         mods_dir = Path(mods_dir_path)
     else:
@@ -27,56 +31,109 @@ def scan_mods(mods_dir_path: str = None):
     
     if not mods_dir.exists():
         raise ModsFolderNotFoundError(f"모드 폴더를 찾을 수 없습니다: {mods_dir}")
-    
-    mod_files = [f for f in os.listdir(mods_dir) if f.endswith((".jar", ".jar.disabled"))]
+    return mods_dir
+
+def list_mod_files(mods_dir: Path) -> list:
+    return [f for f in os.listdir(mods_dir) if f.endswith((".jar", ".jar.disabled"))]
+
+def identify_mod(filename: str, mods_dir: Path, jar_metadata_cache, mod_info_cache, cancel=None) -> dict:
+    """
+    모드 파일 하나를 분석해 목록에 표시할 정보를 만듭니다. 분석에 실패하면 자리 표시용 정보를 반환합니다.
+    취소되면 OperationCancelled가 그대로 올라갑니다.
+    """
+    is_enabled = not filename.endswith(".jar.disabled")
+    try:
+        (mod_name, mc_version, mod_version, project_id, 
+         loaders, detection_source, all_mc_versions) = detect_mc_version_and_name(
+            filename, mods_dir, jar_metadata_cache, mod_info_cache, cancel)
+        
+        return ModRecord({
+            "file": filename,
+            "enabled": is_enabled,
+            "mod_name": mod_name or Path(filename).stem,
+            "mc_version": mc_version or "-",
+            "mod_version": mod_version or "-",
+            "project_id": project_id,
+            "loaders": loaders,
+            "detection_source": detection_source,
+            "all_mc_versions": all_mc_versions,
+        })
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        # Add a placeholder for failed scans
+        return ModRecord({
+            "file": filename, 
+            "enabled": is_enabled,
+            "mod_name": Path(filename).stem.replace(".jar", ""),
+            "mc_version": "오류", 
+            "mod_version": "오류", 
+            "project_id": None, 
+            "loaders": [],
+            "detection_source": "스캔 오류",
+            "all_mc_versions": [],
+        })
+
+@tracing.traced("finish_scan")
+def finish_scan(mods_dir: Path, installed_mods: list, jar_metadata_cache, mod_info_cache, complete: bool = True) -> list:
+    """
+    캐시를 저장하고 결과를 이름순으로 정렬합니다.
+    :param complete: 폴더 전체를 스캔했으면 True. 이때만 폴더 상태를 락파일로 기록합니다.
+    """
+    # Save caches once at the end
+    save_jar_metadata_cache(jar_metadata_cache)
+    save_mod_info_cache(mod_info_cache)
+
+    # Sort mods by name for consistent order
+    installed_mods.sort(key=lambda x: x['mod_name'].lower())
+
+    # 스캔한 폴더 상태를 락파일로 기록 (바뀐 경우에만 저장, 중간에 취소된 스캔은 제외)
+    if complete:
+        record_lockfile(mods_dir, installed_mods)
+    return installed_mods
+
+@tracing.traced("scan_mods")
+def scan_mods(mods_dir_path: str = None, cancel=None):
+    """
+    지정된 경로 또는 기본 경로에서 활성화/비활성화된 모드를 모두 스캔합니다.
+
+    :param cancel: core.cancel.CancelToken. 취소되면 아직 시작하지 않은 파일은 건너뛰고
+        그때까지 끝난 모드만 반환합니다. 끝난 분석 결과는 캐시에 저장되어 다음 스캔에서 재사용됩니다.
+    """
+    mods_dir = resolve_mods_dir(mods_dir_path)
+    mod_files = list_mod_files(mods_dir)
     installed_mods = []
 
     # Load caches once at the beginning
     jar_metadata_cache = load_jar_metadata_cache()
     mod_info_cache = load_mod_info_cache()
 
+    collected = set()
     with ThreadPoolExecutor() as executor:
-        future_to_filename = {
-            executor.submit(detect_mc_version_and_name, filename, mods_dir, jar_metadata_cache, mod_info_cache): filename 
+        futures = [
+            executor.submit(identify_mod, filename, mods_dir, jar_metadata_cache, mod_info_cache, cancel)
             for filename in mod_files
-        }
+        ]
         
-        for future in as_completed(future_to_filename):
-            filename = future_to_filename[future]
-            is_enabled = not filename.endswith(".jar.disabled")
+        for future in as_completed(futures):
+            collected.add(future)
             try:
-                (mod_name, mc_version, mod_version, project_id, 
-                 loaders, detection_source, all_mc_versions) = future.result()
-                
-                installed_mods.append({
-                    "file": filename,
-                    "enabled": is_enabled,
-                    "mod_name": mod_name or Path(filename).stem,
-                    "mc_version": mc_version or "-",
-                    "mod_version": mod_version or "-",
-                    "project_id": project_id,
-                    "loaders": loaders,
-                    "detection_source": detection_source,
-                    "all_mc_versions": all_mc_versions,
-                })
-            except Exception as e:
-                # Add a placeholder for failed scans
-                installed_mods.append({
-                    "file": filename, 
-                    "enabled": is_enabled,
-                    "mod_name": Path(filename).stem.replace(".jar", ""),
-                    "mc_version": "오류", 
-                    "mod_version": "오류", 
-                    "project_id": None, 
-                    "loaders": [],
-                    "detection_source": "스캔 오류",
-                    "all_mc_versions": [],
-                })
-    
-    # Save caches once at the end
-    save_jar_metadata_cache(jar_metadata_cache)
-    save_mod_info_cache(mod_info_cache)
+                installed_mods.append(future.result())
+            except OperationCancelled:
+                pass
+            if cancel is not None and cancel.cancelled:
+                # 대기 중인 파일은 취소하고, 진행 중인 것은 끊긴 요청과 함께 바로 끝남
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
 
-    # Sort mods by name for consistent order
-    installed_mods.sort(key=lambda x: x['mod_name'].lower())
-    return installed_mods
+    # 취소로 멈췄으면 그사이 끝난 파일의 결과도 남김 (with를 나오면 진행 중이던 파일도 끝난 상태)
+    for future in futures:
+        if future in collected or future.cancelled():
+            continue
+        try:
+            installed_mods.append(future.result())
+        except OperationCancelled:
+            continue
+
+    return finish_scan(mods_dir, installed_mods, jar_metadata_cache, mod_info_cache,
+                       complete=cancel is None or not cancel.cancelled)
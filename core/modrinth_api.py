@@ -1,43 +1,193 @@
-import requests
 import json
-import re
-from packaging.version import parse as parse_version
+import threading
+import time
+from core import net, tracing, cache_stats
+from core.versioning import compare_mod_versions
 
 MODRINTH_API_URL = "https://api.modrinth.com/v2"
 
-def _normalize_version(version_str: str) -> str:
+# 프로젝트별 전체 버전 목록 (대상 MC 버전과 무관). 있으면 업데이트 확인을 요청 없이 계산합니다.
+# {project_id: (받은 시각, [버전, ...])}  버전은 Modrinth가 주는 순서(최신순) 그대로
+_version_index = {}
+_version_index_lock = threading.Lock()
+VERSION_INDEX_TTL = 30 * 60  # 30분
+
+def _primary_file(version_data: dict) -> dict:
+    """버전 정보에서 대표(primary) 파일을 반환합니다. 없으면 첫 번째 파일을 사용합니다."""
+    return next((f for f in version_data['files'] if f['primary']), version_data['files'][0])
+
+def _set_latest_file(mod: dict, version_data: dict):
+    """업데이트에 필요한 최신 파일 정보(파일명, URL, 해시)를 mod 딕셔너리에 기록합니다."""
+    latest_file = _primary_file(version_data)
+    mod["latest_version"] = version_data['version_number']
+    mod['latest_filename'] = latest_file['filename']
+    mod['download_url'] = latest_file['url']
+    mod['latest_sha1'] = latest_file.get('hashes', {}).get('sha1')
+
+def _slim_version(version_data: dict) -> dict:
+    """버전 목록에 남길 항목만 추립니다. (큰 프로젝트는 버전이 수백 개라 설명/변경 내역은 버림)"""
+    return {
+        "version_number": version_data.get("version_number"),
+        "game_versions": version_data.get("game_versions", []),
+        "loaders": version_data.get("loaders", []),
+        "featured": version_data.get("featured", False),
+        "files": [
+            {
+                "primary": f.get("primary", False),
+                "filename": f.get("filename"),
+                "url": f.get("url"),
+                "hashes": {"sha1": f.get("hashes", {}).get("sha1")},
+            }
+            for f in version_data.get("files", [])
+        ],
+    }
+
+def remember_versions(project_id: str, versions: list):
+    """받아 온 프로젝트의 전체 버전 목록을 버전 목록 색인에 넣습니다."""
+    if not project_id or not isinstance(versions, list):
+        return
+    slim = [_slim_version(v) for v in versions if v.get("files")]
+    with _version_index_lock:
+        _version_index[project_id] = (time.time(), slim)
+
+def indexed_versions(project_id: str) -> list | None:
+    """색인에 있는 전체 버전 목록. 없거나 오래되었으면 None."""
+    with _version_index_lock:
+        entry = _version_index.get(project_id)
+    if not entry or time.time() - entry[0] > VERSION_INDEX_TTL:
+        if entry:
+            cache_stats.evicted(cache_stats.LAYER_VERSION_INDEX)
+        cache_stats.miss(cache_stats.LAYER_VERSION_INDEX)
+        return None
+    cache_stats.hit(cache_stats.LAYER_VERSION_INDEX)
+    return entry[1]
+
+def version_index_entries() -> list:
+    """색인에 있는 [(project_id, 받은 시각, 버전 수)] (캐시 통계용)"""
+    with _version_index_lock:
+        return [(pid, fetched_at, len(versions)) for pid, (fetched_at, versions) in _version_index.items()]
+
+def forget_versions(project_ids) -> int:
+    """지정한 프로젝트의 버전 목록을 색인에서 지웁니다. :return: 지운 수"""
+    with _version_index_lock:
+        return sum(1 for pid in project_ids if _version_index.pop(pid, None) is not None)
+
+def clear_version_index():
+    """버전 목록 색인을 비웁니다. (사용자가 새로고침해서 최신 정보를 원할 때)"""
+    with _version_index_lock:
+        _version_index.clear()
+
+def fetch_version_index(project_id: str, cancel=None) -> bool:
+    """
+    프로젝트의 전체 버전 목록을 받아 색인에 넣습니다. 이미 있으면 요청하지 않습니다.
+    대상 MC 버전을 몰라도 받을 수 있으므로 버전을 고르기 전에 미리 실행해 둘 수 있습니다.
+    :return: 색인에 버전 목록이 있으면 True
     """
-    'v2.1-1.20.1' 또는 '5.0+mc1.20.1' 같은 복잡한 버전 문자열에서
-    순수한 버전 번호(예: '2.1', '5.0')를 추출합니다.
+    if indexed_versions(project_id) is not None:
+        return True
+    try:
+        res = net.get(f"{MODRINTH_API_URL}/project/{project_id}/version", cancel=cancel, timeout=15)
+        res.raise_for_status()
+        remember_versions(project_id, res.json())
+        return True
+    except (net.RequestException, json.JSONDecodeError) as e:
+        print(f"버전 목록 받기 실패 ({project_id}): {e}")
+        return False
+
+def _filter_versions(versions: list, loaders: list, game_version: str) -> list:
+    """API의 loaders/game_versions 필터와 같은 결과를 색인에서 계산합니다. (순서 유지)"""
+    return [
+        v for v in versions
+        if game_version in v["game_versions"] and any(loader in loaders for loader in v["loaders"])
+    ]
+
+def _search_loaders(loaders: list) -> list:
+    """Quilt는 Fabric 모드와 호환되므로 검색 시 Fabric도 포함"""
+    search_loaders = list(loaders)
+    if "quilt" in search_loaders and "fabric" not in search_loaders:
+        search_loaders.append("fabric")
+    return search_loaders
+
+def _game_versions_to_check(target_mc_version: str) -> list:
+    """정확한 버전을 먼저, 없으면 주 버전 (1.20.1 -> 1.20)"""
+    major_mc_version = ".".join(target_mc_version.split(".")[:2])
+    return list(dict.fromkeys([target_mc_version, major_mc_version]))
+
+def _has_index(project_id: str) -> bool:
+    """버전 목록 색인이 있는지 (캐시 통계에 세지 않음)"""
+    with _version_index_lock:
+        entry = _version_index.get(project_id)
+    return bool(entry) and time.time() - entry[0] <= VERSION_INDEX_TTL
+
+@tracing.traced("get_latest_versions_by_hashes")
+def get_latest_versions_by_hashes(mods_by_hash: dict, target_mc_version: str, cancel=None) -> dict:
     """
-    if not version_str:
-        return "0"
-    
-    # 0. 'fabric-1.2.3', 'forge-1.0' 같은 접두사 제거
-    normalized = re.sub(r'^(?:fabric|forge|neoforge|quilt)-?', '', version_str, flags=re.IGNORECASE)
+    여러 모드의 최신 호환 버전을 파일 해시로 한 번에 조회합니다. (POST /version_files/update)
+    로더 조합마다 정확한 버전으로 한 번, 못 찾은 해시만 주 버전으로 한 번 더 묻습니다.
+    버전 목록 색인이 있는 프로젝트는 요청 없이 계산할 수 있으므로 빼고 묻습니다.
 
-    # 1. Fabric API 같은 형식('0.140.0+1.21.11')에서 MC 버전을 먼저 제거
-    # '+' 또는 '-' 뒤에 '1.x.x' 또는 '2xwx' 같은 MC 버전 문자열이 오는 경우
-    normalized = re.sub(r'[+-](?=(?:\d{1,2}w\d{2,}|1\.\d{1,2}))', '#', normalized, 1).split('#')[0]
+    :param mods_by_hash: {sha1: mod}
+    :return: {sha1: 최신 호환 버전 정보}. 못 찾은 해시(Modrinth에 없는 파일 포함)는 빠지므로
+             호출한 쪽은 모드별 확인으로 넘어갑니다.
+    """
+    groups = {}
+    for sha1, mod in mods_by_hash.items():
+        project_id, loaders = mod.get("project_id"), mod.get("loaders")
+        if project_id and loaders and not _has_index(project_id):
+            groups.setdefault(tuple(_search_loaders(loaders)), set()).add(sha1)
 
-    # 2. 'mc1.20.4-0.5.4' 같은 형식에서 'mc...' 부분을 제거
-    normalized = re.sub(r'^(?:mc)?\d+\.\d+(?:\.\d+)?-', '', normalized, 1)
+    found = {}
+    for loaders, hashes in groups.items():
+        for gv in _game_versions_to_check(target_mc_version):
+            remaining = sorted(hashes - found.keys())
+            if not remaining:
+                break
+            try:
+                res = net.post(f"{MODRINTH_API_URL}/version_files/update",
+                               json={"hashes": remaining, "algorithm": "sha1",
+                                     "loaders": list(loaders), "game_versions": [gv]},
+                               cancel=cancel, timeout=30)
+                res.raise_for_status()
+                found.update({h: v for h, v in res.json().items() if h in hashes and v.get("files")})
+            except (net.RequestException, json.JSONDecodeError, AttributeError) as e:
+                print(f"일괄 업데이트 확인 실패 (모드별로 확인): {e}")
+                break
+    return found
 
-    # 3. 남은 문자열에서 첫 번째 숫자 시퀀스(버전)를 찾고 그 이후는 버림
-    match = re.search(r'(\d+(?:\.\d+)*)', normalized)
-    if not match:
-        return "0"  # 숫자로 시작하는 버전을 못 찾으면 0으로 처리
-    normalized = match.group(1).rstrip('.')
+def _compatible_versions(project_id: str, search_loaders: list, game_versions_to_check: list, cancel=None) -> list:
+    """호환되는 버전 목록 (최신순). 색인이 있으면 요청 없이 계산합니다."""
+    versions = []
+    index = indexed_versions(project_id)
+    # 1. 정확한 버전(e.g., 1.20.1)으로 먼저 검색, 없으면 주 버전(e.g., 1.20)으로 검색
+    for gv in game_versions_to_check:
+        if index is not None:
+            # 미리 받아 둔 전체 목록에서 계산 (요청 없음)
+            versions = _filter_versions(index, search_loaders, gv)
+            if versions:
+                break
+            continue
+        params = {
+            "loaders": json.dumps(search_loaders),
+            "game_versions": json.dumps([gv])
+        }
+        res = net.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, cancel=cancel, timeout=15)
+        if res.status_code == 404: continue
+        res.raise_for_status()
 
-    # 4. 'v' 또는 'V' 접두사 제거 (이미 정규식으로 처리되었을 수 있지만 안전장치)
-    return normalized.lstrip('vV ')
+        versions = res.json()
+        if versions:
+            break
+    return versions
 
-def check_mod_for_update(mod: dict, target_mc_version: str) -> str:
+@tracing.traced("check_mod_for_update")
+def check_mod_for_update(mod: dict, target_mc_version: str, cancel=None, latest_version: dict = None) -> str:
     """
     Modrinth API를 사용하여 모드의 최신 버전 정보를 확인하고 상태를 반환합니다.
 
     :param mod: 모드 정보를 담은 딕셔너리
     :param target_mc_version: 사용자가 선택한 마인크래프트 버전
+    :param cancel: core.cancel.CancelToken. 취소되면 OperationCancelled가 발생합니다.
+    :param latest_version: get_latest_versions_by_hashes()로 이미 받은 최신 호환 버전. 있으면 요청하지 않습니다.
     :return: "업데이트 가능", "최신 버전", "버전 높음", "호환 버전 없음" 등
     """
     project_id = mod.get("project_id")
@@ -48,31 +198,14 @@ def check_mod_for_update(mod: dict, target_mc_version: str) -> str:
     if not target_mc_version or not loaders:
         return "버전/로더 정보 부족"
 
-    # Quilt는 Fabric 모드와 호환되므로 검색 시 Fabric도 포함
-    search_loaders = list(loaders)
-    if "quilt" in search_loaders and "fabric" not in search_loaders:
-        search_loaders.append("fabric")
-
-    # 1.20.1 -> 1.20 과 같이 주 버전을 추출
-    major_mc_version = ".".join(target_mc_version.split(".")[:2])
-    
-    game_versions_to_check = list(dict.fromkeys([target_mc_version, major_mc_version]))
+    search_loaders = _search_loaders(loaders)
+    game_versions_to_check = _game_versions_to_check(target_mc_version)
 
     try:
-        versions = []
-        # 1. 정확한 버전(e.g., 1.20.1)으로 먼저 검색, 없으면 주 버전(e.g., 1.20)으로 검색
-        for gv in game_versions_to_check:
-            params = {
-                "loaders": json.dumps(search_loaders),
-                "game_versions": json.dumps([gv])
-            }
-            res = requests.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, timeout=15)
-            if res.status_code == 404: continue
-            res.raise_for_status()
-            
-            versions = res.json()
-            if versions:
-                break
+        if latest_version:
+            versions = [latest_version]
+        else:
+            versions = _compatible_versions(project_id, search_loaders, game_versions_to_check, cancel)
 
         if not versions:
             return "호환 버전 없음"
@@ -83,27 +216,16 @@ def check_mod_for_update(mod: dict, target_mc_version: str) -> str:
 
         # 현재 버전을 알 수 없는 경우, 업데이트 가능으로 처리
         if not current_version_str or current_version_str == '-' or current_version_str == '오류':
-            mod["latest_version"] = latest_version_number
-            latest_file = next((f for f in latest_version_data['files'] if f['primary']), latest_version_data['files'][0])
-            mod['latest_filename'] = latest_file['filename']
-            mod['download_url'] = latest_file['url']
+            _set_latest_file(mod, latest_version_data)
             return "업데이트 가능"
 
-        # 버전 비교
+        # 버전 비교 (정규화/파싱 결과는 core.versioning이 기억해 둠)
         try:
-            normalized_latest = _normalize_version(latest_version_number)
-            normalized_current = _normalize_version(current_version_str)
-            
-            latest_version = parse_version(normalized_latest)
-            current_version = parse_version(normalized_current)
-
-            if latest_version > current_version:
-                latest_file = next((f for f in latest_version_data['files'] if f['primary']), latest_version_data['files'][0])
-                mod["latest_version"] = latest_version_number
-                mod['latest_filename'] = latest_file['filename']
-                mod['download_url'] = latest_file['url']
+            order = compare_mod_versions(latest_version_number, current_version_str)
+            if order > 0:
+                _set_latest_file(mod, latest_version_data)
                 return "업데이트 가능"
-            elif latest_version < current_version:
+            elif order < 0:
                 return f"버전 높음" # ({current_version_str} > {latest_version_number})
             else:
                 return "최신 버전"
@@ -114,13 +236,52 @@ def check_mod_for_update(mod: dict, target_mc_version: str) -> str:
                 return "업데이트 확인" # 사용자가 직접 판단하도록 유도
             return "최신 버전"
 
-    except requests.exceptions.RequestException:
+    except net.RequestException:
         return "API 요청 실패"
     except (json.JSONDecodeError, IndexError, KeyError):
         return "API 응답 오류"
 
 
-def get_compatible_version_details(project_id: str, loaders: list, target_mc_version: str) -> dict:
+def get_versions_by_hashes(hashes: list, algorithm: str = "sha1", priority: int = net.PRIORITY_CHECK) -> dict:
+    """
+    파일 해시 목록으로 Modrinth 버전 정보를 한 번의 요청으로 조회합니다.
+
+    :return: {해시: 버전 정보} 딕셔너리. Modrinth에 없는 파일은 포함되지 않습니다.
+    """
+    if not hashes:
+        return {}
+    try:
+        res = net.post(f"{MODRINTH_API_URL}/version_files",
+                       json={"hashes": list(hashes), "algorithm": algorithm},
+                       priority=priority, timeout=30)
+        res.raise_for_status()
+        return res.json()
+    except net.RequestException as e:
+        print(f"Modrinth API 요청 실패: {e}")
+        return {}
+    except json.JSONDecodeError as e:
+        print(f"Modrinth API 응답 처리 오류: {e}")
+        return {}
+
+
+def get_versions_by_ids(version_ids: list, priority: int = net.PRIORITY_DOWNLOAD) -> list:
+    """버전 ID 목록으로 버전 정보를 한 번의 요청으로 가져옵니다."""
+    if not version_ids:
+        return []
+    try:
+        res = net.get(f"{MODRINTH_API_URL}/versions", params={"ids": json.dumps(list(version_ids))},
+                      priority=priority, timeout=30)
+        res.raise_for_status()
+        return res.json()
+    except net.RequestException as e:
+        print(f"Modrinth API 요청 실패: {e}")
+        return []
+    except json.JSONDecodeError as e:
+        print(f"Modrinth API 응답 처리 오류: {e}")
+        return []
+
+
+def get_compatible_version_details(project_id: str, loaders: list, target_mc_version: str, cancel=None) -> dict:
     """
     Modrinth API를 사용하여 주어진 Minecraft 버전에 호환되는 모드의 최신 버전 상세 정보를 가져옵니다.
 
@@ -148,7 +309,7 @@ def get_compatible_version_details(project_id: str, loaders: list, target_mc_ver
                 "game_versions": json.dumps([gv]),
                 "featured": "true" # Prioritize featured versions
             }
-            res = requests.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, timeout=15)
+            res = net.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, priority=net.PRIORITY_DOWNLOAD, cancel=cancel, timeout=15)
             if res.status_code == 404: continue
             res.raise_for_status()
             
@@ -171,15 +332,16 @@ def get_compatible_version_details(project_id: str, loaders: list, target_mc_ver
         if not best_version_found:
             return {}
 
-        latest_file = next((f for f in best_version_found['files'] if f['primary']), best_version_found['files'][0])
+        latest_file = _primary_file(best_version_found)
         
         return {
             "version_number": best_version_found['version_number'],
             "filename": latest_file['filename'],
-            "download_url": latest_file['url']
+            "download_url": latest_file['url'],
+            "sha1": latest_file.get('hashes', {}).get('sha1'),
         }
 
-    except requests.exceptions.RequestException as e:
+    except net.RequestException as e:
         print(f"Modrinth API 요청 실패: {e}")
         return {}
     except (json.JSONDecodeError, IndexError, KeyError) as e:
@@ -195,10 +357,10 @@ def _fetch_versions_from_modrinth(project_id: str, loaders: list, game_versions:
             "game_versions": json.dumps(game_versions),
             "featured": str(featured).lower()
         }
-        res = requests.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, timeout=15)
+        res = net.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, timeout=15)
         res.raise_for_status()
         return res.json()
-    except requests.exceptions.RequestException as e:
+    except net.RequestException as e:
         print(f"API 요청 실패 (params: {params}): {e}")
         return []
     except json.JSONDecodeError:
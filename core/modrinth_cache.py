@@ -1,23 +1,86 @@
 import json
 import time
 from pathlib import Path
+from core import tracing, cache_stats
 from core.app_path import get_app_data_dir
+from core.fileio import atomic_write
+from core.mod_record import ModRecord
 
 # 데이터 폴더 가져오기
 APP_DATA_DIR = get_app_data_dir()
-CACHE_FILE = APP_DATA_DIR / "modrinth.json"
-CACHE_TTL = 60 * 60 * 6  # 6시간
+# 마지막으로 확인을 마친 모드 목록 (다음 실행 때 바로 보여주고 뒤에서 다시 확인)
+SNAPSHOT_FILE = APP_DATA_DIR / "last_scan.json"
+SNAPSHOT_FORMAT = 1
 
+# 화면에만 쓰는 표시는 저장하지 않음
+_TRANSIENT_KEYS = ("stale",)
 
-def load_cache():
-    """
-    캐시를 비활성화하기 위해 항상 빈 딕셔너리를 반환합니다.
-    """
-    return {}
 
+def save_snapshot(mods_dir: Path, mc_version: str, mods: list):
+    """확인을 마친 모드 목록을 저장합니다. (원자적으로 교체)"""
+    data = {
+        "format": SNAPSHOT_FORMAT,
+        "mods_dir": str(Path(mods_dir).resolve()),
+        "mc_version": mc_version,
+        "saved_at": time.time(),
+        "mods": [{k: v for k, v in mod.items() if k not in _TRANSIENT_KEYS} for mod in mods],
+    }
+    try:
+        with tracing.span("cache.save", cache="snapshot", entries=len(mods)) as span:
+            span.set("bytes", atomic_write(SNAPSHOT_FILE, json.dumps(data, ensure_ascii=False)))
+    except OSError as e:
+        print(f"모드 목록 저장 실패: {e}")
 
-def save_cache(mods: dict):
+
+def load_snapshot(mods_dir: Path, mc_version: str) -> list | None:
     """
-    캐시를 비활성화하기 위해 아무 작업도 수행하지 않습니다.
+    같은 모드 폴더와 대상 버전으로 저장된 목록을 불러옵니다. 없거나 다르면 None.
+    상태는 지난 실행의 것이므로 다시 확인하기 전까지는 '오래된' 정보로 다뤄야 합니다.
     """
-    pass
+    if not SNAPSHOT_FILE.exists():
+        cache_stats.miss(cache_stats.LAYER_SNAPSHOT)
+        return None
+    try:
+        with tracing.span("cache.load", cache="snapshot") as span, open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            span.set("bytes", f.tell())
+    except (OSError, json.JSONDecodeError):
+        cache_stats.miss(cache_stats.LAYER_SNAPSHOT)
+        return None
+    if (data.get("format") != SNAPSHOT_FORMAT
+            or data.get("mods_dir") != str(Path(mods_dir).resolve())
+            or data.get("mc_version") != mc_version
+            or not data.get("mods")):
+        cache_stats.miss(cache_stats.LAYER_SNAPSHOT)
+        return None
+    cache_stats.hit(cache_stats.LAYER_SNAPSHOT)
+    return [ModRecord(mod) for mod in data["mods"]]
+
+
+def snapshot_info() -> dict | None:
+    """저장된 목록의 요약 {"mods_dir", "mc_version", "saved_at", "count", "bytes"}. 없으면 None."""
+    try:
+        with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        size = SNAPSHOT_FILE.stat().st_size
+    except (OSError, json.JSONDecodeError):
+        return None
+    return {
+        "mods_dir": data.get("mods_dir"),
+        "mc_version": data.get("mc_version"),
+        "saved_at": data.get("saved_at", 0),
+        "count": len(data.get("mods") or []),
+        "bytes": size,
+    }
+
+
+def clear_snapshot() -> bool:
+    """저장된 목록을 지웁니다. :return: 지웠으면 True"""
+    try:
+        SNAPSHOT_FILE.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        print(f"모드 목록 삭제 실패: {e}")
+        return False
@@ -0,0 +1,339 @@
+import hashlib
+import io
+import json
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+
+from core.lockfile import record_lockfile
+from core.modrinth_api import get_versions_by_hashes
+from core.net import PRIORITY_DOWNLOAD
+from core.staging import stage_download, take_staged, file_sha1, CHUNK_SIZE
+from core.update_journal import make_op, commit_journal, apply_journal, journal_lock, remember_staging_dirs
+
+INDEX_NAME = "modrinth.index.json"
+OVERRIDE_DIRS = ("overrides/", "client-overrides/")
+
+# 가져오기 시 동시에 진행할 다운로드 수
+IMPORT_WORKERS = 8
+
+# 버전 폴더 이름에서 로더와 로더 버전을 찾는 패턴
+# e.g. "fabric-loader-0.15.7-1.20.4", "1.20.1-forge-47.2.0", "neoforge-20.4.80", "quilt-loader-0.23.1-1.20.4"
+_LOADER_PATTERNS = [
+    (re.compile(r"fabric-loader-([\w.+]+)-"), "fabric-loader"),
+    (re.compile(r"quilt-loader-([\w.+]+)-"), "quilt-loader"),
+    (re.compile(r"neoforge-([\w.+]+)"), "neoforge"),
+    (re.compile(r"forge-([\w.+]+)"), "forge"),
+]
+_MC_VERSION_PATTERN = re.compile(r"(?<![\w.])(1\.\d+(?:\.\d+)?|\d{2}w\d{2}[a-z])(?![\w.])")
+
+
+class MrpackError(Exception):
+    """.mrpack 파일을 읽거나 쓸 수 없을 때 발생하는 예외."""
+    pass
+
+
+# -----------------------------
+# 1. 내보내기
+# -----------------------------
+
+def _file_hashes(path: Path) -> tuple[str, str]:
+    """파일을 한 번 읽어 sha1, sha512 해시를 함께 계산합니다."""
+    sha1 = hashlib.sha1()
+    sha512 = hashlib.sha512()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha1.update(chunk)
+            sha512.update(chunk)
+    return sha1.hexdigest(), sha512.hexdigest()
+
+
+def pack_dependencies(mc_version_name: str) -> dict:
+    """선택된 버전 폴더 이름에서 mrpack의 dependencies 항목을 만듭니다."""
+    dependencies = {}
+    match = _MC_VERSION_PATTERN.search(mc_version_name)
+    dependencies["minecraft"] = match.group(1) if match else mc_version_name
+    for pattern, loader in _LOADER_PATTERNS:
+        match = pattern.search(mc_version_name)
+        if match:
+            dependencies[loader] = match.group(1)
+            break
+    return dependencies
+
+
+def export_mrpack(mods: list, mods_dir: Path, out_path: Path, mc_version_name: str, pack_name: str = None) -> dict:
+    """
+    스캔 결과를 Modrinth .mrpack 파일로 내보냅니다.
+    Modrinth에 있는 파일은 해시와 다운로드 URL로, 없는 파일은 overrides/mods/ 에 그대로 담습니다.
+    비활성화된 모드는 제외합니다.
+
+    :return: {"linked": Modrinth 링크 수, "embedded": overrides에 담은 파일 수}
+    """
+    mods_dir = Path(mods_dir)
+    jar_paths = [mods_dir / m["file"] for m in mods if m.get("enabled", True) and (mods_dir / m["file"]).is_file()]
+
+    with ThreadPoolExecutor() as executor:
+        hashes = dict(zip(jar_paths, executor.map(_file_hashes, jar_paths)))
+
+    # 해시로 한 번에 조회 (모드 수와 관계없이 요청 1회)
+    versions = get_versions_by_hashes([sha1 for sha1, _ in hashes.values()])
+
+    files = []
+    embedded = []
+    for path, (sha1, sha512) in hashes.items():
+        version = versions.get(sha1)
+        file_info = None
+        if version:
+            file_info = next((f for f in version.get("files", []) if f.get("hashes", {}).get("sha1") == sha1), None)
+        if not file_info:
+            embedded.append(path)
+            continue
+        files.append({
+            "path": f"mods/{path.name}",
+            "hashes": {"sha1": sha1, "sha512": sha512},
+            "env": {"client": "required", "server": "required"},
+            "downloads": [file_info["url"]],
+            "fileSize": path.stat().st_size,
+        })
+
+    index = {
+        "formatVersion": 1,
+        "game": "minecraft",
+        "versionId": "1.0.0",
+        "name": pack_name or Path(out_path).stem,
+        "files": files,
+        "dependencies": pack_dependencies(mc_version_name),
+    }
+
+    tmp_path = Path(out_path).with_name(Path(out_path).name + ".tmp")
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(INDEX_NAME, json.dumps(index, ensure_ascii=False, indent=1))
+        for path in embedded:
+            # jar는 이미 압축되어 있으므로 다시 압축하지 않음
+            zf.write(path, f"overrides/mods/{path.name}", compress_type=zipfile.ZIP_STORED)
+    os.replace(tmp_path, out_path)
+
+    return {"linked": len(files), "embedded": len(embedded)}
+
+
+# -----------------------------
+# 2. 가져오기
+# -----------------------------
+
+def _iter_index(stream, read_size: int = 64 * 1024):
+    """
+    modrinth.index.json을 스트리밍으로 파싱합니다.
+    최상위 키는 (키, 값)으로, "files" 배열은 항목 하나씩 ("files", 항목)으로 내보냅니다.
+    수천 개의 파일이 담긴 인덱스도 전체를 메모리에 올리지 않고 처리합니다.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = stream.read(read_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    def expect(char):
+        nonlocal pos
+        skip_ws()
+        if pos >= len(buf) or buf[pos] != char:
+            raise MrpackError(f"잘못된 인덱스 형식: '{char}'이(가) 필요합니다.")
+        pos += 1
+
+    def peek():
+        skip_ws()
+        return buf[pos] if pos < len(buf) else ""
+
+    def decode_value():
+        nonlocal pos
+        while True:
+            skip_ws()
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # 숫자/리터럴은 버퍼 끝에서 잘렸을 수 있으므로 더 읽어 다시 확인
+                if end < len(buf) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise MrpackError("인덱스 파일이 손상되었습니다.")
+            fill()
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        key = decode_value()
+        expect(":")
+        if key == "files" and peek() == "[":
+            expect("[")
+            if peek() != "]":
+                while True:
+                    yield "files", decode_value()
+                    if peek() == ",":
+                        expect(",")
+                        continue
+                    break
+            expect("]")
+        else:
+            yield key, decode_value()
+        if peek() == ",":
+            expect(",")
+            continue
+        expect("}")
+        return
+
+
+def _safe_target(base_dir: Path, rel_path: str) -> Path | None:
+    """
+    팩 안의 상대 경로를 base_dir 아래 경로로 바꿉니다. 폴더 밖을 가리키면 None.
+    팩 경로는 항상 "/"로 구분하므로 "\\"나 ":"(드라이브 문자)가 있으면 거부합니다.
+    (Windows에서는 "mods\\..\\..\\x"가 한 조각으로 검사를 통과한 뒤 나뉘어 폴더 밖을 가리킴)
+    """
+    if not rel_path or "\\" in rel_path or ":" in rel_path:
+        return None
+    rel = PurePosixPath(rel_path)
+    if rel.is_absolute() or ".." in rel.parts or not rel.parts:
+        return None
+    target = base_dir.joinpath(*rel.parts)
+    # 심볼릭 링크 등으로 밖을 가리키는 경우까지 실제 위치로 확인
+    if not target.resolve().is_relative_to(base_dir.resolve()):
+        return None
+    return target
+
+
+def _local_sha1_index(directory: Path) -> set:
+    """폴더 안 jar 파일들의 sha1 집합. 이미 있는 파일을 다시 받지 않기 위해 사용합니다."""
+    if not directory.exists():
+        return set()
+    paths = [p for p in directory.iterdir() if p.is_file() and p.name.endswith((".jar", ".jar.disabled"))]
+    with ThreadPoolExecutor() as executor:
+        return set(executor.map(file_sha1, paths))
+
+
+def read_mrpack_info(pack_path: Path) -> dict:
+    """팩의 이름, 의존성, 파일 수만 빠르게 읽습니다."""
+    info = {"files": 0}
+    with zipfile.ZipFile(pack_path) as zf:
+        if INDEX_NAME not in zf.namelist():
+            raise MrpackError(f"{INDEX_NAME}이(가) 없는 팩입니다.")
+        with zf.open(INDEX_NAME) as raw:
+            for key, value in _iter_index(io.TextIOWrapper(raw, encoding="utf-8")):
+                if key == "files":
+                    info["files"] += 1
+                else:
+                    info[key] = value
+    return info
+
+
+def import_mrpack(pack_path: Path, mods_dir: Path, on_progress=None, should_continue=None, cancel=None) -> dict:
+    """
+    .mrpack을 mods 폴더(의 상위 인스턴스 폴더)에 설치합니다.
+
+    파일은 스테이징 폴더를 거쳐 병렬로 받아 sha1을 확인하고, 저널 커밋 후 한 번에 배치합니다.
+    이미 같은 해시의 파일이 mods 폴더에 있으면 받지 않습니다.
+
+    :param on_progress: (완료 수, 전체 수, 파일 경로)로 호출됩니다.
+    :return: {"installed": n, "skipped": n, "overrides": n, "failed": [(경로, 오류 메시지)], "dependencies": {...}}
+    """
+    mods_dir = Path(mods_dir)
+    instance_dir = mods_dir.parent
+    local_hashes = _local_sha1_index(mods_dir)
+    result = {"installed": 0, "skipped": 0, "overrides": 0, "failed": [], "dependencies": {}}
+
+    with zipfile.ZipFile(pack_path) as zf:
+        names = zf.namelist()
+        if INDEX_NAME not in names:
+            raise MrpackError(f"{INDEX_NAME}이(가) 없는 팩입니다.")
+
+        # 1. 인덱스를 읽으면서 바로 다운로드를 시작
+        with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as executor, zf.open(INDEX_NAME) as raw:
+            future_to_target = {}
+            for key, value in _iter_index(io.TextIOWrapper(raw, encoding="utf-8")):
+                if key == "dependencies":
+                    result["dependencies"] = value
+                if key != "files":
+                    continue
+                entry = value
+                if entry.get("env", {}).get("client") == "unsupported":
+                    continue
+                target = _safe_target(instance_dir, entry.get("path", ""))
+                sha1 = entry.get("hashes", {}).get("sha1")
+                if target is None or not entry.get("downloads"):
+                    result["failed"].append((entry.get("path"), "잘못된 경로 또는 다운로드 주소 없음"))
+                    continue
+                if sha1 and (sha1 in local_hashes or (target.exists() and file_sha1(target) == sha1)):
+                    result["skipped"] += 1
+                    continue
+                item = {
+                    "file": target.name,
+                    "mod_name": target.name,
+                    "latest_filename": target.name,
+                    "download_url": entry["downloads"][0],
+                    "latest_sha1": sha1,
+                }
+                future_to_target[executor.submit(stage_download, item, PRIORITY_DOWNLOAD, should_continue, cancel)] = (target, item)
+
+            total = len(future_to_target)
+            ready = []
+            for done, future in enumerate(as_completed(future_to_target), 1):
+                target, item = future_to_target[future]
+                try:
+                    if future.result() is None:
+                        raise RuntimeError("다운로드가 중단되었습니다.")
+                    ready.append((target, item))
+                except Exception as e:
+                    result["failed"].append((str(target.relative_to(instance_dir)), str(e)))
+                if on_progress:
+                    on_progress(done, total, target.name)
+
+        if (should_continue and not should_continue()) or (cancel and cancel.cancelled):
+            return result
+
+        # 2. overrides 풀기 (팩이 직접 담고 있는 파일)
+        for name in names:
+            prefix = next((p for p in OVERRIDE_DIRS if name.startswith(p)), None)
+            if not prefix or name.endswith("/"):
+                continue
+            target = _safe_target(instance_dir, name[len(prefix):])
+            if target is None:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(target.name + ".tmp")
+            with zf.open(name) as src, open(tmp_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    dst.write(chunk)
+            os.replace(tmp_path, target)
+            result["overrides"] += 1
+
+    # 3. 받은 파일을 저널로 한 번에 배치
+    if ready:
+        with journal_lock():
+            remember_staging_dirs({target.parent for target, _ in ready})
+            ops = []
+            for target, item in ready:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                op = make_op(target.parent, target.name, target.name, item["latest_sha1"])
+                take_staged(item, Path(op["staged"]))
+                ops.append(op)
+            commit_journal(ops)
+            result["installed"] = len(apply_journal(ops))
+    record_lockfile(mods_dir)
+    return result
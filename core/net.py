@@ -0,0 +1,277 @@
+import hashlib
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+from core import tracing
+from core.config import load_network_limits
+from core.cancel import OperationCancelled, check
+
+# 우선순위 클래스 (숫자가 작을수록 높음)
+PRIORITY_CHECK = 0      # 사용자가 기다리는 업데이트 확인/검색
+PRIORITY_DOWNLOAD = 1   # 사용자가 누른 업데이트/최적화 다운로드
+PRIORITY_PREFETCH = 2   # 백그라운드 미리 받기
+
+PRIORITY_NAMES = {
+    PRIORITY_CHECK: "check",
+    PRIORITY_DOWNLOAD: "download",
+    PRIORITY_PREFETCH: "prefetch",
+}
+
+# 상위 클래스 작업이 진행 중이면 양보하는 백그라운드 클래스
+BACKGROUND_PRIORITIES = {PRIORITY_PREFETCH}
+
+CHUNK_SIZE = 64 * 1024
+# 429 응답 시 최대 재시도 횟수
+MAX_RATE_LIMIT_RETRIES = 2
+
+
+class TokenBucket:
+    """초당 rate 만큼 채워지는 토큰 버킷. 토큰이 모자라면 호출한 스레드를 재웁니다."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate  # 최대 1초 분량까지 몰아서 사용 가능
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: float, cancel=None):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # 먼저 예약해두고 잠은 락 밖에서 자서 다른 스레드를 막지 않음
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            _sleep(wait, cancel)
+
+
+def _sleep(seconds: float, cancel=None):
+    """취소 신호가 있으면 취소 즉시 깨어나는 sleep."""
+    if cancel is None:
+        time.sleep(seconds)
+    elif cancel.wait(seconds):
+        raise OperationCancelled()
+
+
+class _Governor:
+    """우선순위 클래스별 요청 수/대역폭 제한과 전체 대역폭 제한을 관리합니다."""
+
+    def __init__(self, limits: dict):
+        self._cond = threading.Condition()
+        self._active = {p: 0 for p in PRIORITY_NAMES}
+        self._byte_buckets = {}
+        self._request_buckets = {}
+        for priority, name in PRIORITY_NAMES.items():
+            class_limits = limits.get(name, {})
+            if class_limits.get("kbps"):
+                self._byte_buckets[priority] = TokenBucket(class_limits["kbps"] * 1024)
+            if class_limits.get("rps"):
+                self._request_buckets[priority] = TokenBucket(class_limits["rps"])
+        total_kbps = limits.get("total_kbps")
+        self._total_bucket = TokenBucket(total_kbps * 1024) if total_kbps else None
+
+    @contextmanager
+    def active(self, priority: int):
+        with self._cond:
+            self._active[priority] += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active[priority] -= 1
+                self._cond.notify_all()
+
+    def wait_turn(self, priority: int, cancel=None):
+        """백그라운드 클래스는 상위 클래스 작업이 모두 끝날 때까지 기다립니다."""
+        if priority not in BACKGROUND_PRIORITIES:
+            return
+        with self._cond:
+            while any(self._active[p] for p in PRIORITY_NAMES if p < priority):
+                check(cancel)
+                self._cond.wait(0.5)
+
+    def before_request(self, priority: int, cancel=None):
+        self.wait_turn(priority, cancel)
+        bucket = self._request_buckets.get(priority)
+        if bucket:
+            bucket.consume(1, cancel)
+
+    def on_bytes(self, priority: int, amount: int, cancel=None):
+        self.wait_turn(priority, cancel)
+        bucket = self._byte_buckets.get(priority)
+        if bucket:
+            bucket.consume(amount, cancel)
+        if self._total_bucket:
+            self._total_bucket.consume(amount, cancel)
+
+
+_session = None
+_governor = None
+_init_lock = threading.Lock()
+
+
+def __getattr__(name):
+    # requests는 가져오는 데 시간이 오래 걸리므로 첫 요청 때 가져옴 (시작 시간 단축)
+    # 다른 모듈은 except net.RequestException: 처럼 예외 클래스를 여기서 꺼내 씁니다.
+    if name == "RequestException":
+        import requests
+        return requests.exceptions.RequestException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_session() -> "requests.Session":
+    global _session
+    with _init_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _get_governor() -> _Governor:
+    global _governor
+    with _init_lock:
+        if _governor is None:
+            _governor = _Governor(load_network_limits())
+        return _governor
+
+
+def reload_limits():
+    """설정이 바뀌었을 때 제한 값을 다시 읽습니다."""
+    global _governor
+    with _init_lock:
+        _governor = None
+
+
+def _retry_after(res: "requests.Response") -> float:
+    """429 응답에서 다시 시도하기까지 기다릴 시간(초)을 구합니다."""
+    for header in ("Retry-After", "X-Ratelimit-Reset"):
+        value = res.headers.get(header)
+        if value:
+            try:
+                return min(float(value), 60.0)
+            except ValueError:
+                pass
+    return 1.0
+
+
+def _abort(res: "requests.Response"):
+    """
+    다른 스레드에서 읽고 있는 응답을 끊습니다. 소켓을 닫기만 하면 블로킹된 recv가 깨어나지 않으므로
+    먼저 shutdown 합니다.
+    """
+    connection = getattr(res.raw, "_connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    res.close()
+
+
+def _send(session: "requests.Session", method: str, url: str, cancel, **kwargs) -> "requests.Response":
+    """
+    요청을 보냅니다. cancel이 있으면 본문을 직접 읽으면서 취소 시 응답을 끊습니다.
+    (연결/헤더 대기 중에는 끊을 수 없으므로 그 구간은 timeout이 상한)
+    """
+    if cancel is None:
+        return session.request(method, url, **kwargs)
+    stream = kwargs.pop("stream", False)
+    res = session.request(method, url, stream=True, **kwargs)
+    if stream:
+        return res
+    release = cancel.on_cancel(lambda: _abort(res))
+    try:
+        res.content  # 본문 읽기
+    except Exception:
+        if cancel.cancelled:
+            raise OperationCancelled()
+        raise
+    finally:
+        release()
+    check(cancel)
+    return res
+
+
+def _request(method: str, url: str, priority: int, cancel=None, **kwargs) -> "requests.Response":
+    governor = _get_governor()
+    session = _get_session()
+    with tracing.span("http", method=method, url=url, priority=PRIORITY_NAMES.get(priority, priority)) as s:
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            check(cancel)
+            governor.before_request(priority, cancel)
+            with governor.active(priority):
+                res = _send(session, method, url, cancel, **kwargs)
+            if res.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            res.close()
+            _sleep(_retry_after(res), cancel)
+        s.set("status", res.status_code)
+        if attempt:
+            s.set("retries", attempt)
+        if not kwargs.get("stream"):
+            s.set("bytes", len(res.content))
+    return res
+
+
+def get(url: str, priority: int = PRIORITY_CHECK, cancel=None, **kwargs) -> "requests.Response":
+    """
+    공용 HTTP 경로를 통한 GET 요청. requests.get과 같은 인자를 받습니다.
+    cancel(core.cancel.CancelToken)이 취소되면 진행 중인 요청도 끊고 OperationCancelled를 발생시킵니다.
+    """
+    kwargs.setdefault("timeout", 15)
+    return _request("GET", url, priority, cancel, **kwargs)
+
+
+def post(url: str, priority: int = PRIORITY_CHECK, cancel=None, **kwargs) -> "requests.Response":
+    """공용 HTTP 경로를 통한 POST 요청."""
+    kwargs.setdefault("timeout", 15)
+    return _request("POST", url, priority, cancel, **kwargs)
+
+
+def download_to_file(url: str, dest_path, priority: int = PRIORITY_DOWNLOAD, should_continue=None,
+                     cancel=None) -> str | None:
+    """
+    url의 내용을 dest_path에 스트리밍으로 저장하고 sha1 해시를 반환합니다.
+    우선순위 클래스의 대역폭 제한을 청크 단위로 적용합니다.
+
+    :param should_continue: 청크마다 호출되는 함수. False를 반환하면 중단하고 None을 반환합니다.
+    :param cancel: 취소되면 받고 있던 응답을 바로 끊고 None을 반환합니다.
+    """
+    governor = _get_governor()
+    h = hashlib.sha1()
+    try:
+        with governor.active(priority), tracing.span("download", url=url) as s:
+            with _request("GET", url, priority, cancel, stream=True, timeout=30) as res:
+                release = cancel.on_cancel(lambda: _abort(res)) if cancel else None
+                try:
+                    res.raise_for_status()
+                    with open(dest_path, "wb") as f:
+                        for chunk in res.iter_content(chunk_size=CHUNK_SIZE):
+                            if should_continue and not should_continue():
+                                return None
+                            check(cancel)
+                            f.write(chunk)
+                            h.update(chunk)
+                            s.add("bytes", len(chunk))
+                            governor.on_bytes(priority, len(chunk), cancel)
+                finally:
+                    if release:
+                        release()
+    except OperationCancelled:
+        return None
+    except Exception:
+        if cancel and cancel.cancelled:
+            return None
+        raise
+    return h.hexdigest()
@@ -0,0 +1,140 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from core.app_path import get_app_data_dir
+
+# 표본 추출(sampling) 프로파일러: 일정 간격으로 모든 스레드의 호출 스택을 찍어 어느 함수에서 시간을 쓰는지 셉니다.
+# GUI 스레드, 작업 스케줄러 스레드, QThread 작업자를 가리지 않고 한 번에 보며, 코드에 손을 대지 않아도 됩니다.
+# 켜는 방법: CLI의 --profile, 메인 창에서 Ctrl+Shift+P (한 번 더 누르면 멈추고 보고서 저장)
+
+PROFILE_DIR = get_app_data_dir() / "profiles"
+# 표본 간격 (초)
+SAMPLE_INTERVAL = 0.005
+# 보고서에 넣을 함수/호출 경로 수
+TOP_FUNCTIONS = 30
+TOP_STACKS = 10
+# 호출 경로에 보여줄 최대 깊이 (안쪽부터)
+STACK_DEPTH = 8
+
+# 맨 안쪽 프레임이 이것이면 일을 하지 않고 기다리는 중이므로 세지 않음
+# (작업 대기열/작업 완료 대기, Qt 이벤트 루프를 도는 main.py의 app.exec())
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("main.py", "main"),
+}
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _location(code) -> str:
+    """함수를 "이름 (파일:줄)"로. 이 프로젝트 파일은 상대 경로, 나머지는 파일 이름만"""
+    path = Path(code.co_filename)
+    try:
+        where = path.resolve().relative_to(_ROOT).as_posix()
+    except (OSError, ValueError):
+        where = path.name
+    return f"{code.co_name} ({where}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """start() ~ stop() 동안 모든 스레드의 스택을 모읍니다."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.idle_samples = 0
+        self.own = Counter()      # 맨 안쪽 함수 (자체 시간)
+        self.total = Counter()    # 스택에 있던 함수 (누적 시간)
+        self.stacks = Counter()   # 호출 경로
+        self.threads = Counter()  # 스레드 이름별 표본 수
+        self.started_at = None
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = time.time()
+        self._start_perf = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed += time.perf_counter() - self._start_perf
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(me)
+
+    def _sample(self, me: int):
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            leaf = frame.f_code
+            if (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_LEAVES:
+                self.idle_samples += 1
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            self.samples += 1
+            self.threads[names.get(ident, f"thread-{ident}")] += 1
+            self.own[leaf] += 1
+            # 재귀 호출은 한 번만
+            self.total.update(set(stack))
+            self.stacks[tuple(stack[:STACK_DEPTH])] += 1
+
+    def report(self) -> str:
+        """상위 함수와 호출 경로를 담은 텍스트 보고서"""
+        def percent(count: int) -> str:
+            return f"{count / self.samples:6.1%}" if self.samples else "     -"
+
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)) if self.started_at else "-"
+        lines = [
+            "# 마인크래프트 모드 관리자 프로파일",
+            f"시작: {started}, 기간: {self.elapsed:.1f}초, 표본 간격: {self.interval * 1000:.0f}ms",
+            f"표본: {self.samples}개 (대기 중이라 제외한 표본 {self.idle_samples}개)",
+            f"Python {sys.version.split()[0]}, {sys.platform}",
+            "",
+            "## 스레드별 표본",
+        ]
+        lines += [f"{count:>8}  {percent(count)}  {name}" for name, count in self.threads.most_common()]
+
+        for title, counter in ((f"자체 시간 상위 {TOP_FUNCTIONS} (그 함수 안에서 직접 쓴 시간)", self.own),
+                               (f"누적 시간 상위 {TOP_FUNCTIONS} (부른 함수 포함)", self.total)):
+            lines += ["", f"## {title}", "    표본    비율  함수"]
+            lines += [f"{count:>8}  {percent(count)}  {_location(code)}"
+                      for code, count in counter.most_common(TOP_FUNCTIONS)]
+
+        lines += ["", f"## 자주 보인 호출 경로 상위 {TOP_STACKS} (안쪽부터 {STACK_DEPTH}단계)"]
+        for stack, count in self.stacks.most_common(TOP_STACKS):
+            lines.append(f"{count:>8}  {percent(count)}")
+            lines += [f"            {'<- ' if i else ''}{_location(code)}" for i, code in enumerate(stack)]
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Path = None) -> Path:
+        """보고서를 저장합니다. path가 없으면 PROFILE_DIR에 시각을 이름으로 저장"""
+        if path is None:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            path = PROFILE_DIR / f"profile-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        path = Path(path)
+        path.write_text(self.report(), encoding="utf-8")
+        return path
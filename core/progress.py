@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import deque
+
+# UI로 진행 상황을 보내는 최대 빈도 (초당 횟수)
+DEFAULT_MAX_RATE_HZ = 20
+# ETA 계산에 사용할 최근 완료 항목 수
+DEFAULT_ETA_WINDOW = 20
+
+
+class ProgressReporter:
+    """
+    작업 스레드 안에서 진행 상황을 모아두고, 정해진 빈도 이하로만 UI에 스냅샷을 보냅니다.
+
+    항목마다 시그널을 보내면 병렬 확인 시 수천 개의 이벤트가 GUI 스레드에 쌓이므로,
+    update()/item_done()은 상태만 갱신하고 마지막 전송 후 1/max_rate_hz 초가 지났을 때만
+    publish(snapshot)을 호출합니다. 그 사이의 메시지는 가장 최근 것만 남습니다.
+
+    ETA는 최근 완료된 항목들의 완료 간격 이동 평균으로 계산하므로
+    여러 항목이 병렬로 처리되어도 실제 처리 속도를 따라갑니다.
+
+    snapshot 형식: {"done", "total", "percent", "message", "eta_seconds"(없으면 None)}
+    """
+
+    def __init__(self, publish, total: int = 0, max_rate_hz: float = DEFAULT_MAX_RATE_HZ,
+                 eta_window: int = DEFAULT_ETA_WINDOW):
+        self._publish = publish
+        self._min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self._lock = threading.Lock()
+        self._total = total
+        self._done = 0
+        self._message = ""
+        self._last_publish = 0.0
+        self._completions = deque(maxlen=eta_window + 1)
+        self._started = time.monotonic()
+
+    def begin(self, total: int, message: str = None):
+        """새 단계를 시작합니다. 완료 수와 ETA 기록을 초기화하고 바로 전송합니다."""
+        with self._lock:
+            self._total = total
+            self._done = 0
+            self._completions.clear()
+            self._started = time.monotonic()
+            self._completions.append(self._started)
+            if message is not None:
+                self._message = message
+        self.flush()
+
+    def set_total(self, total: int):
+        """진행 중에 전체 항목 수가 정해졌을 때 호출합니다. 완료 수는 유지됩니다."""
+        with self._lock:
+            self._total = total
+
+    def update(self, message: str = None):
+        """현재 메시지를 바꿉니다. (전송은 빈도 제한을 따름)"""
+        with self._lock:
+            if message is not None:
+                self._message = message
+        self._maybe_publish()
+
+    def item_done(self, message: str = None, count: int = 1):
+        """항목 count개가 끝났음을 기록합니다."""
+        with self._lock:
+            self._done = min(self._done + count, self._total) if self._total else self._done + count
+            now = time.monotonic()
+            for _ in range(count):
+                self._completions.append(now)
+            if message is not None:
+                self._message = message
+        self._maybe_publish()
+
+    def flush(self, message: str = None):
+        """빈도 제한과 관계없이 현재 상태를 즉시 전송합니다. 단계가 끝날 때 호출합니다."""
+        with self._lock:
+            if message is not None:
+                self._message = message
+            snapshot = self._snapshot()
+            self._last_publish = time.monotonic()
+        self._publish(snapshot)
+
+    def eta_seconds(self) -> float | None:
+        with self._lock:
+            return self._eta()
+
+    def _eta(self) -> float | None:
+        # 최소 한 번의 완료 간격이 있어야 계산 가능
+        if len(self._completions) < 2 or not self._total:
+            return None
+        span = self._completions[-1] - self._completions[0]
+        intervals = len(self._completions) - 1
+        if span <= 0:
+            return 0.0
+        remaining = self._total - self._done
+        return remaining * (span / intervals)
+
+    def _snapshot(self) -> dict:
+        percent = int(self._done / self._total * 100) if self._total else 0
+        return {
+            "done": self._done,
+            "total": self._total,
+            "percent": percent,
+            "message": self._message,
+            "eta_seconds": self._eta(),
+        }
+
+    def _maybe_publish(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_publish < self._min_interval:
+                return
+            self._last_publish = now
+            snapshot = self._snapshot()
+        self._publish(snapshot)
+
+
+def format_eta(eta_seconds: float | None) -> str:
+    """ETA를 화면에 표시할 문자열로 바꿉니다."""
+    if eta_seconds is None:
+        return "남은 시간 계산 중..."
+    return f"남은 시간: {int(eta_seconds)}초"
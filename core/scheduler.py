@@ -0,0 +1,281 @@
+import heapq
+import itertools
+import threading
+from collections import defaultdict
+
+from core import tracing
+from core.cancel import CancelToken, OperationCancelled
+
+# 작업 종류
+JOB_SCAN = "scan"          # 폴더 목록/캐시 읽기/스캔 마무리
+JOB_IDENTIFY = "identify"  # jar 분석 + Modrinth 검색
+JOB_CHECK = "check"        # 업데이트/호환 버전 확인
+JOB_DOWNLOAD = "download"  # 새 파일 내려받기 (스테이징)
+JOB_SWAP = "swap"          # 저널 커밋 후 모드 폴더 교체
+
+# 자원 (자원마다 동시에 실행할 수 있는 작업 수가 정해져 있음)
+RESOURCE_DISK = "disk"
+RESOURCE_API = "api"
+RESOURCE_CDN = "cdn"
+
+JOB_RESOURCES = {
+    JOB_SCAN: RESOURCE_DISK,
+    JOB_IDENTIFY: RESOURCE_API,
+    JOB_CHECK: RESOURCE_API,
+    JOB_DOWNLOAD: RESOURCE_CDN,
+    JOB_SWAP: RESOURCE_DISK,
+}
+
+# 숫자가 작을수록 먼저 실행 (같은 자원을 기다리는 작업끼리 비교)
+DEFAULT_PRIORITIES = {
+    JOB_SWAP: 0,
+    JOB_SCAN: 1,
+    JOB_IDENTIFY: 2,
+    JOB_DOWNLOAD: 3,
+    JOB_CHECK: 4,
+}
+
+# 모드 폴더 교체는 업데이트 저널이 하나뿐이므로 디스크 작업은 한 번에 하나
+DEFAULT_RESOURCE_LIMITS = {
+    RESOURCE_DISK: 1,
+    RESOURCE_API: 6,
+    RESOURCE_CDN: 4,
+}
+
+# 작업 상태
+PENDING = "pending"      # 선행 작업을 기다리는 중
+READY = "ready"          # 자원을 기다리는 중
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = {DONE, FAILED, CANCELLED}
+
+
+class Job:
+    """
+    스케줄러가 실행할 작업 하나.
+
+    fn(cancel)은 작업 스레드에서 호출되며 반환값이 result가 됩니다. cancel은 같은 group의 작업들이
+    함께 쓰는 core.cancel.CancelToken입니다.
+
+    depends_on의 작업이 모두 끝난 뒤에(성공/실패와 관계없이) 실행됩니다. 선행 작업의 결과는
+    fn 안에서 job.result/job.state로 확인합니다. 그룹이 취소되면 대기 중인 작업은 실행되지 않지만,
+    always_run=True인 작업(캐시 저장 같은 마무리 작업)은 취소된 토큰을 받은 채로 실행됩니다.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, kind: str, fn, depends_on=(), priority: int = None, group: str = None,
+                 name: str = "", always_run: bool = False):
+        self.id = next(Job._ids)
+        self.kind = kind
+        self.fn = fn
+        self.resource = JOB_RESOURCES[kind]
+        self.priority = DEFAULT_PRIORITIES[kind] if priority is None else priority
+        self.depends_on = list(depends_on)
+        self.group = group
+        self.name = name
+        self.always_run = always_run
+        self.state = PENDING
+        self.result = None
+        self.error = None
+        self.cancel = None  # submit 시 정해짐
+        self._remaining = 0
+        self._done_event = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def wait(self, timeout: float = None) -> bool:
+        """작업이 끝날 때까지 기다립니다. (GUI 스레드에서는 호출하지 마세요)"""
+        return self._done_event.wait(timeout)
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.kind} {self.name!r} {self.state}>"
+
+
+class JobScheduler:
+    """
+    우선순위와 자원별 동시 실행 수 제한, 선행 관계를 가진 작업 스케줄러.
+
+    작업 스레드는 자원 제한의 합만큼 만들어 두고, 빈 스레드는 여유가 있는 자원의 대기열 중
+    우선순위가 가장 높은 작업을 가져갑니다. 끝난 작업은 subscribe()로 등록한 함수에 작업 스레드에서
+    전달됩니다. (GUI에서는 gui.job_bridge.JobBridge가 GUI 스레드로 넘겨줌)
+    """
+
+    def __init__(self, limits: dict = None):
+        self._limits = dict(DEFAULT_RESOURCE_LIMITS, **(limits or {}))
+        self._running = {resource: 0 for resource in self._limits}
+        self._ready = {resource: [] for resource in self._limits}
+        self._dependents = defaultdict(list)
+        self._group_tokens = {}
+        self._active = set()
+        self._listeners = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._stopped = False
+        self._threads = []
+        for i in range(sum(self._limits.values())):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # --- 구독 ---
+    def subscribe(self, listener):
+        """끝난(완료/실패/취소) 작업마다 listener(job)을 호출합니다. 작업 스레드에서 호출됩니다."""
+        with self._cond:
+            self._listeners.append(listener)
+
+    def _notify(self, jobs: list):
+        for job in jobs:
+            job._done_event.set()
+            for listener in list(self._listeners):
+                try:
+                    listener(job)
+                except Exception as e:
+                    print(f"작업 결과 전달 오류: {e}")
+
+    # --- 제출/취소 ---
+    def token_for(self, group: str) -> CancelToken:
+        """group이 함께 쓰는 취소 토큰. 취소된 뒤에 제출하는 작업은 새 토큰을 받습니다."""
+        with self._cond:
+            return self._token_locked(group)
+
+    def _token_locked(self, group):
+        if group is None:
+            return CancelToken()
+        token = self._group_tokens.get(group)
+        if token is None or token.cancelled:
+            token = self._group_tokens[group] = CancelToken()
+        return token
+
+    def submit(self, job: Job) -> Job:
+        """작업을 제출합니다. 선행 작업은 먼저 (또는 같은 호출 순서로) 제출되어 있어야 합니다."""
+        finished = []
+        with self._cond:
+            if job.cancel is None:
+                job.cancel = self._token_locked(job.group)
+            self._active.add(job)
+            pending = [dep for dep in job.depends_on if not dep.finished]
+            job._remaining = len(pending)
+            for dep in pending:
+                self._dependents[dep].append(job)
+            if not pending:
+                self._release_locked(job, finished)
+            self._cond.notify_all()
+        self._notify(finished)
+        return job
+
+    def submit_all(self, jobs: list) -> list:
+        for job in jobs:
+            self.submit(job)
+        return jobs
+
+    def cancel_group(self, group: str):
+        """group의 작업을 모두 취소합니다. 실행 중인 작업은 토큰으로, 대기 중인 작업은 바로 취소됩니다."""
+        finished = []
+        with self._cond:
+            token = self._group_tokens.pop(group, None)
+            if token is None:
+                return
+            token.cancel()
+            for resource, heap in self._ready.items():
+                keep = []
+                for entry in heap:
+                    job = entry[2]
+                    if job.group == group and not job.always_run:
+                        self._finish_locked(job, CANCELLED, None, None, finished)
+                    else:
+                        keep.append(entry)
+                heapq.heapify(keep)
+                self._ready[resource] = keep
+            self._cond.notify_all()
+        self._notify(finished)
+
+    def active_groups(self) -> set:
+        with self._cond:
+            return {job.group for job in self._active if job.group is not None}
+
+    def is_idle(self, group: str = None) -> bool:
+        with self._cond:
+            return not any(group is None or job.group == group for job in self._active)
+
+    def shutdown(self, wait: bool = True):
+        """남은 작업을 모두 취소하고 작업 스레드를 멈춥니다."""
+        for group in list(self._group_tokens):
+            self.cancel_group(group)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # --- 내부 ---
+    def _release_locked(self, job: Job, finished: list):
+        """선행 작업이 모두 끝난 작업을 대기열에 넣습니다. 그룹이 취소되었으면 바로 취소 처리합니다."""
+        if job.cancel.cancelled and not job.always_run:
+            self._finish_locked(job, CANCELLED, None, None, finished)
+            return
+        job.state = READY
+        heapq.heappush(self._ready[job.resource], (job.priority, next(self._seq), job))
+
+    def _finish_locked(self, job: Job, state: str, result, error, finished: list):
+        job.state = state
+        job.result = result
+        job.error = error
+        self._active.discard(job)
+        finished.append(job)
+        for dependent in self._dependents.pop(job, []):
+            dependent._remaining -= 1
+            if dependent._remaining == 0:
+                self._release_locked(dependent, finished)
+
+    def _next_job_locked(self) -> Job | None:
+        best = None
+        for resource, heap in self._ready.items():
+            if heap and self._running[resource] < self._limits[resource]:
+                if best is None or heap[0] < self._ready[best][0]:
+                    best = resource
+        if best is None:
+            return None
+        return heapq.heappop(self._ready[best])[2]
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._next_job_locked()
+                while job is None and not self._stopped:
+                    self._cond.wait()
+                    job = self._next_job_locked()
+                if job is None:
+                    return
+                self._running[job.resource] += 1
+                job.state = RUNNING
+
+            result = error = None
+            with tracing.span(f"job.{job.kind}", job=job.name) as s:
+                try:
+                    result = job.fn(job.cancel)
+                    state = DONE
+                except OperationCancelled:
+                    state = CANCELLED
+                except Exception as e:
+                    state, error = FAILED, e
+                    print(f"작업 실패 ({job.kind} {job.name}): {e}")
+                s.set("state", state)
+
+            finished = []
+            with self._cond:
+                self._running[job.resource] -= 1
+                self._finish_locked(job, state, result, error, finished)
+                self._cond.notify_all()
+            self._notify(finished)
+
+
+def wait_all(jobs: list, timeout: float = None) -> bool:
+    """jobs가 모두 끝날 때까지 기다립니다. (CLI 등 GUI가 없는 곳에서 사용)"""
+    return all(job.wait(timeout) for job in jobs)
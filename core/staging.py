@@ -0,0 +1,112 @@
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from core import tracing, cache_stats
+from core.app_path import get_app_data_dir
+from core.net import download_to_file, PRIORITY_DOWNLOAD
+
+# 미리 받아둔 업데이트 파일을 보관하는 스테이징 폴더
+STAGING_DIR = get_app_data_dir() / "staging"
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _staging_key(mod: dict) -> str | None:
+    """스테이징 파일 이름으로 쓸 키. Modrinth sha1이 있으면 그대로, 없으면 URL 해시를 사용합니다."""
+    if mod.get("latest_sha1"):
+        return mod["latest_sha1"]
+    if mod.get("download_url"):
+        return hashlib.sha1(mod["download_url"].encode("utf-8")).hexdigest()
+    return None
+
+
+def staged_path(mod: dict) -> Path | None:
+    """mod의 최신 파일이 스테이징될 경로를 반환합니다."""
+    key = _staging_key(mod)
+    if not key:
+        return None
+    return STAGING_DIR / f"{key}.jar"
+
+
+def is_staged(mod: dict) -> bool:
+    """최신 파일이 이미 스테이징 폴더에 준비되어 있는지 확인합니다."""
+    path = staged_path(mod)
+    return path is not None and path.exists()
+
+
+def file_sha1(path: Path) -> str:
+    """파일의 sha1 해시를 계산합니다."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@tracing.traced("stage_download")
+def stage_download(mod: dict, priority: int = PRIORITY_DOWNLOAD, should_continue=None, cancel=None) -> Path | None:
+    """
+    mod의 최신 파일을 스테이징 폴더로 내려받습니다.
+
+    :param priority: 네트워크 우선순위 클래스 (core.net 참고). 대역폭 제한은 클래스별로 적용됩니다.
+    :param should_continue: 청크마다 호출되는 함수. False를 반환하면 다운로드를 중단합니다.
+    :param cancel: core.cancel.CancelToken. 취소되면 받고 있던 연결도 바로 끊습니다.
+    :return: 스테이징된 파일 경로. 중단되었거나 받을 정보가 없으면 None.
+    """
+    final_path = staged_path(mod)
+    if final_path is None:
+        return None
+    if final_path.exists():
+        cache_stats.hit(cache_stats.LAYER_STAGING)
+        return final_path
+    cache_stats.miss(cache_stats.LAYER_STAGING)
+
+    STAGING_DIR.mkdir(parents=True, exist_ok=True)
+    part_path = final_path.with_suffix(".part")
+    expected_sha1 = mod.get("latest_sha1")
+
+    try:
+        sha1 = download_to_file(mod["download_url"], part_path, priority, should_continue, cancel)
+        if sha1 is None:
+            return None
+        if expected_sha1 and sha1 != expected_sha1:
+            raise ValueError(f"해시 불일치: {mod.get('latest_filename')}")
+        os.replace(part_path, final_path)
+        return final_path
+    finally:
+        if part_path.exists():
+            part_path.unlink()
+
+
+def take_staged(mod: dict, dest_path: Path) -> bool:
+    """
+    스테이징된 파일을 dest_path로 옮깁니다.
+    같은 드라이브면 os.replace로 즉시 교체되고, 다르면 복사 후 교체합니다.
+    :return: 스테이징된 파일을 사용했으면 True
+    """
+    path = staged_path(mod)
+    if path is None or not path.exists():
+        return False
+    try:
+        os.replace(path, dest_path)
+    except OSError:
+        tmp_path = dest_path.with_name(dest_path.name + ".tmp")
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, dest_path)
+        path.unlink()
+    return True
+
+
+def clear_staging(keep_mods: list = None):
+    """keep_mods에 해당하지 않는 스테이징 파일을 삭제합니다."""
+    if not STAGING_DIR.exists():
+        return
+    keep = {staged_path(m).name for m in (keep_mods or []) if staged_path(m)}
+    for path in STAGING_DIR.iterdir():
+        if path.name not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
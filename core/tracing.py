@@ -0,0 +1,201 @@
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from functools import wraps
+from pathlib import Path
+
+# 구간(span) 기록: 스캔/분석/확인/업데이트/캐시 읽기·쓰기/HTTP 요청에 걸린 시간과 횟수, 바이트, 상태 코드.
+# 꺼져 있으면 span()은 아무것도 하지 않는 공용 객체를 돌려주므로 비용이 거의 없습니다.
+# 켜는 방법: 환경 변수 MMM_TRACE=1, CLI의 --trace, 진단 창의 "기록 켜기"
+
+TRACE_ENV = "MMM_TRACE"
+TRACE_FORMAT = 1
+# 메모리에 남길 최대 구간 수 (넘으면 오래된 것부터 버림)
+MAX_SPANS = 100_000
+
+_enabled = os.environ.get(TRACE_ENV) == "1"
+_spans = deque(maxlen=MAX_SPANS)
+_thread_names = {}
+_origin_ns = time.perf_counter_ns()
+
+
+class Span:
+    """기록 중인 구간 하나. with 블록이 끝나면 기록에 추가됩니다."""
+    __slots__ = ("name", "attrs", "thread", "start_ns", "end_ns")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.thread = threading.get_ident()
+        if self.thread not in _thread_names:
+            _thread_names[self.thread] = threading.current_thread().name
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+
+    def set(self, key: str, value):
+        self.attrs[key] = value
+
+    def add(self, key: str, amount: int = 1):
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs.setdefault("error", exc_type.__name__)
+        _spans.append(self)
+        return False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class _NullSpan:
+    """기록이 꺼져 있을 때 쓰는 빈 구간"""
+    __slots__ = ()
+
+    def set(self, key, value):
+        pass
+
+    def add(self, key, amount=1):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **attrs):
+    """
+    with span("http", method="GET") as s:
+        ...
+        s.set("status", 200)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, attrs)
+
+
+def traced(name: str):
+    """함수 전체를 name 구간으로 기록하는 데코레이터."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with Span(name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# --- 켜기/끄기 ---
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """지금까지의 기록을 지웁니다."""
+    _spans.clear()
+
+
+def spans() -> list:
+    """끝난 구간 목록 (끝난 순서)"""
+    return list(_spans)
+
+
+# --- 요약/내보내기 ---
+def summary() -> list:
+    """
+    구간 이름별 요약. 전체 시간이 긴 순서.
+    [{"name", "count", "total_ms", "mean_ms", "max_ms", "bytes", "errors", "statuses"}]
+    """
+    groups = {}
+    for s in spans():
+        entry = groups.get(s.name)
+        if entry is None:
+            entry = groups[s.name] = {"name": s.name, "count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                      "bytes": 0, "errors": 0, "statuses": Counter()}
+        ms = s.duration_ms
+        entry["count"] += 1
+        entry["total_ms"] += ms
+        entry["max_ms"] = max(entry["max_ms"], ms)
+        entry["bytes"] += s.attrs.get("bytes", 0)
+        if "error" in s.attrs:
+            entry["errors"] += 1
+        if "status" in s.attrs:
+            entry["statuses"][str(s.attrs["status"])] += 1
+    result = []
+    for entry in groups.values():
+        entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        entry["statuses"] = dict(entry["statuses"])
+        result.append(entry)
+    result.sort(key=lambda e: e["total_ms"], reverse=True)
+    return result
+
+
+def _span_json(s: Span) -> dict:
+    return {
+        "name": s.name,
+        "start_ms": round((s.start_ns - _origin_ns) / 1e6, 3),
+        "duration_ms": round(s.duration_ms, 3),
+        "thread": _thread_names.get(s.thread, str(s.thread)),
+        "attrs": s.attrs,
+    }
+
+
+def export_json(path: Path) -> Path:
+    """구간 목록과 요약을 JSON으로 저장합니다."""
+    data = {
+        "format": TRACE_FORMAT,
+        "summary": summary(),
+        "spans": [_span_json(s) for s in spans()],
+    }
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    return path
+
+
+def export_chrome_trace(path: Path) -> Path:
+    """chrome://tracing 또는 Perfetto에서 열 수 있는 형식으로 저장합니다. (스레드별로 구간이 나뉘어 보임)"""
+    pid = os.getpid()
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        for tid, name in list(_thread_names.items())
+    ]
+    for s in spans():
+        events.append({
+            "name": s.name,
+            "cat": s.name.split(".")[0],
+            "ph": "X",
+            "ts": (s.start_ns - _origin_ns) / 1e3,
+            "dur": (s.end_ns - s.start_ns) / 1e3,
+            "pid": pid,
+            "tid": s.thread,
+            "args": s.attrs,
+        })
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+    return path
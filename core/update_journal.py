@@ -0,0 +1,246 @@
+import contextlib
+import json
+import os
+from pathlib import Path
+
+from core.app_path import get_app_data_dir
+from core.fileio import atomic_write, file_lock, LockTimeout
+from core.staging import file_sha1
+
+# 일괄 업데이트의 선행 기록(write-ahead) 저널 파일
+JOURNAL_FILE = get_app_data_dir() / "update_journal.json"
+# .staged 파일을 만든 적이 있는 모드 폴더 목록 (기본 폴더가 아닌 곳에 남은 파일도 정리하기 위해)
+STAGING_DIRS_FILE = get_app_data_dir() / "staging_dirs.json"
+# 다른 프로세스의 교체가 끝나기를 기다리는 최대 시간 (초, 큰 폴더 복원의 복사까지 포함)
+JOURNAL_LOCK_TIMEOUT = 60
+
+# 저널 작업 흐름
+# 1. 다운로드 -> 해시 확인 (모드 폴더는 건드리지 않음)
+# 2. 모드 폴더 안에 '<새 파일>.staged' 로 스테이징 (로더는 .jar만 읽으므로 무시됨)
+# 3. 모든 교체 작업을 저널에 기록하고 fsync 한 번으로 커밋
+# 4. 기존 파일 -> .bak, .staged -> 새 파일 순서로 os.replace
+# 5. 저널 삭제
+# 커밋 이전에 종료되면 모드 폴더는 그대로이고, 커밋 이후에 종료되면
+# 다음 실행 시 recover_journal()이 남은 교체를 마저 적용합니다.
+#
+# 2~5단계와 복구/정리는 journal_lock() 안에서 진행합니다. (GUI와 예약 작업의 CLI가 동시에 실행될 때
+# 한쪽의 복구가 다른 쪽이 스테이징한 파일을 지우거나, 적용 중인 저널을 덮어쓰지 않도록)
+
+
+@contextlib.contextmanager
+def journal_lock(wait: bool = True):
+    """
+    저널 잠금. 다른 프로세스가 잡고 있으면 기다립니다. (LockTimeout)
+    :param wait: False면 기다리지 않고 잡았는지 여부(bool)를 넘깁니다. (시작 시 복구용)
+    """
+    with contextlib.ExitStack() as stack:
+        try:
+            stack.enter_context(file_lock(JOURNAL_FILE, timeout=JOURNAL_LOCK_TIMEOUT if wait else 0))
+        except LockTimeout:
+            if wait:
+                raise
+            yield False
+            return
+        yield True
+
+
+def make_op(mods_dir: Path, old_file: str, new_file: str, sha1: str = None, log: dict = None) -> dict:
+    """저널에 기록할 교체 작업 하나를 만듭니다. log는 적용 후 업데이트 로그에 남길 기록입니다."""
+    return {
+        "old": str(mods_dir / old_file),
+        "new": str(mods_dir / new_file),
+        "staged": str(mods_dir / f"{new_file}.staged"),
+        "backup": str(mods_dir / f"{old_file}.bak"),
+        "sha1": sha1,
+        "log": log,
+    }
+
+
+def make_remove_op(mods_dir: Path, file: str) -> dict:
+    """파일을 모드 폴더에서 빼는 작업을 만듭니다. 삭제하지 않고 .bak으로 옮겨둡니다."""
+    return {
+        "kind": "remove",
+        "old": str(mods_dir / file),
+        "backup": str(mods_dir / f"{file}.bak"),
+        "log": None,
+    }
+
+
+def make_rollback_op(mods_dir: Path, old_file: str, new_file: str, log: dict = None) -> dict:
+    """업데이트를 되돌리는 작업을 만듭니다. '<old_file>.bak'을 old_file로 복원하고 new_file을 뺍니다."""
+    return {
+        "kind": "rollback",
+        "old": str(mods_dir / old_file),
+        "new": str(mods_dir / new_file),
+        "backup": str(mods_dir / f"{old_file}.bak"),
+        "log": log,
+    }
+
+
+def _read_journal() -> list:
+    """저널에 남은 작업 목록. 깨진 저널은 커밋 전 상태로 보고 빈 목록 (커밋은 os.replace로 원자적)"""
+    try:
+        with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("ops", [])
+    except (json.JSONDecodeError, OSError, AttributeError):
+        return []
+
+
+def _write_journal(ops: list):
+    atomic_write(JOURNAL_FILE, json.dumps({"ops": ops}, ensure_ascii=False), fsync=True)
+
+
+def commit_journal(ops: list):
+    """
+    교체 작업 목록을 저널 파일에 원자적으로 기록합니다. fsync는 여기서 한 번만 수행합니다.
+    이전 일괄 작업에서 아직 적용하지 못한 작업이 남아 있으면 함께 기록합니다. (journal_lock 안에서 호출)
+    """
+    _write_journal(_read_journal() + ops)
+
+
+def clear_journal():
+    """모든 교체가 끝난 저널을 삭제합니다. (journal_lock 안에서 호출)"""
+    if JOURNAL_FILE.exists():
+        JOURNAL_FILE.unlink()
+
+
+def remember_staging_dirs(dirs):
+    """
+    .staged 파일을 만들 폴더를 기록합니다. 커밋 전에 중단되면 다음 정리 때 이 폴더들도 살핍니다.
+    (journal_lock 안에서, 스테이징 전에 호출)
+    """
+    known = _read_staging_dirs()
+    new = [str(d) for d in dirs if str(d) not in known]
+    if new:
+        atomic_write(STAGING_DIRS_FILE, json.dumps(sorted(set(known) | set(new)), ensure_ascii=False))
+
+
+def _read_staging_dirs() -> list:
+    try:
+        with open(STAGING_DIRS_FILE, "r", encoding="utf-8") as f:
+            dirs = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, IOError):
+        return []
+    return [d for d in dirs if isinstance(d, str)] if isinstance(dirs, list) else []
+
+
+def _restore_backup(op: dict):
+    """교체를 되돌려 백업 파일을 원래 이름으로 복원합니다."""
+    old, new, backup = Path(op["old"]), Path(op["new"]), Path(op["backup"])
+    if new.exists() and new != old:
+        new.unlink()
+    if backup.exists():
+        os.replace(backup, old)
+
+
+def apply_op(op: dict) -> bool:
+    """
+    교체 작업 하나를 적용합니다. 몇 번을 다시 실행해도 결과가 같도록(멱등) 작성되어 있습니다.
+    :return: 새 파일이 정상적으로 자리잡았으면 True, 되돌렸으면 False
+    """
+    if op.get("kind") == "remove":
+        old, backup = Path(op["old"]), Path(op["backup"])
+        if old.exists():
+            os.replace(old, backup)
+        return True
+
+    if op.get("kind") == "rollback":
+        old, new, backup = Path(op["old"]), Path(op["new"]), Path(op["backup"])
+        # 백업을 먼저 제자리로 (같은 이름이면 현재 파일을 원자적으로 덮어씀), 그다음 새 파일을 지움
+        if backup.exists():
+            os.replace(backup, old)
+        elif not old.exists():
+            return False
+        if new != old and new.exists():
+            new.unlink()
+        return True
+
+    old, new = Path(op["old"]), Path(op["new"])
+    staged, backup = Path(op["staged"]), Path(op["backup"])
+    expected_sha1 = op.get("sha1")
+
+    if staged.exists():
+        if expected_sha1 and file_sha1(staged) != expected_sha1:
+            # 커밋 직전에 쓰인 내용이 디스크에 남지 않은 경우
+            staged.unlink()
+            _restore_backup(op)
+            return False
+        if old.exists():
+            os.replace(old, backup)
+        os.replace(staged, new)
+        return True
+
+    # .staged가 없으면 이미 교체가 끝난 상태
+    if not new.exists():
+        _restore_backup(op)
+        return False
+    if expected_sha1 and file_sha1(new) != expected_sha1:
+        _restore_backup(op)
+        return False
+    return True
+
+
+def apply_journal(ops: list) -> list:
+    """
+    커밋된 작업들을 적용하고, 성공한 작업 목록을 반환합니다. (journal_lock 안에서 호출)
+    파일이 잠겨 있는 등의 이유로 교체하지 못한 작업은 저널에 남겨 다음 실행 때 다시 시도합니다.
+    """
+    # 이 작업들과 함께 커밋된, 이전 일괄 작업에서 남은 작업은 그대로 둠
+    remaining = [op for op in _read_journal() if op not in ops]
+    applied = []
+    for op in ops:
+        try:
+            if apply_op(op):
+                applied.append(op)
+        except OSError as e:
+            print(f"파일 교체 실패 (다음 실행 시 재시도): {op['new']}: {e}")
+            remaining.append(op)
+    if remaining:
+        _write_journal(remaining)
+    else:
+        clear_journal()
+    return applied
+
+
+def clean_stale_staged(mods_dirs) -> int:
+    """
+    커밋 전에 중단되어 모드 폴더에 남은 .staged 파일을 정리합니다. (journal_lock 안에서 호출)
+    mods_dirs와 remember_staging_dirs()로 기록된 폴더를 살피고, 저널에 남은 작업의 파일은 건드리지 않습니다.
+    :return: 지운 파일 수
+    """
+    keep = {Path(op["staged"]) for op in _read_journal() if op.get("staged")}
+    dirs = {Path(d) for d in _read_staging_dirs()} | {Path(d) for d in mods_dirs if d}
+    removed = 0
+    for directory in sorted(dirs):
+        if not directory.is_dir():
+            continue
+        for path in directory.glob("*.staged"):
+            if path in keep:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    # 아직 적용하지 못한 작업의 폴더만 남김
+    pending_dirs = sorted({str(path.parent) for path in keep})
+    if pending_dirs:
+        atomic_write(STAGING_DIRS_FILE, json.dumps(pending_dirs, ensure_ascii=False))
+    elif STAGING_DIRS_FILE.exists():
+        STAGING_DIRS_FILE.unlink()
+    return removed
+
+
+def recover_journal() -> list:
+    """
+    이전 실행에서 커밋만 되고 끝나지 못한 저널이 있으면 마저 적용합니다. (journal_lock 안에서 호출)
+    :return: 복구 과정에서 적용된 작업 목록 (저널이 없으면 빈 리스트)
+    """
+    if not JOURNAL_FILE.exists():
+        return []
+    ops = _read_journal()
+    if not ops:
+        # 깨진 저널은 버림
+        clear_journal()
+        return []
+    return apply_journal(ops)
@@ -0,0 +1,241 @@
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from core.app_path import get_app_data_dir
+from core.fileio import file_lock
+
+APP_DATA_DIR = get_app_data_dir()
+LOG_DIR = APP_DATA_DIR / "update_log"
+# 이전 버전의 텍스트 로그 (처음 사용할 때 한 번 옮김)
+LEGACY_LOG_FILE = APP_DATA_DIR / "update_log.txt"
+
+# 세그먼트 하나의 최대 크기와 보관할 세그먼트 수
+MAX_SEGMENT_BYTES = 1024 * 1024
+MAX_SEGMENTS = 50
+# 뷰어가 한 번에 읽는 기록 수
+PAGE_SIZE = 100
+# 파일 끝에서부터 거꾸로 읽을 때의 블록 크기
+READ_BLOCK = 64 * 1024
+
+KIND_UPDATE = "update"
+KIND_ROLLBACK = "rollback"
+KIND_MESSAGE = "message"
+
+# 같은 프로세스의 스레드끼리는 _lock, GUI와 CLI처럼 다른 프로세스끼리는 LOG_DIR 잠금 파일로
+# 쓰기/세그먼트 교체/이전 로그 변환이 겹치지 않게 함
+_lock = threading.Lock()
+
+# 텍스트 로그 한 줄 형식 (예전 로그 뷰어가 사용하던 것)
+_LEGACY_PATTERN = re.compile(
+    r"^(?P<time>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}): "
+    r"(?P<mod_name>.*?) ?"
+    r"(?:(?P<old_version>[\w.+-]+)\s->\s(?P<new_version>[\w.+-]+))? ?"
+    r"\(file: (?P<old_file>.*?) -> (?P<new_file>.*?)\)\s*$"
+)
+_LEGACY_ROLLBACK_PATTERN = re.compile(
+    r"^(?P<time>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}): \[롤백\] (?P<new_file>.*?) -> (?P<old_file>.*?)\s*$"
+)
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def update_record(mod: dict, old_file: str, new_file: str, mods_dir: Path) -> dict:
+    """업데이트 한 건의 로그 기록을 만듭니다. 롤백이 같은 폴더에서 일어나도록 모드 폴더도 남깁니다."""
+    return {
+        "time": _now(),
+        "kind": KIND_UPDATE,
+        "mod_name": mod.get("mod_name", ""),
+        "project_id": mod.get("project_id"),
+        "old_version": mod.get("mod_version", "unknown"),
+        "new_version": mod.get("latest_version", "N/A"),
+        "old_file": old_file,
+        "new_file": new_file,
+        "mods_dir": str(mods_dir),
+    }
+
+
+def rollback_record(old_file: str, new_file: str, mods_dir: Path) -> dict:
+    """롤백 한 건의 로그 기록을 만듭니다. (new_file을 old_file로 되돌림)"""
+    return {"time": _now(), "kind": KIND_ROLLBACK, "old_file": old_file, "new_file": new_file,
+            "mods_dir": str(mods_dir)}
+
+
+def parse_legacy_line(line: str) -> dict:
+    """텍스트 로그 한 줄을 기록으로 바꿉니다. 형식을 모르는 줄은 메시지로 남깁니다."""
+    match = _LEGACY_ROLLBACK_PATTERN.match(line)
+    if match:
+        return {"kind": KIND_ROLLBACK, **match.groupdict()}
+    match = _LEGACY_PATTERN.match(line)
+    if match:
+        record = {"kind": KIND_UPDATE, **match.groupdict()}
+        record["old_version"] = record["old_version"] or "N/A"
+        record["new_version"] = record["new_version"] or "N/A"
+        return record
+    time, _, message = line.partition(": ")
+    return {"time": time.strip(), "kind": KIND_MESSAGE, "message": message.strip()}
+
+
+# --- 세그먼트 파일 ---
+def _segments() -> list:
+    """세그먼트 번호 목록 (오래된 것부터)."""
+    if not LOG_DIR.exists():
+        return []
+    numbers = []
+    for path in LOG_DIR.glob("*.jsonl"):
+        try:
+            numbers.append(int(path.stem))
+        except ValueError:
+            continue
+    return sorted(numbers)
+
+
+def _segment_path(number: int) -> Path:
+    return LOG_DIR / f"{number:06d}.jsonl"
+
+
+def _migrate_legacy_log():
+    """update_log.txt가 남아 있으면 기록으로 옮기고 .migrated로 이름을 바꿉니다."""
+    if not LEGACY_LOG_FILE.exists():
+        return
+    try:
+        lines = LEGACY_LOG_FILE.read_text(encoding="utf-8").splitlines()
+        _append_locked([parse_legacy_line(line) for line in lines if line.strip()])
+        os.replace(LEGACY_LOG_FILE, LEGACY_LOG_FILE.with_suffix(".txt.migrated"))
+    except OSError as e:
+        print(f"이전 로그 변환 실패: {e}")
+
+
+def _append_locked(records: list):
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    segments = _segments()
+    number = segments[-1] if segments else 1
+    path = _segment_path(number)
+    if path.exists() and path.stat().st_size >= MAX_SEGMENT_BYTES:
+        number += 1
+        path = _segment_path(number)
+        segments.append(number)
+        # 오래된 세그먼트 정리
+        for old in segments[:-MAX_SEGMENTS]:
+            try:
+                _segment_path(old).unlink()
+            except OSError:
+                pass
+    data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(data)
+
+
+def append_records(records: list):
+    """
+    기록을 로그 끝에 덧붙입니다. 문자열은 텍스트 로그 형식으로 보고 변환합니다.
+    (이전 버전에서 남은 업데이트 저널에는 로그가 문자열로 들어 있음)
+    """
+    records = [parse_legacy_line(r) if isinstance(r, str) else r for r in records if r]
+    if not records:
+        return
+    try:
+        with _lock, file_lock(LOG_DIR):
+            _migrate_legacy_log()
+            _append_locked(records)
+    except OSError as e:
+        print(f"업데이트 로그 기록 실패: {e}")
+
+
+# --- 읽기 (최신순 페이지) ---
+def _read_back(path: Path, end: int, limit: int, match, records: list) -> int:
+    """
+    path의 [0, end) 구간을 끝에서부터 한 줄씩 거꾸로 읽어 match에 맞는 기록을 records에 추가합니다.
+    limit개가 차면 멈춥니다.
+    :return: 아직 읽지 않은 구간의 끝 (0이면 파일을 다 읽음)
+    """
+    with path.open("rb") as f:
+        while end > 0:
+            # 블록 앞쪽의 잘린 줄은 다음 블록에서 읽음 (한 줄이 블록보다 길면 블록을 늘림)
+            block = READ_BLOCK
+            while True:
+                start = max(0, end - block)
+                f.seek(start)
+                chunk = f.read(end - start)
+                cut = chunk.find(b"\n") if start > 0 else -1
+                if start == 0 or cut >= 0:
+                    break
+                block *= 2
+            base = start + cut + 1 if start > 0 else 0
+            if start > 0:
+                chunk = chunk[cut + 1:]
+
+            line_end = end
+            for line in reversed(chunk.split(b"\n")):
+                line_start = line_end - len(line)
+                line_end = line_start - 1
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if match(record):
+                    records.append(record)
+                    if len(records) >= limit:
+                        return max(line_start - 1, 0)
+            end = max(base - 1, 0)
+    return 0
+
+
+def _matcher(query: str):
+    query = query.casefold().strip()
+    if not query:
+        return lambda record: True
+
+    def match(record):
+        text = " ".join(str(record.get(key) or "") for key in ("mod_name", "old_file", "new_file", "project_id", "message"))
+        return query in text.casefold()
+    return match
+
+
+def read_page(cursor=None, limit: int = PAGE_SIZE, query: str = ""):
+    """
+    최신 기록부터 limit개를 읽습니다. 전체 로그를 읽지 않고 파일 끝에서부터 필요한 만큼만 읽으므로
+    로그 길이와 관계없이 첫 페이지는 바로 나옵니다.
+
+    :param cursor: 이전 호출이 돌려준 위치 (None이면 처음부터)
+    :param query: 모드 이름/파일 이름/프로젝트 ID에 포함될 문자열
+    :return: (records, next_cursor) - 더 읽을 것이 없으면 next_cursor는 None
+    """
+    if cursor is None:
+        try:
+            with _lock, file_lock(LOG_DIR):
+                _migrate_legacy_log()
+        except OSError as e:
+            print(f"이전 로그 변환 실패: {e}")
+    segments = _segments()
+    if not segments:
+        return [], None
+    if cursor is None:
+        cursor = (segments[-1], None)
+
+    number, end = cursor
+    match = _matcher(query)
+    records = []
+    older = [n for n in segments if n <= number]
+    for index in range(len(older) - 1, -1, -1):
+        path = _segment_path(older[index])
+        try:
+            if end is None:
+                end = path.stat().st_size
+            end = _read_back(path, end, limit, match, records)
+        except OSError:
+            end = 0
+        if len(records) >= limit:
+            if end > 0:
+                return records, (older[index], end)
+            if index > 0:
+                return records, (older[index - 1], None)
+            return records, None
+        end = None
+    return records, None
@@ -1,12 +1,17 @@
-import requests
-import os
 import sys
 from pathlib import Path
-from datetime import datetime
-from core.app_path import get_app_data_dir
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core import tracing
+from core.mod_record import ModRecord
+from core.net import PRIORITY_DOWNLOAD
+from core.staging import stage_download, take_staged
+from core.lockfile import record_lockfile
+from core.update_log import update_record, rollback_record, append_records
+from core.update_journal import (make_op, make_rollback_op, commit_journal, apply_journal, recover_journal,
+                                 clean_stale_staged, journal_lock, remember_staging_dirs)
 
-APP_DATA_DIR = get_app_data_dir()
-LOG_FILE = APP_DATA_DIR / "update_log.txt"
+# 동시에 진행할 다운로드 수
+DOWNLOAD_WORKERS = 4
 
 def get_minecraft_dir() -> Path:
     """운영체제에 맞는 마인크래프트 기본 설치 경로를 반환합니다."""
@@ -17,60 +22,148 @@ def get_minecraft_dir() -> Path:
     else:  # Linux and other Unix-like OS
         return Path.home() / ".minecraft"
 
+def updated_record(mod: dict) -> dict:
+    """
+    교체가 끝난 모드의 새 정보를 만듭니다.
+    모드 폴더를 다시 스캔하지 않고 해당 모드의 표시만 갱신할 때 사용합니다.
+    """
+    record = ModRecord(mod)
+    record["file"] = mod["latest_filename"]
+    record["mod_version"] = mod.get("latest_version") or mod.get("mod_version")
+    record["status"] = "최신 버전"
+    for key in ("latest_version", "latest_filename", "download_url", "latest_sha1"):
+        record.pop(key, None)
+    return record
+
+@tracing.traced("update_mods")
+def update_mods(mods: list, mods_dir: Path = None, on_downloaded=None, should_continue=None, on_applied=None,
+                cancel=None) -> list:
+    """
+    여러 모드를 한 번에 업데이트합니다. 각 mod 딕셔너리에는 'download_url'과 'latest_filename'이 필요합니다.
+
+    다운로드는 병렬로 진행되고, 모드 폴더의 파일 교체는 저널에 커밋한 뒤에만 일어나므로
+    도중에 프로그램이 종료되어도 모드 폴더가 절반만 바뀐 상태로 남지 않습니다.
+
+    :param on_downloaded: 모드 하나의 다운로드가 끝날 때마다 mod를 인자로 호출됩니다.
+    :param should_continue: False를 반환하면 남은 다운로드를 중단하고 교체하지 않습니다.
+    :param on_applied: 교체가 끝난 모드마다 mod를 인자로 호출됩니다.
+    :param cancel: core.cancel.CancelToken. 취소되면 진행 중인 다운로드를 끊고 교체하지 않습니다.
+    :return: 실패한 (mod, 예외) 목록
+    """
+    mods_dir = mods_dir or get_minecraft_dir() / "mods"
+    failures = []
+    ready = []
+
+    # 1. 다운로드 + 해시 확인 (스테이징 폴더, 이미 미리 받아둔 파일은 건너뜀)
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        future_to_mod = {executor.submit(stage_download, mod, PRIORITY_DOWNLOAD, should_continue, cancel): mod for mod in mods}
+        for future in as_completed(future_to_mod):
+            mod = future_to_mod[future]
+            try:
+                if future.result() is None:
+                    raise RuntimeError("다운로드가 중단되었습니다.")
+                ready.append(mod)
+            except Exception as e:
+                failures.append((mod, e))
+            if on_downloaded:
+                on_downloaded(mod)
+
+    if (should_continue and not should_continue()) or (cancel and cancel.cancelled):
+        # 받은 파일은 스테이징 폴더에 남겨 다음 업데이트에서 재사용
+        return failures
+
+    ready_ids = {id(mod) for mod in ready}
+    return failures + apply_staged([mod for mod in mods if id(mod) in ready_ids], mods_dir, on_applied)
+
+@tracing.traced("apply_staged")
+def apply_staged(mods: list, mods_dir: Path, on_applied=None) -> list:
+    """
+    스테이징 폴더에 받아둔 새 파일로 모드들을 한 번의 저널 커밋으로 교체합니다.
+    (update_mods의 교체 단계. 다운로드를 따로 진행한 경우 직접 호출합니다)
+
+    :param on_applied: 교체가 끝난 모드마다 mod를 인자로 호출됩니다.
+    :return: 실패한 (mod, 예외) 목록
+    """
+    failures = []
+
+    # 스테이징부터 교체까지 다른 프로세스의 복구/정리와 겹치지 않도록 잠금
+    with journal_lock():
+        # 2. 모드 폴더 안으로 스테이징 (같은 드라이브여야 교체가 원자적)
+        remember_staging_dirs([mods_dir])
+        ops = []
+        for mod in mods:
+            op = make_op(mods_dir, mod["file"], mod['latest_filename'], mod.get('latest_sha1'))
+            try:
+                take_staged(mod, Path(op["staged"]))
+            except OSError as e:
+                failures.append((mod, e))
+                continue
+            op["log"] = update_record(mod, mod["file"], mod['latest_filename'], mods_dir)
+            ops.append((mod, op))
+
+        if not ops:
+            return failures
+
+        # 3. 커밋 후 4. 교체
+        commit_journal([op for _, op in ops])
+        applied = apply_journal([op for _, op in ops])
+    applied_ids = {id(op) for op in applied}
+    for mod, op in ops:
+        if id(op) in applied_ids:
+            print(f"   -> 기존 파일 백업 완료: {Path(op['backup']).name}")
+            if on_applied:
+                on_applied(mod)
+        else:
+            failures.append((mod, RuntimeError("파일 교체에 실패했습니다. (검증 실패 시 이전 파일로 복원, 파일 잠김 시 다음 실행에서 재시도)")))
+
+    # Log the update
+    append_records([op["log"] for op in applied])
+    record_lockfile(mods_dir)
+    return failures
+
 def update_mod(mod):
     """
     모드를 업데이트합니다. mod 딕셔너리에 'download_url'과 'latest_filename'이 포함되어 있어야 합니다.
     """
-    mods_dir = get_minecraft_dir() / "mods"
-    old_file_path = mods_dir / mod["file"]
-    new_file_path = mods_dir / mod['latest_filename']
-    backup_file_path = old_file_path.with_suffix(old_file_path.suffix + '.bak')
-
-    try:
-        # Download the new version
-        res = requests.get(mod['download_url'], timeout=60) # Increase timeout for large files
-        res.raise_for_status()
-
-        with open(new_file_path, 'wb') as f:
-            f.write(res.content)
-
-        # Backup the old file instead of deleting it
-        if old_file_path.exists():
-            if backup_file_path.exists():
-                os.remove(backup_file_path) # Remove old backup if it exists
-            os.rename(old_file_path, backup_file_path)
-            print(f"   -> 기존 파일 백업 완료: {backup_file_path.name}")
-
-        # Log the update
-        with LOG_FILE.open('a', encoding='utf-8') as f:
-            latest_version = mod.get('latest_version', 'N/A')
-            f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {mod['mod_name']} {mod.get('mod_version', 'unknown')} -> {latest_version} (file: {old_file_path.name} -> {new_file_path.name})\n")
-    except Exception as e:
-        raise RuntimeError(f"업데이트 오류: {e}")
-
-def rollback_mod(old_file_name: str, new_file_name: str):
+    failures = update_mods([mod])
+    if failures:
+        raise RuntimeError(f"업데이트 오류: {failures[0][1]}")
+
+def recover_interrupted_update(mods_dir: Path = None) -> list:
+    """
+    모드 폴더를 바꾸기 전에 호출합니다. 이전 실행에서 커밋된 채 끝나지 못한 교체를 마저 적용하고
+    커밋 전에 중단되어 남은 스테이징 파일을 정리합니다. (기본 모드 폴더, mods_dir, 스테이징했던 폴더)
+    다른 프로세스가 교체 중이면(저널 잠금) 기다리지 않고 건너뜁니다.
+    :return: 복구 과정에서 적용된 작업 목록
+    """
+    with journal_lock(wait=False) as locked:
+        if not locked:
+            print("다른 프로세스가 모드를 교체하는 중이라 중단된 업데이트 복구를 건너뜁니다.")
+            return []
+        applied = recover_journal()
+        append_records([op.get("log") for op in applied])
+        clean_stale_staged([get_minecraft_dir() / "mods", mods_dir])
+    return applied
+
+def rollback_mod(old_file_name: str, new_file_name: str, mods_dir: Path = None):
     """
     모드 업데이트를 롤백합니다.
-    백업된 이전 파일을 복원하고, 현재 파일을 삭제합니다.
+    백업된 이전 파일을 복원하고, 현재 파일을 삭제합니다. 업데이트처럼 저널에 커밋한 뒤 적용하므로
+    도중에 종료되어도 다음 실행에서 마저 적용됩니다.
+    :param mods_dir: 업데이트했던 모드 폴더 (로그 기록의 mods_dir). 없으면 기본 모드 폴더
     """
-    mods_dir = get_minecraft_dir() / "mods"
+    mods_dir = Path(mods_dir) if mods_dir else get_minecraft_dir() / "mods"
     backup_file = mods_dir / (old_file_name + '.bak')
-    current_file = mods_dir / new_file_name
-    restored_file = mods_dir / old_file_name
-
-    if not backup_file.exists():
-        raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_file}")
-
-    # 롤백: 백업 파일을 원래 이름으로 복원
-    # 복원하려는 파일이 이미 존재하면 덮어쓰기 방지를 위해 먼저 삭제
-    if restored_file.exists() and not restored_file.samefile(backup_file):
-         os.remove(restored_file)
-    os.rename(backup_file, restored_file)
-
-    # 현재 파일 삭제 (롤백된 파일과 다른 경우에만)
-    if current_file.exists() and not current_file.samefile(restored_file):
-        current_file.unlink()
-    
+
+    with journal_lock():
+        if not backup_file.exists():
+            raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_file}")
+        op = make_rollback_op(mods_dir, old_file_name, new_file_name,
+                              rollback_record(old_file_name, new_file_name, mods_dir))
+        commit_journal([op])
+        applied = apply_journal([op])
+    if not applied:
+        raise RuntimeError("파일을 되돌리지 못했습니다. (파일 잠김 시 다음 실행에서 재시도)")
+
     # 로그 기록
-    with LOG_FILE.open('a', encoding='utf-8') as f:
-        f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: [롤백] {new_file_name} -> {old_file_name}\n")
+    append_records([op["log"]])
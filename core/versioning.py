@@ -0,0 +1,210 @@
+import re
+from functools import lru_cache
+
+# 버전 문자열 정규화/비교. 정규식은 한 번만 컴파일하고, 같은 문자열은 다시 풀지 않도록 결과를 기억합니다.
+# - 모드 버전: normalize_version -> mod_version_key (packaging의 Version)
+# - 마인크래프트 버전: mc_version_key (정식/프리릴리스/RC/스냅샷/옛 알파·베타, 설치 폴더 이름도 가능)
+
+# 기억해 둘 문자열 수 (모드 수백 개 x 버전 수백 개를 충분히 담음)
+CACHE_SIZE = 16384
+
+# --- 모드 버전 ---
+_LOADER = r'(?:fabric|forge|neoforge|quilt)'
+_LOADER_PREFIX = re.compile(rf'^{_LOADER}-?', re.IGNORECASE)
+# 'mc1.20.1-0.5.3', '1.20.1-47.2.0', '0.9.2-1.20.1', '5.0+mc1.20.1', '1.21.1-fabric-0.16.5' 처럼 두 버전이 붙은 경우
+_PAIR = re.compile(rf'^(mc)?v?(\d+\.\d+(?:\.\d+)*)([+-])(?:mc)?(?:{_LOADER}-)?v?(\d+\.\d+(?:\.\d+)*)', re.IGNORECASE)
+# 앞에 붙은 주간 스냅샷: '23w31a-0.1'
+_SNAPSHOT_PREFIX = re.compile(r'^\d{2}w\d{2}[a-z]?[+-]', re.IGNORECASE)
+# '3.0.0-beta.3+1.20.1' 처럼 '+' 또는 '-' 뒤에 MC 버전('1.x', 'YYwWW')이 오는 경우 그 앞까지만
+_MC_SUFFIX = re.compile(r'[+-](?=(?:mc)?(?:\d{1,2}w\d{2,}|1\.\d{1,2}))', re.IGNORECASE)
+_NUMBER = re.compile(r'\d+(?:\.\d+)*')
+_DIGIT = re.compile(r'\d')
+# 번호 바로 뒤의 프리릴리스 표시: '-beta.2', '-rc.1', '-pre2', '1.1.0a', '-alpha', '-SNAPSHOT'
+_PRE_TAG = re.compile(r'[-.]?(alpha|beta|pre|rc|snapshot|a|b)(?![a-z])[-.]?(\d*)', re.IGNORECASE)
+_BUILD_TAG = re.compile(r'\+build[.-]?(\d+)', re.IGNORECASE)
+# PEP 440 표기 (pre는 rc와 같게 봄, SNAPSHOT은 개발 버전)
+_PEP440_TAGS = {"alpha": "a", "a": "a", "beta": "b", "b": "b", "pre": "rc", "rc": "rc", "snapshot": ".dev"}
+
+
+def _looks_like_mc(version: str) -> bool:
+    """'1.20.1', '1.21', '26.1' 처럼 마인크래프트 정식 버전 모양인지"""
+    parts = version.split(".")
+    return len(parts) <= 3 and (parts[0] == "1" or 26 <= int(parts[0]) <= 99)
+
+
+def _strip_mc(text: str) -> str:
+    """모드 버전 문자열에서 함께 적힌 마인크래프트 버전을 떼어 냅니다."""
+    text = _SNAPSHOT_PREFIX.sub('', text, 1)
+    match = _PAIR.match(text)
+    if match:
+        mc_prefix, first, sep, second = match.groups()
+        # 앞이 MC 버전: 'mc' 표시가 있거나, '-'로 이어지고 뒤는 MC 버전이 아니거나, 둘 다 MC 모양이면 마이너가 큰 쪽
+        # ('1.20.1-1.9.0'은 앞이 MC, '1.1.0-1.20.1'은 뒤가 MC)
+        if mc_prefix or (sep == "-" and _looks_like_mc(first) and (
+                not _looks_like_mc(second) or int(first.split(".")[1]) > int(second.split(".")[1]))):
+            return text[match.start(4):]
+        return text[:match.end(2)]
+    # 'iris-1.6.4+1.20'의 '-1.6'처럼 모드 번호보다 앞에 있는 것은 MC 버전이 아님
+    for match in _MC_SUFFIX.finditer(text):
+        if _DIGIT.search(text, 0, match.start()):
+            return text[:match.start()]
+    return text
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_version(version_str: str) -> str:
+    """
+    'v2.1-1.20.1', '5.0+mc1.20.1', 'mc1.20.1-0.5.3' 같은 복잡한 버전 문자열에서 MC 버전/로더 이름을 떼고
+    모드의 버전 번호만 PEP 440 형식으로 남깁니다. 숫자가 없으면 "0".
+    예) '1.0.0-fabric' -> '1.0.0', '3.0.0-beta.3+1.20.1' -> '3.0.0b3', '3.2.0+build.7' -> '3.2.0+build.7'
+    """
+    if not version_str:
+        return "0"
+    text = _strip_mc(_LOADER_PREFIX.sub('', version_str.strip()))
+    match = _NUMBER.search(text)
+    if not match:
+        return "0"
+    normalized = match.group(0)
+    tag = _PRE_TAG.match(text, match.end())
+    if tag:
+        normalized += f"{_PEP440_TAGS[tag.group(1).lower()]}{tag.group(2) or 0}"
+    build = _BUILD_TAG.match(text, tag.end() if tag else match.end())
+    if build:
+        normalized += f"+build.{build.group(1)}"
+    return normalized
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def mod_version_key(version_str: str):
+    """모드 버전 문자열의 비교 키 (packaging.version.Version, 프리릴리스 < 정식 < 빌드 표시)"""
+    from packaging.version import Version
+    return Version(normalize_version(version_str))
+
+
+def compare_mod_versions(a: str, b: str) -> int:
+    """a가 b보다 새 버전이면 1, 같으면 0, 오래됐으면 -1"""
+    key_a, key_b = mod_version_key(a), mod_version_key(b)
+    return (key_a > key_b) - (key_a < key_b)
+
+
+# --- 마인크래프트 버전 ---
+# 단계: 스냅샷 < 프리릴리스 < RC < 정식
+STAGE_SNAPSHOT = 0
+STAGE_PRE = 1
+STAGE_RC = 2
+STAGE_RELEASE = 3
+
+# 주간 스냅샷(YYwWWx)이 향하는 정식 버전: (첫 스냅샷, 마지막 스냅샷, 정식 버전)
+# 표에 없는 사이의 스냅샷은 다음 정식 버전 앞으로 갑니다.
+SNAPSHOT_RELEASES = (
+    ((13, 16), (13, 26), "1.6"),
+    ((13, 36), (13, 49), "1.7"),
+    ((14, 2), (14, 34), "1.8"),
+    ((15, 31), (16, 7), "1.9"),
+    ((16, 20), (16, 21), "1.10"),
+    ((16, 32), (16, 44), "1.11"),
+    ((17, 6), (17, 18), "1.12"),
+    ((17, 43), (18, 22), "1.13"),
+    ((18, 30), (18, 33), "1.13.1"),
+    ((18, 43), (19, 14), "1.14"),
+    ((19, 34), (19, 46), "1.15"),
+    ((20, 6), (20, 22), "1.16"),
+    ((20, 27), (20, 30), "1.16.2"),
+    ((20, 45), (21, 20), "1.17"),
+    ((21, 37), (21, 44), "1.18"),
+    ((22, 3), (22, 7), "1.18.2"),
+    ((22, 11), (22, 19), "1.19"),
+    ((22, 24), (22, 24), "1.19.1"),
+    ((22, 42), (22, 46), "1.19.3"),
+    ((23, 3), (23, 7), "1.19.4"),
+    ((23, 12), (23, 18), "1.20"),
+    ((23, 31), (23, 35), "1.20.2"),
+    ((23, 40), (23, 46), "1.20.3"),
+    ((24, 3), (24, 14), "1.20.5"),
+    ((24, 18), (24, 21), "1.21"),
+    ((24, 33), (24, 40), "1.21.2"),
+    ((24, 44), (24, 46), "1.21.4"),
+    ((25, 2), (25, 10), "1.21.5"),
+    ((25, 15), (25, 21), "1.21.6"),
+    ((25, 31), (25, 37), "1.21.9"),
+    ((25, 41), (25, 46), "1.21.11"),
+)
+# 표보다 새 주간 스냅샷의 정식 버전 자리: 1.21.x 뒤, 26.1 앞 (26.1부터는 '26.1-snapshot-1' 형식)
+_FUTURE = (26,)
+
+# 1.0 이전 버전의 시기 (rd < c(클래식) < inf(인데브/인프데브) < a(알파) < b(베타))
+_ERAS = {"rd": 0, "c": 1, "in": 2, "inf": 2, "a": 3, "b": 4}
+
+_SNAPSHOT = re.compile(r'(?<![\d.])(\d{2})w(\d{2})([a-z~∞]*)', re.IGNORECASE)
+# 1.20.5, 1.20.5-pre1, 1.20.5-rc1, 1.14 Pre-Release 3, 26.1, 26.1-snapshot-2, 26.1-pre-1, 26.1-rc-1
+# (연도식 번호는 26 이상만: 'neoforge-21.1.77' 같은 로더 버전과 헷갈리지 않도록)
+_RELEASE = re.compile(
+    r'(?<![\d.])(1\.\d+(?:\.\d+)?|(?:2[6-9]|[3-9]\d)\.\d+(?:\.\d+)?)'
+    r'(?:(?:-| )(pre|rc|snapshot|pre-release|release candidate)[- ]?(\d+))?',
+    re.IGNORECASE)
+_OLD = re.compile(r'^(rd|c|inf?|a|b)-?(\d+(?:\.\d+)*)', re.IGNORECASE)
+_STAGES = {"pre": STAGE_PRE, "pre-release": STAGE_PRE, "rc": STAGE_RC, "release candidate": STAGE_RC,
+           "snapshot": STAGE_SNAPSHOT}
+
+
+class McVersionKey(tuple):
+    """
+    마인크래프트 버전의 비교 키: (정식 버전 번호, 단계, 단계 안의 순서)
+    일반 튜플처럼 비교되므로 정렬이 빠릅니다. 알 수 없는 문자열은 가장 작습니다.
+    """
+    __slots__ = ()
+
+    @property
+    def release(self) -> tuple:
+        return self[0]
+
+    @property
+    def stage(self) -> int:
+        return self[1]
+
+
+UNKNOWN_MC_VERSION = McVersionKey(((), STAGE_SNAPSHOT, ()))
+
+
+def _numbers(text: str) -> tuple:
+    return tuple(int(part) for part in text.split("."))
+
+
+def _snapshot_release(year: int, week: int) -> tuple:
+    for first, last, release in SNAPSHOT_RELEASES:
+        if (year, week) <= last:
+            return _numbers(release)
+    return _FUTURE
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def mc_version_key(version_str: str) -> McVersionKey:
+    """
+    마인크래프트 버전(또는 '1.20.1-forge-47.2.0', 'fabric-loader-0.15.0-1.20.1' 같은 설치 폴더 이름)의 비교 키.
+    예) 1.20.4 < 24w14a < 1.20.5-pre1 < 1.20.5-rc1 < 1.20.5 < 1.21 < 26.1-snapshot-1 < 26.1
+    """
+    if not version_str:
+        return UNKNOWN_MC_VERSION
+    text = version_str.strip()
+    match = _SNAPSHOT.search(text)
+    if match:
+        year, week, letter = int(match.group(1)), int(match.group(2)), match.group(3).lower()
+        return McVersionKey((_snapshot_release(year, week), STAGE_SNAPSHOT, (year, week, letter)))
+    # 'b1.7.3'의 '1.7.3'을 정식 버전으로 보지 않도록 옛 버전을 먼저
+    match = _OLD.match(text)
+    if match:
+        era = _ERAS[match.group(1).lower()]
+        return McVersionKey(((0, era, *_numbers(match.group(2))), STAGE_RELEASE, ()))
+    match = _RELEASE.search(text)
+    if match:
+        release = _numbers(match.group(1))
+        if match.group(2):
+            stage = _STAGES[match.group(2).lower()]
+            return McVersionKey((release, stage, (int(match.group(3)),)))
+        return McVersionKey((release, STAGE_RELEASE, ()))
+    return UNKNOWN_MC_VERSION
+
+
+def sort_mc_versions(versions, reverse: bool = False) -> list:
+    """마인크래프트 버전 목록을 오래된 순서로 정렬합니다. (reverse=True면 최신 순서)"""
+    return sorted(versions, key=mc_version_key, reverse=reverse)
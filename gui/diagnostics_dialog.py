@@ -0,0 +1,315 @@
+import time
+from pathlib import Path
+from PySide6.QtWidgets import (
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView, QHeaderView,
+    QAbstractItemView, QCheckBox, QLabel, QFileDialog, QMessageBox, QTabWidget, QInputDialog
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from core import caches, tracing
+
+HEADERS = ["구간", "횟수", "전체 (ms)", "평균 (ms)", "최대 (ms)", "바이트", "상태 코드", "오류"]
+CACHE_HEADERS = ["캐시", "항목", "오래된 항목", "크기", "적중", "실패", "적중률", "제거"]
+
+
+class TraceSummaryModel(QAbstractTableModel):
+    """core.tracing.summary()를 구간별 한 줄로 보여주는 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def reload(self):
+        self.beginResetModel()
+        self._rows = tracing.summary()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.TextAlignmentRole and 0 < col < 6:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role != Qt.DisplayRole:
+            return None
+        if col == 0:
+            return row["name"]
+        if col == 1:
+            return str(row["count"])
+        if col in (2, 3, 4):
+            return f'{row[("total_ms", "mean_ms", "max_ms")[col - 2]]:.1f}'
+        if col == 5:
+            return f'{row["bytes"]:,}' if row["bytes"] else ""
+        if col == 6:
+            return ", ".join(f"{code}×{n}" for code, n in sorted(row["statuses"].items()))
+        if col == 7:
+            return str(row["errors"]) if row["errors"] else ""
+        return None
+
+
+class TracePanel(QWidget):
+    """구간 기록(core.tracing)을 켜고 끄며, 요약을 보고 파일로 내보냅니다. (느린 새로고침 제보용)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enable_check = QCheckBox("기록 켜기 (스캔/확인/업데이트에 걸린 시간을 기록)")
+        self.enable_check.setChecked(tracing.is_enabled())
+        self.enable_check.toggled.connect(self._set_enabled)
+        self.count_label = QLabel("")
+
+        self.model = TraceSummaryModel(self)
+        self.table = _table(self.model)
+
+        self.refresh_btn = QPushButton("새로고침")
+        self.refresh_btn.clicked.connect(self.reload)
+        self.clear_btn = QPushButton("기록 지우기")
+        self.clear_btn.clicked.connect(self._clear)
+        self.export_json_btn = QPushButton("JSON 내보내기...")
+        self.export_json_btn.clicked.connect(lambda: self._export(tracing.export_json, "trace.json"))
+        self.export_chrome_btn = QPushButton("Chrome 추적 내보내기...")
+        self.export_chrome_btn.clicked.connect(lambda: self._export(tracing.export_chrome_trace, "trace.chrome.json"))
+
+        top = QHBoxLayout()
+        top.addWidget(self.enable_check)
+        top.addStretch()
+        top.addWidget(self.count_label)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.refresh_btn)
+        buttons.addWidget(self.clear_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.export_json_btn)
+        buttons.addWidget(self.export_chrome_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+
+        self.reload()
+
+    def reload(self):
+        self.model.reload()
+        count = len(tracing.spans())
+        self.count_label.setText(f"기록된 구간 {count}개")
+        self.export_json_btn.setEnabled(count > 0)
+        self.export_chrome_btn.setEnabled(count > 0)
+
+    def _set_enabled(self, enabled: bool):
+        if enabled:
+            tracing.enable()
+        else:
+            tracing.disable()
+
+    def _clear(self):
+        tracing.reset()
+        self.reload()
+
+    def _export(self, export, default_name: str):
+        path, _ = QFileDialog.getSaveFileName(self, "기록 저장", str(Path.home() / default_name), "JSON (*.json)")
+        if not path:
+            return
+        try:
+            export(Path(path))
+        except OSError as e:
+            QMessageBox.critical(self, "오류", f"저장 실패: {e}")
+            return
+        QMessageBox.information(self, "완료", f"저장했습니다.\n{path}")
+
+
+class CacheStatsModel(QAbstractTableModel):
+    """core.caches.all_stats()를 캐시 레이어별 한 줄로 보여주는 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def reload(self):
+        self.beginResetModel()
+        self._rows = caches.all_stats()
+        self.endResetModel()
+
+    def layer_at(self, row: int) -> str:
+        return self._rows[row]["layer"]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(CACHE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return CACHE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ToolTipRole:
+            lines = [f"{label}: {count}개" for label, count in row["ages"].items()]
+            session = row["session"]
+            lines.append(f"이번 실행: 적중 {session['hits']} / 실패 {session['misses']} / 제거 {session['evictions']}")
+            if row["since"]:
+                lines.append(f"누적 시작: {time.strftime('%Y-%m-%d %H:%M', time.localtime(row['since']))}")
+            return "\n".join(lines)
+        if role == Qt.TextAlignmentRole and col > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role != Qt.DisplayRole:
+            return None
+        if col == 0:
+            return row["label"]
+        if col == 1:
+            return str(row["entries"])
+        if col == 2:
+            return str(row["stale"]) if row["stale"] else ""
+        if col == 3:
+            return f'{row["bytes"] / 1024:,.1f} KB' if row["bytes"] else ""
+        if col == 4:
+            return str(row["hits"])
+        if col == 5:
+            return str(row["misses"])
+        if col == 6:
+            return f'{row["hit_rate"]:.0%}' if row["hit_rate"] is not None else "-"
+        if col == 7:
+            return str(row["evictions"])
+        return None
+
+
+class CachePanel(QWidget):
+    """캐시 레이어별 상태를 보여주고 정리/비우기/미리 채우기를 합니다. (적중/실패는 GUI/CLI 실행들의 누적)"""
+
+    def __init__(self, scheduler=None, mods_dir=None, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.mods_dir = mods_dir
+
+        self.model = CacheStatsModel(self)
+        self.table = _table(self.model)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.hint_label = QLabel("나이 분포와 이번 실행의 횟수는 행에 마우스를 올리면 보입니다. 적중/실패는 CLI 실행까지 합친 누적 횟수입니다.")
+
+        self.refresh_btn = QPushButton("새로고침")
+        self.refresh_btn.clicked.connect(self.reload)
+        self.compact_btn = QPushButton("오래된 항목 정리")
+        self.compact_btn.clicked.connect(self._compact)
+        self.clear_btn = QPushButton("선택한 캐시 비우기")
+        self.clear_btn.clicked.connect(self._clear_selected)
+        self.clear_project_btn = QPushButton("프로젝트 비우기...")
+        self.clear_project_btn.clicked.connect(self._clear_project)
+        self.clear_instance_btn = QPushButton("이 모드 폴더 비우기")
+        self.clear_instance_btn.clicked.connect(self._clear_instance)
+        self.prewarm_btn = QPushButton("미리 채우기")
+        self.prewarm_btn.clicked.connect(self._prewarm)
+        self.clear_instance_btn.setEnabled(mods_dir is not None)
+        self.prewarm_btn.setEnabled(scheduler is not None and mods_dir is not None)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.refresh_btn)
+        buttons.addWidget(self.compact_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.clear_btn)
+        buttons.addWidget(self.clear_project_btn)
+        buttons.addWidget(self.clear_instance_btn)
+        buttons.addWidget(self.prewarm_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.hint_label)
+        layout.addLayout(buttons)
+
+        self.reload()
+
+    def reload(self):
+        self.model.reload()
+
+    def _report(self, removed: dict):
+        total = sum(removed.values())
+        details = "\n".join(f"- {caches.LAYER_LABELS[name]}: {count}개" for name, count in removed.items() if count)
+        QMessageBox.information(self, "완료", f"{total}개 항목을 지웠습니다." + (f"\n\n{details}" if details else ""))
+        self.reload()
+
+    def _compact(self):
+        self._report(caches.compact())
+
+    def _clear_selected(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            QMessageBox.warning(self, "경고", "비울 캐시를 선택하세요.")
+            return
+        name = self.model.layer_at(rows[0].row())
+        reply = QMessageBox.question(self, "캐시 비우기", f"'{caches.LAYER_LABELS[name]}' 캐시를 모두 지우시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self._report(caches.invalidate(caches.SCOPE_ALL, names=[name]))
+
+    def _clear_project(self):
+        project_id, ok = QInputDialog.getText(self, "프로젝트 비우기", "Modrinth 프로젝트 ID:")
+        if ok and project_id.strip():
+            self._report(caches.invalidate(caches.SCOPE_PROJECT, project_id.strip()))
+
+    def _clear_instance(self):
+        self._report(caches.invalidate(caches.SCOPE_INSTANCE, str(self.mods_dir)))
+
+    def _prewarm(self):
+        from core.mod_jobs import start_prewarm
+        if start_prewarm(self.scheduler, str(self.mods_dir)) is None:
+            QMessageBox.warning(self, "경고", "모드 폴더를 찾을 수 없습니다.")
+            return
+        QMessageBox.information(self, "미리 채우기", "모드 폴더를 스캔하며 캐시를 채우고 있습니다.\n잠시 뒤 새로고침하면 결과가 보입니다.")
+
+
+def _table(model) -> QTableView:
+    table = QTableView()
+    table.setModel(model)
+    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table.setSelectionBehavior(QAbstractItemView.SelectRows)
+    table.verticalHeader().hide()
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeToContents)
+    header.setSectionResizeMode(0, QHeaderView.Stretch)
+    return table
+
+
+class DiagnosticsDialog(QDialog):
+    """구간 기록과 캐시 상태를 보여주는 진단 창"""
+
+    def __init__(self, parent=None, scheduler=None, mods_dir=None):
+        """
+        :param scheduler: 캐시 미리 채우기 작업을 제출할 스케줄러
+        :param mods_dir: 현재 모드 폴더 (이 폴더의 캐시 비우기/미리 채우기 대상)
+        """
+        super().__init__(parent)
+        self.setWindowTitle("진단")
+        self.resize(850, 500)
+
+        self.trace_panel = TracePanel(self)
+        self.cache_panel = CachePanel(scheduler, mods_dir, self)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.trace_panel, "구간 기록")
+        self.tabs.addTab(self.cache_panel, "캐시")
+
+        self.close_btn = QPushButton("닫기")
+        self.close_btn.setObjectName("closeButton")
+        self.close_btn.clicked.connect(self.reject)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(self.close_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.tabs)
+        layout.addLayout(buttons)
@@ -0,0 +1,45 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from core.scheduler import JobScheduler
+
+
+class JobBridge(QObject):
+    """
+    core.scheduler.JobScheduler의 결과를 GUI 스레드로 넘겨줍니다.
+
+    submit(job, callback)으로 제출한 작업이 끝나면(완료/실패/취소) callback(job)이 GUI 스레드에서
+    호출됩니다. 작업 스레드에서 시그널을 보내므로 Qt가 큐에 넣어 전달합니다.
+    """
+    job_finished = Signal(object)
+
+    def __init__(self, scheduler: JobScheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self._callbacks = {}
+        self.job_finished.connect(self._dispatch)
+        scheduler.subscribe(self._on_job_finished)
+
+    def submit(self, job, callback=None):
+        if callback:
+            self._callbacks[job.id] = callback
+        return self.scheduler.submit(job)
+
+    def watch(self, job, callback):
+        """
+        이미 제출된 작업(예: 버전 선택 중에 시작한 준비 작업)이 끝나면 callback(job)을 GUI 스레드에서 호출합니다.
+        이미 끝난 작업이면 다음 이벤트 루프에서 호출합니다.
+        """
+        self._callbacks[job.id] = callback
+        if job.finished:
+            # 작업 스레드에서도 전달했다면 먼저 도착한 쪽만 호출됨 (_dispatch가 콜백을 꺼내 씀)
+            QTimer.singleShot(0, lambda: self._dispatch(job))
+
+    def _on_job_finished(self, job):
+        # 작업 스레드에서 호출됨
+        if job.id in self._callbacks:
+            self.job_finished.emit(job)
+
+    def _dispatch(self, job):
+        callback = self._callbacks.pop(job.id, None)
+        if callback:
+            callback(job)
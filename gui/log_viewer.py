@@ -1,16 +1,96 @@
 import sys
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QTextEdit, QPushButton, QApplication, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QMessageBox, QAbstractItemView
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QApplication, QTableView,
+    QHeaderView, QMessageBox, QAbstractItemView, QLineEdit
 )
-from PySide6.QtCore import Qt
-from pathlib import Path
-import re, os, shutil
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 from core.update_mod import rollback_mod
-from core.app_path import get_app_data_dir
+from core.update_log import read_page, PAGE_SIZE, KIND_UPDATE, KIND_ROLLBACK
+
+HEADERS = ["날짜", "모드 이름", "변경 사항", "파일"]
+# 검색어 입력이 멈춘 뒤 다시 읽기까지의 지연 (ms)
+FILTER_DELAY_MS = 250
+
+
+class UpdateLogModel(QAbstractTableModel):
+    """
+    업데이트 로그를 최신순으로 보여주는 모델.
+    처음에는 한 페이지만 읽고, 뷰가 아래로 스크롤하면 fetchMore()로 다음 페이지를 읽습니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records = []
+        self._cursor = None
+        self._has_more = True
+        self._query = ""
+
+    def reload(self, query: str = None):
+        if query is not None:
+            self._query = query
+        self.beginResetModel()
+        self._records = []
+        self._cursor = None
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def record_at(self, row: int) -> dict:
+        return self._records[row]
+
+    # --- 지연 로딩 ---
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        records, self._cursor = read_page(self._cursor, PAGE_SIZE, self._query)
+        self._has_more = self._cursor is not None
+        if not records:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        self.endInsertRows()
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        record = self._records[index.row()]
+        col = index.column()
+        kind = record.get("kind")
+        if col == 0:
+            return record.get("time", "")
+        if col == 1:
+            if kind == KIND_ROLLBACK:
+                return "[롤백]"
+            if kind == KIND_UPDATE:
+                return record.get("mod_name", "")
+            return record.get("message", "")
+        if col == 2:
+            if kind == KIND_UPDATE:
+                return f"{record.get('old_version', 'N/A')} -> {record.get('new_version', 'N/A')}"
+            return ""
+        if col == 3:
+            if kind == KIND_ROLLBACK:
+                return f"{record.get('new_file', '')} -> {record.get('old_file', '')}"
+            if kind == KIND_UPDATE:
+                return f"{record.get('old_file', '')} -> {record.get('new_file', '')}"
+        return None
 
-APP_DATA_DIR = get_app_data_dir()
-LOG_FILE = APP_DATA_DIR / "update_log.txt"
 
 class LogViewerDialog(QDialog):
     def __init__(self, parent=None):
@@ -18,82 +98,74 @@ class LogViewerDialog(QDialog):
         self.setWindowTitle("업데이트 로그")
         self.resize(800, 600) # 창 크기 조절 (가로, 세로)
 
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("모드 이름 또는 파일로 필터")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.load_logs)
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+
         # 테이블
-        self.table = QTableWidget(0, 5)
+        self.model = UpdateLogModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setHorizontalHeaderLabels(["날짜", "모드 이름", "변경 사항", "파일", "작업"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().hide()
         header = self.table.horizontalHeader()
+        header.setResizeContentsPrecision(PAGE_SIZE)
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents) # 날짜
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents) # 모드 이름
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents) # 변경 사항
         header.setSectionResizeMode(3, QHeaderView.Stretch)       # 파일
-        header.setSectionResizeMode(4, QHeaderView.Fixed) # 작업
-        self.table.verticalHeader().setDefaultSectionSize(50) # 행 높이를 50px로 증가
-        
+        self.table.selectionModel().selectionChanged.connect(self._update_rollback_button)
+        self.table.doubleClicked.connect(self.rollback_triggered)
+
+        self.rollback_btn = QPushButton("선택 항목 롤백")
+        self.rollback_btn.setEnabled(False)
+        self.rollback_btn.clicked.connect(self.rollback_triggered)
         self.close_btn = QPushButton("닫기")
         self.close_btn.setObjectName("closeButton") # QSS를 위한 Object Name
         self.close_btn.clicked.connect(self.close)
 
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.rollback_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.close_btn)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15) # 여백 주기
         layout.setSpacing(10) # 사이 간격!!
+        layout.addWidget(self.filter_edit)
         layout.addWidget(self.table)
-        layout.addWidget(self.close_btn, alignment=Qt.AlignRight)
+        layout.addLayout(buttons)
 
         self.load_logs()
 
     def load_logs(self):
-        self.table.setRowCount(0) # 테이블 초기화
-        if not LOG_FILE.exists():
-            self.table.setRowCount(1)
-            self.table.setItem(0, 0, QTableWidgetItem("로그 파일이 없습니다."))
-            self.table.setSpan(0, 0, 1, 5)
+        self.model.reload(self.filter_edit.text())
+        self._update_rollback_button()
+
+    def _selected_record(self) -> dict | None:
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.model.record_at(rows[0].row())
+
+    def _update_rollback_button(self, *args):
+        record = self._selected_record()
+        self.rollback_btn.setEnabled(bool(record) and record.get("kind") == KIND_UPDATE)
+
+    def rollback_triggered(self, *args):
+        record = self._selected_record()
+        if not record or record.get("kind") != KIND_UPDATE:
             return
-
-        logs = LOG_FILE.read_text(encoding="utf-8").strip().split("\n")
-        self.table.setRowCount(len(logs))
-
-        # 모드 이름 예외처리
-        log_pattern = re.compile(
-            r"^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}): "
-            r"(?P<mod_name>.*?) ?"
-            r"(?P<versions>[\w.+-]+\s->\s[\w.+-]+)? ?"
-            r"\(file: (?P<old_file>.*?) -> (?P<new_file>.*?)\)\s*$"
-        )
-
-        for row, log_entry in enumerate(reversed(logs)): # Show newest first
-            match = log_pattern.match(log_entry)
-
-            if match:
-                data = match.groupdict()
-                versions = data.get("versions") or "N/A" # Use N/A if versions not found
-                self.table.setItem(row, 0, QTableWidgetItem(data["timestamp"]))
-                self.table.setItem(row, 1, QTableWidgetItem(data["mod_name"]))
-                self.table.setItem(row, 2, QTableWidgetItem(versions))
-                self.table.setItem(row, 3, QTableWidgetItem(f"{data.get('old_file', '')} -> {data.get('new_file', '')}"))
-
-                rollback_btn = QPushButton("롤백")
-                rollback_btn.setMinimumHeight(40) # 버튼 높이를 40px로 설정
-                # Store the necessary info for the rollback action
-                rollback_btn.setProperty("old_file", data["old_file"])
-                rollback_btn.setProperty("new_file", data["new_file"])
-                rollback_btn.clicked.connect(self.rollback_triggered)
-                self.table.setCellWidget(row, 4, rollback_btn)
-            else:
-                timestamp, _, message = log_entry.partition(':')
-                self.table.setItem(row, 0, QTableWidgetItem(timestamp.strip()))
-                self.table.setItem(row, 1, QTableWidgetItem(message.strip()))
-                self.table.setSpan(row, 1, 1, 3) # Span message across 3 columns
-
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(4, 120)
-
-
-
-    def rollback_triggered(self):
-        button = self.sender()
-        old_file = button.property("old_file")
-        new_file = button.property("new_file")
+        old_file = record["old_file"]
+        new_file = record["new_file"]
 
         reply = QMessageBox.question(
             self,
@@ -104,7 +176,7 @@ class LogViewerDialog(QDialog):
 
         if reply == QMessageBox.Yes:
             try:
-                rollback_mod(old_file, new_file) # Call the re-added function
+                rollback_mod(old_file, new_file, record.get("mods_dir"))
                 QMessageBox.information(self, "성공", "롤백이 완료되었습니다.\n모드 목록을 새로고침하여 변경사항을 확인하세요.")
                 self.load_logs() # Refresh the log view
                 self.accept() # Close the dialog
@@ -117,21 +189,6 @@ class LogViewerDialog(QDialog):
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     # This is for testing the dialog independently
-    # Create a dummy log file
-    # Create a dummy log file with various log types
-    dummy_log = """2025-12-14 14:30:05: Some Mod 1.2.3 -> 1.3.0 (file: some-mod-1.2.3.jar -> some-mod-1.3.0.jar)
-2025-12-14 14:32:10: Another Mod 2.0.0 -> 2.1.0 (file: another-mod-2.0.jar -> another-mod-2.1.0.jar)
-2025-12-14 14:35:00: ROLLBACK: Rolled back 'another-mod-2.1.0.jar' to 'another-mod-2.0.jar'
-"""
-    LOG_FILE.write_text(dummy_log, encoding="utf-8")
-    
     dialog = LogViewerDialog()
     dialog.exec()
-    
-    # Clean up dummy file
-    LOG_FILE.unlink()
-    # Clean up dummy file if it exists
-    if LOG_FILE.exists():
-        LOG_FILE.unlink()
-    
-    sys.exit(app.exec())
+    sys.exit(0)
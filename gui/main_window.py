@@ -1,29 +1,66 @@
 from PySide6.QtWidgets import (
-    QWidget, QTableWidget, QTableWidgetItem, QCheckBox, QHBoxLayout, QVBoxLayout,
+    QWidget, QTableView, QHBoxLayout, QVBoxLayout,
     QPushButton, QLabel, QProgressBar, QApplication, QHeaderView, QMessageBox, QDialog,
-    QFileDialog, QFrame, QMenu, QAbstractItemView
+    QFileDialog, QFrame, QMenu, QAbstractItemView, QLineEdit, QComboBox
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QUrl
-from PySide6.QtGui import QColor, QFont, QAction, QDesktopServices
+from PySide6.QtCore import Qt, QPropertyAnimation, QUrl, QThread
+from PySide6.QtGui import QFont, QAction, QDesktopServices, QKeySequence, QShortcut
 from pathlib import Path
+import itertools
 import os
-from gui.loader_worker import LoaderWorker
-from gui.log_viewer import LogViewerDialog
-from gui.update_worker import UpdateWorker
-from gui.optimize_worker import OptimizeWorker
-from gui.version_dialog import VersionSelectionDialog
+from gui.job_bridge import JobBridge
+from gui.mod_table_model import ModTableModel, mod_key
+from gui.mod_filter_proxy import ModFilterProxyModel
+# 로그 뷰어/스냅샷/모드팩/버전 선택 창과 미리 받기 작업은 처음 쓸 때 가져옴 (첫 화면 표시 시간 단축)
+from core import tracing
 from core.app_path import get_mods_dir
-from core.config import save_selected_version
+from core.config import save_selected_version, is_prefetch_enabled
+from core.progress import ProgressReporter, format_eta
+from core.mod_index import FACET_LABELS
+from core.scheduler import Job, JobScheduler, JOB_SCAN, JOB_IDENTIFY, JOB_DOWNLOAD, DONE, CANCELLED
+from core.mod_record import ModRecord
+from core.modrinth_cache import load_snapshot, save_snapshot
+from core.modrinth_api import clear_version_index
+from core.mod_scanner import resolve_mods_dir, list_mod_files, ModsFolderNotFoundError
+from core.mod_jobs import (
+    scan_jobs, check_job, batch_check_job, update_jobs, optimize_jobs, check_key, CANCELLED_STATUS, CHECKING_STATUS,
+    GROUP_PREWARM
+)
+
+# 폴더 스캔 + 업데이트 확인 작업의 그룹 이름
+GROUP_LOAD = "load"
+ACTIVITY_CHECK = "업데이트 확인"
+ACTIVITY_REVALIDATE = "모드 폴더 다시 확인"
 
 class MainWindow(QWidget):
-    def __init__(self, selected_mc_version: str):
+    def __init__(self, selected_mc_version: str, scheduler: JobScheduler = None, prewarm: dict = None):
+        """
+        :param scheduler: 버전을 고르는 동안 준비 작업을 실행한 스케줄러 (없으면 새로 만듦)
+        :param prewarm: core.mod_jobs.start_prewarm의 결과. 첫 로딩에서 이어받아 스캔을 다시 하지 않음
+        """
         super().__init__()
         self.setWindowTitle("마인크래프트 모드 관리자")
         self.resize(900, 700)
         self.selected_mc_version = selected_mc_version
         self.loading = None
-        self.update_worker = None
-        self.optimize_worker = None
+        self.prefetch_worker = None
+        self.mrpack_worker = None
+
+        # 스캔/확인/다운로드/교체 작업은 하나의 스케줄러에서 실행 (서로 겹쳐서 진행 가능)
+        self.scheduler = scheduler or JobScheduler()
+        self._prewarm = prewarm
+        self.jobs = JobBridge(self.scheduler, self)
+        # load_mods를 다시 부르면 이전 로딩의 늦게 도착한 결과는 무시
+        self._load_generation = 0
+        # 취소된 로딩에서 확인을 마친 결과 (다음 로딩에서 재사용)
+        self._known_checks = {}
+        # 업데이트/최적화가 진행 중인 모드 키
+        self._busy_keys = set()
+        # 진행 중인 작업 묶음 {이름: [완료 수, 전체 수]}
+        self._activities = {}
+        self._batch_ids = itertools.count(1)
+        # 마지막으로 불러온 모드 폴더 (목록 저장용)
+        self._mods_dir = None
 
         # --- 상단 버전 선택 UI ---
         self.version_info_layout = QHBoxLayout()
@@ -57,22 +94,60 @@ class MainWindow(QWidget):
         self.info_label.setFont(font)
         self.info_label.hide()
 
+        # --- 검색/필터 ---
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("검색 (이름, 파일, 프로젝트 ID, 로더, 상태)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.facet_combo = QComboBox()
+        for facet, label in FACET_LABELS.items():
+            self.facet_combo.addItem(label, facet)
+        self.select_filtered_btn = QPushButton("검색 결과 모두 선택")
+        self.select_filtered_btn.clicked.connect(self._select_filtered_mods)
+        self.filter_count_label = QLabel("")
+
+        self.filter_layout = QHBoxLayout()
+        self.filter_layout.addWidget(self.search_edit, 1)
+        self.filter_layout.addWidget(self.facet_combo)
+        self.filter_layout.addWidget(self.select_filtered_btn)
+        self.filter_layout.addWidget(self.filter_count_label)
+
         # --- 테이블 ---
-        self.table = QTableWidget(0, 5)
+        self.mods = []
+        self.table_model = ModTableModel(self)
+        self.filter_model = ModFilterProxyModel(self)
+        self.filter_model.setSourceModel(self.table_model)
+        self.filter_model.layoutChanged.connect(self._update_filter_count)
+        self.filter_model.rowsInserted.connect(self._update_filter_count)
+        self.filter_model.rowsRemoved.connect(self._update_filter_count)
+        self.filter_model.modelReset.connect(self._update_filter_count)
+        self.search_edit.textChanged.connect(self.filter_model.set_query)
+        self.facet_combo.currentIndexChanged.connect(
+            lambda i: self.filter_model.set_facet(self.facet_combo.itemData(i))
+        )
+        self.table = QTableView()
+        self.table.setModel(self.filter_model)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setHorizontalHeaderLabels(["선택", "파일", "로더", "MC 버전", "상태"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_table_context_menu)
+        # 행 높이를 고정해 보이지 않는 행의 크기 계산을 피함
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().hide()
         header = self.table.horizontalHeader()
+        # 내용 맞춤 열 너비는 앞쪽 일부 행만 보고 계산
+        header.setResizeContentsPrecision(200)
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        # 헤더 클릭으로 정렬 (처음에는 스캔 결과 순서 그대로)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
 
         # --- 하단 버튼 ---
         self.refresh_btn = QPushButton("새로고침")
-        self.refresh_btn.clicked.connect(self.load_mods)
+        self.refresh_btn.clicked.connect(self._refresh)
         self.update_btn = QPushButton("업데이트")
         self.update_btn.clicked.connect(self.update_selected_mods)
         self.log_btn = QPushButton("로그 보기")
@@ -89,9 +164,34 @@ class MainWindow(QWidget):
         self.optimize_btn = QPushButton("버전 최적화")
         self.optimize_btn.clicked.connect(self._optimize_selected_mods)
         self.btn_layout.addWidget(self.optimize_btn)
+        self.export_btn = QPushButton("모드팩 내보내기")
+        self.export_btn.clicked.connect(self._export_mrpack)
+        self.btn_layout.addWidget(self.export_btn)
+        self.import_btn = QPushButton("모드팩 가져오기")
+        self.import_btn.clicked.connect(self._import_mrpack)
+        self.btn_layout.addWidget(self.import_btn)
         self.btn_layout.addWidget(self.select_folder_btn)
         self.btn_layout.addStretch()
+        # 진행 중인 백그라운드 작업 표시줄
+        self.activity_label = QLabel("")
+        self.activity_cancel_btn = QPushButton("작업 취소")
+        self.activity_cancel_btn.clicked.connect(self._cancel_running_task)
+        self.activity_layout = QHBoxLayout()
+        self.activity_layout.addWidget(self.activity_label, 1)
+        self.activity_layout.addWidget(self.activity_cancel_btn)
+        self.activity_label.hide()
+        self.activity_cancel_btn.hide()
+
+        self.snapshot_btn = QPushButton("스냅샷")
+        self.snapshot_btn.clicked.connect(self.show_snapshot_dialog)
+        self.btn_layout.addWidget(self.snapshot_btn)
         self.btn_layout.addWidget(self.log_btn)
+        self.diagnostics_btn = QPushButton("진단")
+        self.diagnostics_btn.clicked.connect(self.show_diagnostics_dialog)
+        self.btn_layout.addWidget(self.diagnostics_btn)
+        # 숨은 기능: 프로파일 시작/멈춤 (느린 원인을 버그 제보에 첨부할 때)
+        self._profiler = None
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.toggle_profiling)
 
         # --- 메인 레이아웃 ---
         layout = QVBoxLayout(self)
@@ -100,28 +200,32 @@ class MainWindow(QWidget):
         layout.addLayout(self.version_info_layout)
         layout.addWidget(line)
         layout.addWidget(self.info_label)
+        layout.addLayout(self.filter_layout)
         layout.addWidget(self.table)
+        layout.addLayout(self.activity_layout)
         layout.addLayout(self.btn_layout)
         
         self.info_label.hide()
         self.table.show()
 
-        self.worker = None
         self.load_mods()
 
     def _change_mc_version(self):
+        from gui.version_dialog import VersionSelectionDialog
         new_version = VersionSelectionDialog.get_selected_version(self)
         if new_version and new_version != self.selected_mc_version:
             self.selected_mc_version = new_version
             save_selected_version(new_version)
             self.version_label.setText(f"대상 마인크래프트 버전: {self.selected_mc_version}")
-            self.load_mods() # 버전 변경 시 자동 새로고침
+            self._reload_mods() # 버전 변경 시 자동 새로고침
     
     def show_table_context_menu(self, pos):
-        row = self.table.rowAt(pos.y())
-        if row < 0:
+        view_row = self.table.rowAt(pos.y())
+        if view_row < 0:
             return
 
+        # 정렬/필터가 적용된 화면의 행을 원본 행으로 변환
+        row = self.filter_model.source_row(view_row)
         mod = self.mods[row]
         is_enabled = mod.get("enabled", True)
         
@@ -136,7 +240,7 @@ class MainWindow(QWidget):
         mod = self.mods[row]
         is_currently_enabled = mod["enabled"]
 
-        mods_dir = get_mods_dir()
+        mods_dir = self._mods_dir
         current_path = mods_dir / mod["file"]
 
         if is_currently_enabled:
@@ -159,71 +263,42 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, "오류", f"파일 이름 변경 실패: {e}\n\n오류 제보: https://discord.gg/FzS6sPsr")
 
     def _update_row_display(self, row):
-        mod = self.mods[row]
-        is_enabled = mod.get("enabled", True)
+        self.table_model.refresh_row(row)
 
-        # Update checkbox state
-        checkbox_widget = self.table.cellWidget(row, 0)
-        if checkbox_widget:
-            checkbox = checkbox_widget.layout().itemAt(0).widget()
-            checkbox.setEnabled(is_enabled)
-            if not is_enabled:
-                checkbox.setChecked(False)
-
-        # Update file name text
-        file_item = self.table.item(row, 1)
-        if file_item:
-            file_item.setText(mod.get("file", ""))
-
-        # --- Update Status and Colors ---
-        status = mod.get("status", "")
-        
-        # Determine text and color for the status column
-        if not is_enabled:
-            status_text = "비활성화됨"
-            display_color = QColor("#808080")  # Gray for disabled
-            tooltip = f"원래 상태: {status}"
-        else:
-            status_text = status
-            tooltip = status
-            # Determine status-specific color
-            if status == "업데이트 가능": display_color = QColor("#f1c40f")
-            elif status in ["최신 버전", "Modrinth 확인됨", "캐시됨"]: display_color = QColor("#2ecc71")
-            elif "버전 높음" in status: display_color = QColor("#3498db")
-            elif status in ["프로젝트 못찾음", "호환 버전 없음", "API 요청 실패", "API 응답 오류"]: display_color = QColor("#e67e22")
-            elif "오류" in status or "실패" in status: display_color = QColor("#e74c3c")
-            else: display_color = QColor("#95a5a6")
-
-        # Update status item
-        status_item = self.table.item(row, 4)
-        if status_item:
-            status_item.setText(status_text)
-            status_item.setForeground(display_color)
-            status_item.setToolTip(tooltip)
-        
-        # Update foreground color for the entire row
-        if not is_enabled:
-            # Set all text to gray
-            for col in range(1, self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item.setForeground(display_color)
-        else:
-            # Revert other columns to default text color
-            default_text_color = self.palette().color(self.foregroundRole())
-            for col in range(1, 4):
-                item = self.table.item(row, col)
-                if item:
-                    item.setForeground(default_text_color)
-            
-            # Set color for status column
-            if status_item:
-                status_item.setForeground(display_color)
+    def _select_filtered_mods(self):
+        """현재 검색/필터 결과에 보이는 모드를 모두 체크합니다."""
+        self.table_model.set_checked_rows(self.filter_model.visible_source_rows())
+
+    def _update_filter_count(self, *args):
+        total = self.table_model.rowCount()
+        shown = self.filter_model.rowCount()
+        self.filter_count_label.setText(f"{shown} / {total}" if self.filter_model.is_filtered() else f"{total}개")
 
+    def _on_mod_updated(self, old_file: str, mod: dict):
+        """작업이 끝난 모드 한 개의 행만 갱신합니다."""
+        self.table_model.replace_mod(mod_key(old_file), mod)
+
+
+    def _refresh(self):
+        # 새로고침은 받아 둔 버전 목록도 버리고 최신 정보로 확인 (버전 변경은 받아 둔 목록을 재사용)
+        clear_version_index()
+        self._reload_mods()
+
+    def _reload_mods(self):
+        """지금 보고 있는 모드 폴더를 다시 불러옵니다. (아직 스캔한 폴더가 없으면 기본 폴더)"""
+        self.load_mods(str(self._mods_dir) if self._mods_dir else None)
 
     def load_mods(self, mods_dir_path: str = None):
-        if self.worker and self.worker.isRunning():
+        if self._busy_keys:
+            QMessageBox.information(self, "알림", "진행 중인 업데이트가 끝난 뒤에 다시 시도하세요.")
             return
+        # 진행 중인 로딩은 취소하고, 확인을 마친 결과는 self._known_checks에 남아 새 로딩에서 재사용
+        self.scheduler.cancel_group(GROUP_LOAD)
+        prewarm, self._prewarm = self._prewarm, None
+        self._load_generation += 1
+        generation = self._load_generation
+        self._end_activity(ACTIVITY_CHECK)
+        self._end_activity(ACTIVITY_REVALIDATE)
 
         # UI 초기화
         self.info_label.hide()
@@ -231,22 +306,67 @@ class MainWindow(QWidget):
         self.refresh_btn.show()
         self.update_btn.show()
         self.table.show()
-        self.table.clearContents()
-        self.table.setRowCount(0)
-
-        if self.worker:
-            self.worker.quit()
-            self.worker.wait()
-
-        self.worker = LoaderWorker(self.selected_mc_version, mods_dir_path)
-        self.worker.progress.connect(self._on_progress)
-        self.worker.message.connect(self._on_message)
-        self.worker.eta.connect(self._on_eta)
-        self.worker.finished.connect(self._on_loaded)
-        self.worker.error.connect(self._on_worker_error)
-        self.worker.mods_folder_not_found.connect(self._on_mods_folder_not_found)
-        self.worker.start()
-        self.show_loading("모드 정보 로딩중...")
+        self.mods = []
+        self.table_model.set_mods([])
+
+        self._stop_prefetch()
+
+        try:
+            mods_dir = resolve_mods_dir(mods_dir_path)
+            files = list_mod_files(mods_dir)
+        except ModsFolderNotFoundError:
+            self.scheduler.cancel_group(GROUP_PREWARM)
+            self._on_mods_folder_not_found()
+            return
+        except OSError as e:
+            self.scheduler.cancel_group(GROUP_PREWARM)
+            self._on_worker_error(f"모드 스캔 중 오류 발생: {e}")
+            return
+        self._mods_dir = mods_dir
+
+        # 프로그램을 켤 때는 지난 실행의 목록을 바로 보여주고 뒤에서 다시 스캔/확인 (오래된 행은 표시)
+        stale_rows = None
+        if generation == 1:
+            snapshot = load_snapshot(mods_dir, self.selected_mc_version)
+            if snapshot:
+                for mod in snapshot:
+                    mod["stale"] = True
+                stale_rows = {mod_key(mod): mod for mod in snapshot}
+                self.mods = snapshot
+                self.table_model.set_mods(snapshot)
+                self.show()
+
+        if stale_rows is not None:
+            self._begin_activity(ACTIVITY_REVALIDATE, len(files))
+
+            def on_identified(job):
+                if generation == self._load_generation:
+                    self._advance_activity(ACTIVITY_REVALIDATE)
+        else:
+            self.show_loading("모드 폴더를 스캔하는 중...")
+            reporter = ProgressReporter(self._on_snapshot)
+            reporter.begin(len(files), "모드 폴더를 스캔하는 중...")
+
+            def on_identified(job):
+                if generation == self._load_generation:
+                    reporter.item_done(f"{job.name} 분석 완료")
+
+        if (prewarm and prewarm["mods_dir"] == mods_dir and sorted(prewarm["files"]) == sorted(files)
+                and not prewarm["done"].cancel.cancelled):
+            # 버전을 고르는 동안 시작한 스캔을 이어받음 (끝난 작업은 바로 반영)
+            for job in prewarm["jobs"]:
+                if job.kind == JOB_IDENTIFY:
+                    self.jobs.watch(job, on_identified)
+            self.jobs.watch(prewarm["done"],
+                            lambda job: self._on_scanned(job, generation, prewarm["index"], stale_rows))
+            return
+
+        # 폴더가 바뀌었거나 새로고침이면 준비 작업은 버리고 처음부터
+        self.scheduler.cancel_group(GROUP_PREWARM)
+        jobs, done = scan_jobs(mods_dir, files, GROUP_LOAD)
+        for job in jobs:
+            self.jobs.submit(job, on_identified if job.kind == JOB_IDENTIFY else None)
+        self.jobs.submit(done, lambda job: self._on_scanned(job, generation, None, stale_rows))
 
     def _select_mods_folder(self):
         dir_path = QFileDialog.getExistingDirectory(self, "모드 폴더를 선택하세요", str(Path.home()))
@@ -254,6 +374,7 @@ class MainWindow(QWidget):
             self.load_mods(mods_dir_path=dir_path)
 
     def show_log_dialog(self):
+        from gui.log_viewer import LogViewerDialog
         dialog = LogViewerDialog(self)
         
         # 디스코드 버튼 추가
@@ -264,7 +385,38 @@ class MainWindow(QWidget):
             dialog.layout().addWidget(discord_btn)
 
         if dialog.exec() == QDialog.Accepted:
-            self.load_mods()
+            self._reload_mods()
+
+    def show_snapshot_dialog(self):
+        from gui.snapshot_dialog import SnapshotDialog
+        dialog = SnapshotDialog(self._mods_dir or get_mods_dir(), self)
+        if dialog.exec() == QDialog.Accepted:
+            self._reload_mods()
+
+    def show_diagnostics_dialog(self):
+        from gui.diagnostics_dialog import DiagnosticsDialog
+        DiagnosticsDialog(self, self.scheduler, self._mods_dir).exec()
+
+    def toggle_profiling(self):
+        from core.profiling import SamplingProfiler
+        if self._profiler is None:
+            self._profiler = SamplingProfiler()
+            self._profiler.start()
+            self.setWindowTitle("마인크래프트 모드 관리자 [프로파일 중 - Ctrl+Shift+P로 멈춤]")
+            return
+
+        profiler, self._profiler = self._profiler, None
+        profiler.stop()
+        self.setWindowTitle("마인크래프트 모드 관리자")
+        try:
+            path = profiler.write_report()
+        except OSError as e:
+            QMessageBox.critical(self, "오류", f"프로파일 저장 실패: {e}")
+            return
+        reply = QMessageBox.question(self, "프로파일", f"프로파일을 저장했습니다.\n{path}\n\n폴더를 열까요?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(path.parent)))
 
     def _on_worker_error(self, error_message):
         self.show()
@@ -275,8 +427,7 @@ class MainWindow(QWidget):
         
         self.refresh_btn.setEnabled(True)
         self.update_btn.setEnabled(True)
-        self.worker = None
-        self.update_worker = None
+        self.optimize_btn.setEnabled(True)
 
     def _on_mods_folder_not_found(self):
         self.show()
@@ -295,7 +446,6 @@ class MainWindow(QWidget):
         )
         self.info_label.show()
         self.select_folder_btn.show()
-        self.worker = None
 
     def show_loading(self, initial_message="로딩중..."):
         if self.loading is None:
@@ -317,18 +467,22 @@ class MainWindow(QWidget):
             self.progress_bar.setMaximum(100)
             self.eta_label = QLabel("")
             self.eta_label.setAlignment(Qt.AlignCenter)
+            self.cancel_btn = QPushButton("취소")
+            self.cancel_btn.clicked.connect(self._cancel_running_task)
 
             vbox.addWidget(self.loading_label)
             vbox.addSpacing(10)
             vbox.addWidget(self.progress_bar)
             vbox.addSpacing(6)
             vbox.addWidget(self.eta_label)
+            vbox.addWidget(self.cancel_btn, alignment=Qt.AlignCenter)
 
             self.fade_anim = QPropertyAnimation(self.loading, b"windowOpacity", self.loading)
             self.fade_anim.setStartValue(0.0)
             self.fade_anim.setEndValue(1.0)
             self.fade_anim.setDuration(300)
 
+        self.cancel_btn.setEnabled(True)
         self.loading.show()
         self.fade_anim.start()
 
@@ -343,19 +497,51 @@ class MainWindow(QWidget):
             y = screen.center().y() - h // 2
             self.loading.setGeometry(x, y, w, h)
 
-    def _on_progress(self, value):
-        if self.loading:
-            self.progress_bar.setValue(value)
-
-    def _on_message(self, msg):
-        if self.loading:
-            self.loading_label.setText(msg)
-
-    def _on_eta(self, msg):
+    def _cancel_running_task(self):
+        """취소 버튼. 진행 중인 작업에 취소 신호를 보냅니다. (결과는 각 작업의 콜백/시그널로 옴)"""
+        if self.loading and self.loading.isVisible():
+            self.cancel_btn.setEnabled(False)
+            self.loading_label.setText("취소하는 중...")
+        for group in self.scheduler.active_groups():
+            self.scheduler.cancel_group(group)
+        if self.mrpack_worker and self.mrpack_worker.isRunning() and hasattr(self.mrpack_worker, "cancel"):
+            self.mrpack_worker.cancel()
+
+    # --- 백그라운드 작업 표시 ---
+    def _begin_activity(self, name: str, total: int):
+        self._activities[name] = [0, total]
+        self._refresh_activity_label()
+
+    def _advance_activity(self, name: str) -> bool:
+        """완료 수를 하나 늘립니다. 묶음의 모든 작업이 끝났으면 표시줄에서 지우고 True를 반환합니다."""
+        entry = self._activities.get(name)
+        if entry is None:
+            return False
+        entry[0] += 1
+        if entry[0] >= entry[1]:
+            self._end_activity(name)
+            return True
+        self._refresh_activity_label()
+        return False
+
+    def _end_activity(self, name: str):
+        self._activities.pop(name, None)
+        self._refresh_activity_label()
+
+    def _refresh_activity_label(self):
+        text = "  ·  ".join(f"{name} {done}/{total}" for name, (done, total) in self._activities.items())
+        self.activity_label.setText(text)
+        self.activity_label.setVisible(bool(text))
+        self.activity_cancel_btn.setVisible(bool(text))
+
+    def _on_snapshot(self, snapshot: dict):
+        """작업 스레드가 모아서 보낸 진행 상황을 로딩 창에 표시합니다."""
         if self.loading:
-            self.eta_label.setText(msg)
+            self.progress_bar.setValue(snapshot["percent"])
+            self.loading_label.setText(snapshot["message"])
+            self.eta_label.setText(format_eta(snapshot["eta_seconds"]))
 
-    def _on_loaded(self, mods: list):
+    def _close_loading(self):
         if self.loading:
             fade_out = QPropertyAnimation(self.loading, b"windowOpacity", self.loading)
             fade_out.setStartValue(1.0)
@@ -368,98 +554,141 @@ class MainWindow(QWidget):
         else:
             self.show()
 
+    def _on_scanned(self, job, generation: int, index: dict = None, stale_rows: dict = None):
+        """
+        스캔이 끝나면 목록을 바로 보여주고 모드별 업데이트 확인 작업을 제출합니다.
+        확인이 끝난 행부터 갱신되므로, 이미 확인된 모드는 나머지 확인을 기다리지 않고 업데이트할 수 있습니다.
+        :param index: 준비 작업의 {파일 이름: 버전 목록 작업}. 확인은 해당 작업 뒤에 받아 둔 목록으로 계산
+        :param stale_rows: 먼저 보여준 지난 실행의 목록 {키: 모드}. 파일이 그대로인 모드는 확인이 끝날 때까지
+            지난 상태를 '오래된' 표시와 함께 유지합니다.
+        """
+        if generation != self._load_generation:
+            return
+        self._end_activity(ACTIVITY_REVALIDATE)
+        if job.state != DONE:
+            self._on_worker_error(f"모드 스캔 중 오류 발생: {job.error}")
+            return
+        self._close_loading()
+
+        mods = job.result
         if not mods:
+            self.mods = []
+            self.table_model.set_mods([])
             self.table.hide()
             self.info_label.setText("모드 폴더에 설치된 모드가 없습니다.")
             self.info_label.show()
             self.select_folder_btn.hide()
             self.refresh_btn.show()
             self.update_btn.show()
-            self.worker = None
             return
-        
+
+        # 취소된 스캔은 그때까지 분석된 모드만 보여줌
+        cancelled = job.cancel.cancelled
+        rows = []
+        for mod in mods:
+            mod["status"] = CANCELLED_STATUS if cancelled else CHECKING_STATUS
+            old = (stale_rows or {}).get(mod_key(mod))
+            if old and old.get("file") == mod["file"] and old.get("mod_version") == mod["mod_version"]:
+                # 파일이 그대로면 지난 상태(와 받을 파일 정보)를 확인이 끝날 때까지 보여줌
+                row = ModRecord(old)
+                row.update(mod)
+                row["status"] = old.get("status", mod["status"])
+                row["stale"] = True
+                rows.append(row)
+            else:
+                rows.append(ModRecord(mod))
         self.info_label.hide()
         self.table.show()
-        self.mods = mods
-        try:
-            self.table.setRowCount(len(mods))
-            for row, mod in enumerate(mods):
-                box_widget = QWidget()
-                box_layout = QHBoxLayout(box_widget)
-                box_layout.setContentsMargins(0, 0, 0, 0)
-                box_layout.setAlignment(Qt.AlignCenter)
-                checkbox = QCheckBox()
-                # 체크박스 설정
-                checkbox = QCheckBox()
-                if not mod.get("enabled", True):
-                    checkbox.setEnabled(False)
-                box_layout.addWidget(checkbox)
-                self.table.setCellWidget(row, 0, box_widget)
-
-                # 나머지 셀 아이템 생성
-                file_item = QTableWidgetItem(mod.get("file", ""))
-                loaders_item = QTableWidgetItem(", ".join(mod.get("loaders", [])))
-                mc_version_item = QTableWidgetItem(mod.get("mc_version", "-"))
-                
-                self.table.setItem(row, 1, file_item)
-                self.table.setItem(row, 2, loaders_item)
-                self.table.setItem(row, 3, mc_version_item)
-
-                # MC 버전 툴팁 설정
-                all_mc_versions = mod.get("all_mc_versions", [])
-                if all_mc_versions:
-                    tooltip_text = "이 프로젝트가 지원하는 모든 버전:\n\n" + ", ".join(all_mc_versions)
-                    mc_version_item.setToolTip(tooltip_text)
-                
-                # 상태 아이템 생성 및 설정
-                is_enabled = mod.get("enabled", True)
-                status = mod.get("status", "")
-                tooltip_status = status
-                if not is_enabled:
-                    status_text = "비활성화됨"
-                    status_color = QColor("#808080") # 회색
-                    tooltip_status = f"원래 상태: {status}"
-                else:
-                    status_text = status
-                    # 상태별 색상 결정
-                    if status == "업데이트 가능": status_color = QColor("#f1c40f")
-                    elif status in ["최신 버전", "Modrinth 확인됨", "캐시됨"]: status_color = QColor("#2ecc71")
-                    elif "버전 높음" in status: status_color = QColor("#3498db")
-                    elif status in ["프로젝트 못찾음", "호환 버전 없음", "API 요청 실패", "API 응답 오류"]: status_color = QColor("#e67e22")
-                    elif "오류" in status or "실패" in status: status_color = QColor("#e74c3c")
-                    else: status_color = QColor("#95a5a6")
-
-                status_item = QTableWidgetItem(status_text)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                status_item.setForeground(status_color)
-                status_item.setToolTip(tooltip_status)
-                self.table.setItem(row, 4, status_item)
-
-                # 비활성화된 모드의 모든 셀 글자색 변경
-                if not is_enabled:
-                    for col in range(1, self.table.columnCount()):
-                        self.table.item(row, col).setForeground(status_color)
-            
-            self.table.resizeColumnsToContents()
-        except Exception as e:
-            print(f"테이블 업데이트 오류: {e}")
-        
-        self.worker = None
+        with tracing.span("gui.populate", rows=len(rows)):
+            if stale_rows is not None and set(stale_rows) == {mod_key(m) for m in rows}:
+                # 모드 구성이 같으면 행을 제자리에서 바꿔 선택/스크롤/정렬을 유지
+                for row in rows:
+                    self.table_model.replace_mod(mod_key(row), row)
+            else:
+                self.mods = rows
+                # 행 위젯을 만들지 않고 모델만 교체 (셀은 보일 때 그려짐)
+                self.table_model.set_mods(rows)
+        if cancelled:
+            return
+
+        self._begin_activity(ACTIVITY_CHECK, len(mods))
+        # 준비 작업의 버전 목록이 없으면 락파일 해시로 한 번에 조회 (모드마다 요청하지 않음)
+        batch = None
+        if not index:
+            batch = self.jobs.submit(batch_check_job(mods, self.selected_mc_version, self._mods_dir, GROUP_LOAD,
+                                                     known=self._known_checks))
+        for mod in mods:
+            self.jobs.submit(
+                check_job(mod, self.selected_mc_version, GROUP_LOAD,
+                          depends_on=[index[mod["file"]]] if index and mod["file"] in index else (),
+                          known=self._known_checks, batch=batch),
+                lambda job, key=mod_key(mod): self._on_checked(job, key, generation)
+            )
+
+    def _on_checked(self, job, key: str, generation: int):
+        if generation != self._load_generation:
+            return
+        row = self.table_model.row_for(key)
+        if row is None:
+            return
+        current = self.table_model.mod_at(row)
+        if job.state == DONE:
+            self._known_checks[check_key(job.result, self.selected_mc_version)] = job.result
+            # 확인 중에 활성화/비활성화했을 수 있으므로 파일 상태는 현재 행의 것을 유지
+            record = ModRecord(job.result, file=current["file"], enabled=current.get("enabled", True))
+            self.table_model.replace_mod(key, record)
+        elif job.state == CANCELLED and current.get("stale"):
+            pass  # 다시 확인하지 못했으면 지난 결과를 오래된 표시 그대로 둠
+        else:
+            record = ModRecord(current)
+            record.pop("stale", None)
+            record["status"] = CANCELLED_STATUS if job.state == CANCELLED else f"확인 오류: {job.error}"
+            self.table_model.replace_mod(key, record)
+        if self._advance_activity(ACTIVITY_CHECK):
+            # 취소된 확인도 결과가 오므로 모든 확인 결과가 도착하면 여기로 옴
+            if not job.cancel.cancelled:
+                # 모두 확인했으므로 다음 새로고침은 처음부터 확인
+                self._known_checks = {}
+                self._save_snapshot()
+                self._start_prefetch(self.mods)
+
+    def _save_snapshot(self):
+        """현재 목록을 다음 실행 때 바로 보여줄 수 있도록 저장합니다. (디스크 작업으로 실행)"""
+        if not self._mods_dir or not self.mods:
+            return
+        mods = [ModRecord(mod) for mod in self.mods]
+        mods_dir, mc_version = self._mods_dir, self.selected_mc_version
+        self.scheduler.submit(Job(JOB_SCAN, lambda cancel: save_snapshot(mods_dir, mc_version, mods), name="목록 저장"))
+
+    def _start_prefetch(self, mods: list):
+        """업데이트 가능한 모드의 새 파일을 낮은 우선순위로 미리 받기 시작합니다."""
+        if not is_prefetch_enabled():
+            return
+        self._stop_prefetch()
+        from gui.prefetch_worker import PrefetchWorker
+        self.prefetch_worker = PrefetchWorker(mods)
+        if not self.prefetch_worker.mods:
+            self.prefetch_worker = None
+            return
+        self.prefetch_worker.start(QThread.LowestPriority)
+
+    def _stop_prefetch(self):
+        """진행 중인 미리 받기를 중단합니다. 받다 만 파일은 버려집니다."""
+        if self.prefetch_worker and self.prefetch_worker.isRunning():
+            self.prefetch_worker.stop()
+            self.prefetch_worker.wait()
+        self.prefetch_worker = None
 
     def update_selected_mods(self):
-        selected_rows = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0).layout().itemAt(0).widget()
-            if checkbox.isChecked():
-                selected_rows.append(row)
-        if not selected_rows:
+        selected_mods = self.table_model.checked_mods()
+        if not selected_mods:
             QMessageBox.warning(self, "경고", "업데이트할 모드를 선택하세요.")
             return
         
         mods_to_update = []
-        for row in selected_rows:
-            mod = self.mods[row]
-            if mod.get("status") == "업데이트 가능":
+        for mod in selected_mods:
+            # 지난 실행의 결과(오래된 행)는 다시 확인된 뒤에만 업데이트
+            if mod.get("status") == "업데이트 가능" and not mod.get("stale") and mod_key(mod) not in self._busy_keys:
                 mods_to_update.append(mod)
 
         if not mods_to_update:
@@ -470,36 +699,23 @@ class MainWindow(QWidget):
         reply = QMessageBox.question(self, "업데이트 확인", f"{mod_names} 모드를 업데이트하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            if self.update_worker and self.update_worker.isRunning():
-                return
-            
-            self.refresh_btn.setEnabled(False)
-            self.update_btn.setEnabled(False)
-            self.optimize_btn.setEnabled(False) # Disable optimize button during update
-
-            self.update_worker = UpdateWorker(mods_to_update)
-            self.update_worker.progress.connect(self._on_progress)
-            self.update_worker.message.connect(self._on_message)
-            self.update_worker.eta.connect(self._on_eta)
-            self.update_worker.finished.connect(self._on_update_finished)
-            self.update_worker.error.connect(self._on_worker_error)
-            self.update_worker.start()
-            self.show_loading(f"{len(mods_to_update)}개 모드 업데이트 중...")
+            # 미리 받기와 같은 파일을 동시에 받지 않도록 먼저 중단
+            self._stop_prefetch()
+            self._run_batch(
+                "업데이트", mods_to_update,
+                lambda group: update_jobs(mods_to_update, self._mods_dir, group),
+                "모드 업데이트가 완료되었습니다."
+            )
 
     def _optimize_selected_mods(self):
-        selected_rows = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0).layout().itemAt(0).widget()
-            if checkbox.isChecked():
-                selected_rows.append(row)
-        if not selected_rows:
+        selected_mods = self.table_model.checked_mods()
+        if not selected_mods:
             QMessageBox.warning(self, "경고", "최적화할 모드를 선택하세요.")
             return
         
         mods_to_optimize = []
-        for row in selected_rows:
-            mod = self.mods[row]
-            if "버전 높음" in mod.get("status", ""): # Check for "버전 높음" status
+        for mod in selected_mods:
+            if "버전 높음" in mod.get("status", "") and not mod.get("stale") and mod_key(mod) not in self._busy_keys: # Check for "버전 높음" status
                 mods_to_optimize.append(mod)
 
         if not mods_to_optimize:
@@ -510,54 +726,128 @@ class MainWindow(QWidget):
         reply = QMessageBox.question(self, "버전 최적화 확인", f"{mod_names} 모드의 버전을 현재 마인크래프트 버전({self.selected_mc_version})에 맞게 최적화하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            if self.optimize_worker and self.optimize_worker.isRunning():
-                QMessageBox.warning(self, "경고", "이미 모드 최적화 작업이 진행 중입니다.")
-                return
-            
-            self.refresh_btn.setEnabled(False)
-            self.update_btn.setEnabled(False)
-            self.optimize_btn.setEnabled(False)
+            self._stop_prefetch()
+            self._run_batch(
+                "버전 최적화", mods_to_optimize,
+                lambda group: optimize_jobs(mods_to_optimize, self.selected_mc_version, self._mods_dir, group),
+                "모드 버전 최적화가 완료되었습니다."
+            )
+
+    def _run_batch(self, title: str, mods: list, build_jobs, done_message: str):
+        """
+        업데이트/최적화 작업 묶음을 제출합니다. 업데이트 확인이나 다른 묶음과 함께 진행되며,
+        진행 중인 모드는 다시 선택해도 건너뜁니다.
+        :param build_jobs: 그룹 이름을 받아 (작업 목록, 교체 작업)을 만드는 함수 (core.mod_jobs)
+        """
+        batch = next(self._batch_ids)
+        jobs, swap = build_jobs(f"batch-{batch}")
+        keys = {mod_key(mod) for mod in mods}
+        self._busy_keys |= keys
+        # 교체 중에 폴더를 다시 스캔하지 않도록 새로고침만 막음
+        self.refresh_btn.setEnabled(False)
+
+        activity = f"{title} #{batch}"
+        self._begin_activity(activity, len(mods))
+        for job in jobs:
+            self.jobs.submit(job, (lambda job: self._advance_activity(activity)) if job.kind == JOB_DOWNLOAD else None)
+        self.jobs.submit(swap, lambda job: self._on_batch_finished(job, title, activity, keys, done_message))
+
+    def _on_batch_finished(self, job, title: str, activity: str, keys: set, done_message: str):
+        self._end_activity(activity)
+        self._busy_keys -= keys
+        if not self._busy_keys:
+            self.refresh_btn.setEnabled(True)
+
+        if job.state == CANCELLED:
+            QMessageBox.information(self, "취소", f"{title} 작업이 취소되었습니다.\n이미 받은 파일은 다음 업데이트에서 재사용됩니다.")
+            return
+        if job.state != DONE:
+            self._on_worker_error(f"{title} 중 오류: {job.error}")
+            return
 
-            self.optimize_worker = OptimizeWorker(mods_to_optimize, self.selected_mc_version)
-            self.optimize_worker.progress.connect(self._on_progress)
-            self.optimize_worker.message.connect(self._on_message)
-            self.optimize_worker.eta.connect(self._on_eta)
-            self.optimize_worker.finished.connect(self._on_optimize_finished)
-            self.optimize_worker.error.connect(self._on_worker_error)
-            self.optimize_worker.start()
-            self.show_loading(f"{len(mods_to_optimize)}개 모드 버전 최적화 중...")
+        # 바뀐 행만 갱신하므로 폴더를 다시 스캔하지 않음
+        for old_file, record in job.result["applied"]:
+            self._on_mod_updated(old_file, record)
+        if job.result["applied"]:
+            self._save_snapshot()
+        failures = job.result["failures"]
+        if failures:
+            text = "\n".join(f"- {name}: {error}" for name, error in failures[:10])
+            QMessageBox.warning(self, "일부 실패", f"{done_message}\n\n실패: {len(failures)}개\n{text}\n\n오류 제보: https://discord.gg/FzS6sPsr")
+        else:
+            QMessageBox.information(self, "완료", done_message)
+
+    def closeEvent(self, event):
+        if self._profiler is not None:
+            # 멈추지 않고 닫았으면 보고서만 남김
+            self._profiler.stop()
+            try:
+                print(f"프로파일 저장: {self._profiler.write_report()}")
+            except OSError as e:
+                print(f"프로파일 저장 실패: {e}")
+        # 진행 중인 요청을 끊고 작업 스레드를 멈춤 (교체가 진행 중이면 저널이 다음 실행에서 마무리)
+        self._stop_prefetch()
+        self.scheduler.shutdown(wait=False)
+        super().closeEvent(event)
+
+    def _export_mrpack(self):
+        mods = getattr(self, "mods", None)
+        if not mods:
+            QMessageBox.warning(self, "경고", "내보낼 모드가 없습니다.")
+            return
+        out_path, _ = QFileDialog.getSaveFileName(self, "모드팩 저장", str(Path.home() / "modpack.mrpack"), "Modrinth 모드팩 (*.mrpack)")
+        if not out_path:
+            return
 
+        from gui.mrpack_worker import MrpackExportWorker
+        self.mrpack_worker = MrpackExportWorker(mods, self._mods_dir, Path(out_path), self.selected_mc_version)
+        self.mrpack_worker.snapshot.connect(self._on_snapshot)
+        self.mrpack_worker.finished.connect(self._on_export_finished)
+        self.mrpack_worker.error.connect(self._on_worker_error)
+        self.mrpack_worker.start()
+        self.show_loading("모드팩 내보내는 중...")
 
-    def _on_update_finished(self):
+    def _on_export_finished(self, result: dict):
         if self.loading:
-            fade_out = QPropertyAnimation(self.loading, b"windowOpacity", self.loading)
-            fade_out.setStartValue(1.0)
-            fade_out.setEndValue(0.0)
-            fade_out.setDuration(300)
-            fade_out.finished.connect(self.loading.close)
-            fade_out.finished.connect(self.activateWindow)
-            fade_out.start()
-        
-        self.refresh_btn.setEnabled(True)
-        self.update_btn.setEnabled(True)
-        self.optimize_btn.setEnabled(True) # Re-enable optimize button
-        QMessageBox.information(self, "완료", "모드 업데이트가 완료되었습니다.")
-        self.load_mods()
-        self.update_worker = None
+            self.loading.close()
+        QMessageBox.information(
+            self, "완료",
+            f"모드팩을 내보냈습니다.\n\nModrinth 링크: {result['linked']}개\n직접 포함: {result['embedded']}개"
+        )
+        self.mrpack_worker = None
+
+    def _import_mrpack(self):
+        pack_path, _ = QFileDialog.getOpenFileName(self, "모드팩 선택", str(Path.home()), "Modrinth 모드팩 (*.mrpack)")
+        if not pack_path:
+            return
+        self._stop_prefetch()
+
+        self.refresh_btn.setEnabled(False)
+        self.update_btn.setEnabled(False)
+        self.optimize_btn.setEnabled(False)
+
+        from gui.mrpack_worker import MrpackImportWorker
+        self.mrpack_worker = MrpackImportWorker(Path(pack_path), self._mods_dir or get_mods_dir())
+        self.mrpack_worker.snapshot.connect(self._on_snapshot)
+        self.mrpack_worker.finished.connect(self._on_import_finished)
+        self.mrpack_worker.error.connect(self._on_worker_error)
+        self.mrpack_worker.start()
+        self.show_loading("모드팩 설치 중...")
 
-    def _on_optimize_finished(self):
+    def _on_import_finished(self, result: dict):
         if self.loading:
-            fade_out = QPropertyAnimation(self.loading, b"windowOpacity", self.loading)
-            fade_out.setStartValue(1.0)
-            fade_out.setEndValue(0.0)
-            fade_out.setDuration(300)
-            fade_out.finished.connect(self.loading.close)
-            fade_out.finished.connect(self.activateWindow)
-            fade_out.start()
-        
+            self.loading.close()
         self.refresh_btn.setEnabled(True)
         self.update_btn.setEnabled(True)
         self.optimize_btn.setEnabled(True)
-        QMessageBox.information(self, "완료", "모드 버전 최적화가 완료되었습니다.")
-        self.load_mods()
-        self.optimize_worker = None
\ No newline at end of file
+
+        text = f"설치: {result['installed']}개\n이미 있음: {result['skipped']}개"
+        if result["failed"]:
+            failed = "\n".join(f"- {path}: {err}" for path, err in result["failed"][:10])
+            text += f"\n실패: {len(result['failed'])}개\n{failed}"
+        mc_version = result["dependencies"].get("minecraft")
+        if mc_version and mc_version not in self.selected_mc_version:
+            text += f"\n\n이 모드팩은 마인크래프트 {mc_version}용입니다."
+        QMessageBox.information(self, "모드팩 가져오기 완료", text)
+        self.mrpack_worker = None
+        self._reload_mods()
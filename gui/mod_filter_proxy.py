@@ -0,0 +1,95 @@
+from PySide6.QtCore import Qt, QSortFilterProxyModel
+
+from core.mod_index import ModIndex, FACET_ALL
+from gui.mod_table_model import SORT_ROLE
+
+
+class ModFilterProxyModel(QSortFilterProxyModel):
+    """
+    ModTableModel 위에서 검색/필터/정렬을 담당합니다.
+
+    행마다 문자열을 다시 만들지 않도록 ModIndex로 검색 결과(원본 행 번호 집합)를 미리 구해두고,
+    filterAcceptsRow()는 집합 조회만 합니다. 원본의 행이 바뀌면 그 행만 인덱스에서 다시 계산합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mod_index = ModIndex()
+        self._query = ""
+        self._facet = FACET_ALL
+        self._accepted = None  # None이면 모든 행 표시
+        self.setSortRole(SORT_ROLE)
+        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+        # 원본 dataChanged마다 다시 필터링/정렬하지 않음 (필요한 행만 직접 처리)
+        self.setDynamicSortFilter(False)
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            old.modelReset.disconnect(self._on_source_reset)
+            old.dataChanged.disconnect(self._on_source_data_changed)
+        super().setSourceModel(model)
+        model.modelReset.connect(self._on_source_reset)
+        model.dataChanged.connect(self._on_source_data_changed)
+        self._on_source_reset()
+
+    # --- 검색 조건 ---
+    def set_query(self, query: str):
+        if query == self._query:
+            return
+        self._query = query
+        self._refilter()
+
+    def set_facet(self, facet: str):
+        if facet == self._facet:
+            return
+        self._facet = facet
+        self._refilter()
+
+    def is_filtered(self) -> bool:
+        return self._accepted is not None
+
+    def source_row(self, proxy_row: int) -> int:
+        """화면(정렬/필터 적용)의 행 번호를 원본 모델의 행 번호로 바꿉니다."""
+        return self.mapToSource(self.index(proxy_row, 0)).row()
+
+    def visible_source_rows(self) -> list:
+        """현재 보이는 행들의 원본 행 번호."""
+        if self._accepted is None:
+            return list(range(self.sourceModel().rowCount()))
+        return sorted(self._accepted)
+
+    # --- 내부 ---
+    def _refilter(self):
+        if not self._query.strip() and self._facet == FACET_ALL:
+            self._accepted = None
+        else:
+            self._accepted = set(self.mod_index.search(self._query, self._facet))
+        self.invalidateRowsFilter()
+
+    def _on_source_reset(self):
+        self.mod_index.rebuild(self.sourceModel().mods())
+        self._refilter()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        # 체크 상태만 바뀐 경우는 검색 결과에 영향 없음
+        if roles and all(role == Qt.CheckStateRole for role in roles):
+            return
+        model = self.sourceModel()
+        changed = False
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.mod_index.update_row(row, model.mod_at(row))
+            if self._accepted is None:
+                continue
+            matches = self.mod_index.matches(row, self._query, self._facet)
+            if matches != (row in self._accepted):
+                changed = True
+                if matches:
+                    self._accepted.add(row)
+                else:
+                    self._accepted.discard(row)
+        if changed:
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._accepted is None or source_row in self._accepted
@@ -0,0 +1,223 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont
+
+COL_CHECK, COL_FILE, COL_LOADERS, COL_MC_VERSION, COL_STATUS = range(5)
+HEADERS = ["선택", "파일", "로더", "MC 버전", "상태"]
+
+DISABLED_COLOR = QColor("#808080") # 회색
+
+# 지난 실행의 결과를 다시 확인하는 중인 행 (기울임꼴 + 상태 뒤에 표시)
+STALE_SUFFIX = " (이전 결과)"
+
+# 정렬용 키를 돌려주는 역할 (대소문자 구분 없는 문자열, 체크 열은 0/1)
+SORT_ROLE = Qt.UserRole + 1
+
+# 상태별 색상 (QColor는 한 번만 만들어 모든 행이 공유)
+_STATUS_COLORS = {
+    "update": QColor("#f1c40f"),
+    "ok": QColor("#2ecc71"),
+    "higher": QColor("#3498db"),
+    "warning": QColor("#e67e22"),
+    "error": QColor("#e74c3c"),
+    "other": QColor("#95a5a6"),
+}
+
+
+def status_color(status: str) -> QColor:
+    """상태 문자열에 맞는 색상을 반환합니다."""
+    if status == "업데이트 가능": return _STATUS_COLORS["update"]
+    if status in ["최신 버전", "Modrinth 확인됨", "캐시됨"]: return _STATUS_COLORS["ok"]
+    if "버전 높음" in status: return _STATUS_COLORS["higher"]
+    if status in ["프로젝트 못찾음", "호환 버전 없음", "API 요청 실패", "API 응답 오류"]: return _STATUS_COLORS["warning"]
+    if "오류" in status or "실패" in status: return _STATUS_COLORS["error"]
+    return _STATUS_COLORS["other"]
+
+
+def mod_key(mod_or_file) -> str:
+    """
+    행을 찾는 키. 활성화/비활성화로 바뀌는 '.disabled' 접미사를 뗀 파일 이름입니다.
+    """
+    file = mod_or_file if isinstance(mod_or_file, str) else mod_or_file.get("file", "")
+    if file.endswith(".disabled"):
+        file = file[:-len(".disabled")]
+    return file
+
+
+class ModTableModel(QAbstractTableModel):
+    """
+    메인 모드 테이블의 모델. 행마다 위젯을 만들지 않고 뷰가 보이는 셀만 data()로 요청하므로
+    수천 개의 모드도 즉시 채워집니다.
+
+    행은 파일 키(mod_key)로 찾을 수 있어서, 작업이 끝난 모드만 replace_mod()로 바꾸면
+    해당 행만 다시 그려집니다. 체크 상태도 키 집합으로 관리합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mods = []
+        self._row_by_key = {}
+        self._checked = set()
+        self._stale_font = QFont()
+        self._stale_font.setItalic(True)
+
+    # --- 데이터 설정 ---
+    def set_mods(self, mods: list):
+        self.beginResetModel()
+        self._mods = mods
+        self._row_by_key = {mod_key(mod): row for row, mod in enumerate(mods)}
+        self._checked = set()
+        self.endResetModel()
+
+    def mods(self) -> list:
+        return self._mods
+
+    def mod_at(self, row: int) -> dict:
+        return self._mods[row]
+
+    def row_for(self, key: str) -> int | None:
+        return self._row_by_key.get(key)
+
+    def _emit_row_changed(self, row: int):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(HEADERS) - 1))
+
+    def refresh_row(self, row: int):
+        """한 행의 표시를 갱신합니다. 비활성화된 모드는 체크가 풀립니다."""
+        if not self._mods[row].get("enabled", True):
+            self._checked.discard(mod_key(self._mods[row]))
+        self._emit_row_changed(row)
+
+    def replace_mod(self, key: str, mod: dict) -> bool:
+        """
+        key 행의 모드 정보를 mod로 바꾸고 그 행만 갱신합니다. (업데이트로 파일 이름이 바뀌어도 됨)
+        작업이 끝난 모드는 체크가 풀립니다.
+        :return: 해당 행이 있었으면 True
+        """
+        row = self._row_by_key.pop(key, None)
+        if row is None:
+            return False
+        self._checked.discard(key)
+        # MainWindow.mods와 같은 리스트이므로 제자리에서 교체
+        self._mods[row] = mod
+        self._row_by_key[mod_key(mod)] = row
+        self._emit_row_changed(row)
+        return True
+
+    def set_checked_rows(self, rows, checked: bool = True):
+        """
+        여러 행의 체크 상태를 한 번에 바꿉니다. 비활성화된 모드는 건너뜁니다.
+        행마다 시그널을 보내지 않고 체크 열 전체에 대해 한 번만 갱신합니다.
+        """
+        for row in rows:
+            mod = self._mods[row]
+            if not mod.get("enabled", True):
+                continue
+            if checked:
+                self._checked.add(mod_key(mod))
+            else:
+                self._checked.discard(mod_key(mod))
+        if self._mods:
+            self.dataChanged.emit(self.index(0, COL_CHECK), self.index(len(self._mods) - 1, COL_CHECK), [Qt.CheckStateRole])
+
+    def checked_mods(self) -> list:
+        """체크된 모드 목록 (선택된 수에 비례하는 시간)."""
+        rows = sorted(self._row_by_key[key] for key in self._checked)
+        return [self._mods[row] for row in rows]
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._mods)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        mod = self._mods[index.row()]
+        if index.column() == COL_CHECK:
+            if not mod.get("enabled", True):
+                return Qt.NoItemFlags
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        mod = self._mods[row]
+        is_enabled = mod.get("enabled", True)
+
+        if role == Qt.DisplayRole:
+            if col == COL_FILE:
+                return mod.get("file", "")
+            if col == COL_LOADERS:
+                return ", ".join(mod.get("loaders", []))
+            if col == COL_MC_VERSION:
+                return mod.get("mc_version", "-")
+            if col == COL_STATUS:
+                if not is_enabled:
+                    return "비활성화됨"
+                return mod.get("status", "") + (STALE_SUFFIX if mod.get("stale") else "")
+            return None
+
+        if role == SORT_ROLE:
+            if col == COL_CHECK:
+                return 1 if mod_key(mod) in self._checked else 0
+            if col == COL_FILE:
+                return mod.get("file", "").casefold()
+            if col == COL_LOADERS:
+                return ", ".join(mod.get("loaders", [])).casefold()
+            if col == COL_MC_VERSION:
+                return mod.get("mc_version", "-")
+            if col == COL_STATUS:
+                return mod.get("status", "") if is_enabled else "비활성화됨"
+            return None
+
+        if role == Qt.CheckStateRole and col == COL_CHECK:
+            return Qt.Checked if mod_key(mod) in self._checked else Qt.Unchecked
+
+        if role == Qt.ForegroundRole:
+            if not is_enabled and col != COL_CHECK:
+                return DISABLED_COLOR
+            if col == COL_STATUS:
+                return status_color(mod.get("status", ""))
+            return None
+
+        if role == Qt.FontRole and mod.get("stale") and col != COL_CHECK:
+            return self._stale_font
+
+        if role == Qt.ToolTipRole:
+            if col == COL_MC_VERSION:
+                all_mc_versions = mod.get("all_mc_versions", [])
+                if all_mc_versions:
+                    return "이 프로젝트가 지원하는 모든 버전:\n\n" + ", ".join(all_mc_versions)
+            if col == COL_STATUS:
+                status = mod.get("status", "")
+                if mod.get("stale"):
+                    return f"지난 실행의 결과입니다: {status}\n다시 확인하는 중입니다."
+                return status if is_enabled else f"원래 상태: {status}"
+            return None
+
+        if role == Qt.TextAlignmentRole and col in (COL_CHECK, COL_STATUS):
+            return int(Qt.AlignCenter)
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != COL_CHECK:
+            return False
+        mod = self._mods[index.row()]
+        if not mod.get("enabled", True):
+            return False
+        # PySide6는 체크 상태를 int 또는 Qt.CheckState로 넘겨줌
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(mod_key(mod))
+        else:
+            self._checked.discard(mod_key(mod))
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
@@ -0,0 +1,65 @@
+from PySide6.QtCore import QThread, Signal
+from pathlib import Path
+
+from core.mrpack import export_mrpack, import_mrpack
+from core.progress import ProgressReporter
+from core.cancel import CancelToken
+
+class MrpackExportWorker(QThread):
+    snapshot = Signal(dict) # core.progress.ProgressReporter 스냅샷
+    finished = Signal(dict)
+    error = Signal(str)
+
+    def __init__(self, mods: list, mods_dir: Path, out_path: Path, mc_version_name: str):
+        super().__init__()
+        self.mods = mods
+        self.mods_dir = mods_dir
+        self.out_path = out_path
+        self.mc_version_name = mc_version_name
+
+    def run(self):
+        ProgressReporter(self.snapshot.emit).flush("파일 해시 계산 및 Modrinth 조회 중...")
+        try:
+            result = export_mrpack(self.mods, self.mods_dir, self.out_path, self.mc_version_name)
+        except Exception as e:
+            self.error.emit(f"모드팩 내보내기 실패: {e}")
+            return
+        self.finished.emit(result)
+
+
+class MrpackImportWorker(QThread):
+    snapshot = Signal(dict) # core.progress.ProgressReporter 스냅샷
+    finished = Signal(dict)
+    error = Signal(str)
+
+    def __init__(self, pack_path: Path, mods_dir: Path):
+        super().__init__()
+        self.pack_path = pack_path
+        self.mods_dir = mods_dir
+        self.is_running = True
+        self.cancel_token = CancelToken()
+
+    def run(self):
+        reporter = ProgressReporter(self.snapshot.emit)
+        reporter.begin(0, "모드팩을 읽는 중...")
+
+        def on_progress(done, total, name):
+            reporter.set_total(total)
+            reporter.item_done(f"({done}/{total}) {name} 다운로드 완료")
+
+        try:
+            result = import_mrpack(self.pack_path, self.mods_dir, on_progress, lambda: self.is_running, self.cancel_token)
+        except Exception as e:
+            self.error.emit(f"모드팩 가져오기 실패: {e}")
+            return
+        reporter.flush("모드팩 설치 완료")
+        self.finished.emit(result)
+
+    def cancel(self):
+        """남은 다운로드를 중단합니다. 받고 있던 연결도 바로 끊깁니다."""
+        self.is_running = False
+        self.cancel_token.cancel()
+
+    def quit(self):
+        self.cancel()
+        super().quit()
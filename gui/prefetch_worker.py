@@ -0,0 +1,40 @@
+from PySide6.QtCore import QThread, Signal
+
+from core.net import PRIORITY_PREFETCH
+from core.staging import stage_download, is_staged, clear_staging
+from core.cancel import CancelToken
+
+class PrefetchWorker(QThread):
+    """업데이트 확인이 끝난 뒤 '업데이트 가능' 모드의 새 파일을 백그라운드에서 미리 받아둡니다."""
+    staged = Signal(str) # 미리 받기가 끝난 모드의 파일 이름
+    finished = Signal()
+
+    def __init__(self, mods: list):
+        super().__init__()
+        self.mods = [m for m in mods if m.get("status") == "업데이트 가능" and m.get("download_url")]
+        self.is_running = True
+        self.cancel_token = CancelToken()
+
+    def run(self):
+        # 더 이상 필요 없는 이전 미리 받기 파일 정리
+        clear_staging(self.mods)
+        for mod in self.mods:
+            if not self.is_running:
+                break
+            if is_staged(mod):
+                self.staged.emit(mod["file"])
+                continue
+            try:
+                # 대역폭 제한과 양보는 core.net의 미리 받기(prefetch) 클래스에서 처리
+                path = stage_download(mod, PRIORITY_PREFETCH, lambda: self.is_running, self.cancel_token)
+                if path:
+                    self.staged.emit(mod["file"])
+            except Exception as e:
+                # 미리 받기는 실패해도 업데이트 시 다시 받으면 되므로 기록만 남김
+                print(f"미리 받기 실패: {mod['mod_name']}: {e}")
+        self.finished.emit()
+
+    def stop(self):
+        # 청크 사이 확인을 기다리지 않고 받고 있던 연결도 끊음
+        self.is_running = False
+        self.cancel_token.cancel()
@@ -0,0 +1,137 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QTextEdit,
+    QPushButton, QLabel, QMessageBox, QAbstractItemView
+)
+from PySide6.QtCore import Qt, QThread, Signal
+from pathlib import Path
+
+from core.lockfile import (
+    list_lockfiles, load_lockfile, diff_folder, diff_lockfiles, format_diff,
+    is_empty_diff, restore_lockfile, LockfileError
+)
+
+
+class RestoreWorker(QThread):
+    finished = Signal(dict)
+    error = Signal(str)
+
+    def __init__(self, lock: dict, mods_dir: Path):
+        super().__init__()
+        self.lock = lock
+        self.mods_dir = mods_dir
+
+    def run(self):
+        try:
+            self.finished.emit(restore_lockfile(self.lock, self.mods_dir))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class SnapshotDialog(QDialog):
+    """모드 폴더 스냅샷(락파일) 목록을 보여주고 비교/복원합니다."""
+
+    def __init__(self, mods_dir: Path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("모드 폴더 스냅샷")
+        self.resize(800, 500)
+        self.mods_dir = mods_dir
+        self.restore_worker = None
+
+        self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.list_widget.itemSelectionChanged.connect(self._show_diff)
+
+        self.hint_label = QLabel("스냅샷 하나를 고르면 현재 폴더와, 두 개를 고르면 서로 비교합니다.")
+        self.diff_view = QTextEdit()
+        self.diff_view.setReadOnly(True)
+
+        self.restore_btn = QPushButton("선택한 스냅샷으로 복원")
+        self.restore_btn.clicked.connect(self._restore)
+        self.close_btn = QPushButton("닫기")
+        self.close_btn.setObjectName("closeButton")
+        self.close_btn.clicked.connect(self.reject)
+
+        body = QHBoxLayout()
+        body.addWidget(self.list_widget, 1)
+        body.addWidget(self.diff_view, 2)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.restore_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.close_btn)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+        layout.addWidget(self.hint_label)
+        layout.addLayout(body)
+        layout.addLayout(buttons)
+
+        self._load_list()
+
+    def _load_list(self):
+        self.list_widget.clear()
+        for path in list_lockfiles(self.mods_dir):
+            try:
+                lock = load_lockfile(path)
+            except LockfileError:
+                continue
+            item = QListWidgetItem(f"{lock['created'].replace('T', ' ')}  ({len(lock['entries'])}개)")
+            item.setData(Qt.UserRole, lock)
+            self.list_widget.addItem(item)
+        if self.list_widget.count() == 0:
+            self.diff_view.setPlainText("저장된 스냅샷이 없습니다. 모드 목록을 새로고침하면 만들어집니다.")
+            self.restore_btn.setEnabled(False)
+
+    def _selected_locks(self) -> list:
+        # 목록이 최신순이므로 행 번호가 큰 쪽이 더 오래된 스냅샷
+        rows = sorted((self.list_widget.row(item) for item in self.list_widget.selectedItems()), reverse=True)
+        return [self.list_widget.item(row).data(Qt.UserRole) for row in rows]
+
+    def _show_diff(self):
+        locks = self._selected_locks()
+        self.restore_btn.setEnabled(len(locks) == 1)
+        if not locks:
+            self.diff_view.clear()
+            return
+        if len(locks) == 1:
+            diff = diff_folder(locks[0], self.mods_dir)
+            title = "스냅샷 -> 현재 폴더"
+        else:
+            diff = diff_lockfiles(locks[0], locks[-1])
+            title = "이전 스냅샷 -> 이후 스냅샷"
+        if is_empty_diff(diff):
+            self.diff_view.setPlainText(f"{title}\n\n차이가 없습니다.")
+        else:
+            self.diff_view.setPlainText(f"{title}\n\n" + "\n".join(format_diff(diff)))
+
+    def _restore(self):
+        locks = self._selected_locks()
+        if len(locks) != 1:
+            return
+        reply = QMessageBox.question(
+            self, "복원 확인",
+            f"모드 폴더를 {locks[0]['created'].replace('T', ' ')} 상태로 되돌리시겠습니까?\n"
+            "스냅샷에 없는 모드는 .bak 파일로 옮겨집니다.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        self.restore_btn.setEnabled(False)
+        self.diff_view.setPlainText("복원 중...")
+        self.restore_worker = RestoreWorker(locks[0], self.mods_dir)
+        self.restore_worker.finished.connect(self._on_restored)
+        self.restore_worker.error.connect(self._on_restore_error)
+        self.restore_worker.start()
+
+    def _on_restored(self, result: dict):
+        text = f"복원 완료\n\n배치: {result['placed']}개\n제거(.bak): {result['removed']}개\n그대로: {result['unchanged']}개"
+        if result["missing"]:
+            text += "\n\n찾을 수 없는 파일:\n" + "\n".join(result["missing"])
+        QMessageBox.information(self, "복원 완료", text)
+        self.accept()
+
+    def _on_restore_error(self, message: str):
+        QMessageBox.critical(self, "오류", f"복원에 실패했습니다:\n{message}")
+        self.restore_btn.setEnabled(True)
@@ -4,15 +4,20 @@ import os
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QFontDatabase
 
-from gui.main_window import MainWindow
-from gui.version_dialog import VersionSelectionDialog
+# 메인 윈도우/버전 선택 창은 필요해진 시점에 가져옴 (첫 화면 표시 시간 단축)
 from gui.style import apply_global_style
 from core.config import load_selected_version, save_selected_version
+from core.update_mod import recover_interrupted_update
 
 def main():
     """Application entry point."""
     app = QApplication(sys.argv)
 
+    # 이전 실행에서 중단된 일괄 업데이트가 있으면 먼저 마무리
+    recovered = recover_interrupted_update()
+    if recovered:
+        print(f"중단된 업데이트 {len(recovered)}건을 복구했습니다.")
+
     # 폰트 로드 및 동적 폰트 이름 설정
     font_name = "Arial"  # 기본 대체 폰트
     font_path = os.path.join(os.path.dirname(__file__), 'gui', 'font', 'PretendardVariable.ttf')
@@ -33,7 +38,16 @@ def main():
     apply_global_style(app, font_name)
     selected_version = load_selected_version()
     
+    scheduler = None
+    prewarm = None
     if not selected_version:
+        # 버전을 고르는 동안 대상 버전과 무관한 스캔/분석/버전 목록 받기를 미리 진행
+        from core.scheduler import JobScheduler
+        from core.mod_jobs import start_prewarm
+        scheduler = JobScheduler()
+        prewarm = start_prewarm(scheduler)
+
+        from gui.version_dialog import VersionSelectionDialog
         selected_version = VersionSelectionDialog.get_selected_version()
 
         if selected_version:
@@ -45,7 +59,8 @@ def main():
 
     # --- 메인 윈도우 실행 ---
     # 선택된 버전 정보를 MainWindow에 전달
-    window = MainWindow(selected_mc_version=selected_version)
+    from gui.main_window import MainWindow
+    window = MainWindow(selected_mc_version=selected_version, scheduler=scheduler, prewarm=prewarm)
     
     sys.exit(app.exec())
 